@@ -0,0 +1,199 @@
+"""
+Benchmark classifying and rendering a fixed corpus of classes
+
+Each phase is timed across the whole corpus, keeping the fastest of several
+rounds, then run once more under tracemalloc to measure the memory it
+allocates (and keeps) and its peak memory use.
+
+    python -m benchmarks                  # compare against baseline.json
+    python -m benchmarks --save           # record a new baseline
+    python -m benchmarks --threshold 0.1  # fail on a 10% regression
+
+Timings are only comparable on the same machine.  The committed baseline.json
+is a reference, recorded on one machine to show the expected shape of each
+phase, so record your own with --save before making changes, and compare
+against that instead.
+"""
+
+import contextlib
+import io
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable, Iterable
+from pathlib import Path
+
+import click
+from rich.console import Console
+
+from classify import renderers
+from classify.classification import classify, clear_cache
+from classify.django import setup_django
+from classify.logs import configure_logging
+from classify.resolution import resolve
+from classify.source import sources
+
+
+ROOT = Path(__file__).parent.parent
+BASELINE = Path(__file__).parent / "baseline.json"
+
+CORPUS = [
+    # stdlib
+    "argparse.ArgumentParser",
+    "email.message.EmailMessage",
+    "http.server.SimpleHTTPRequestHandler",
+    "json.JSONDecoder",
+    "pathlib.Path",
+    "unittest.TestCase",
+    # the test suite's own fixture
+    "tests.dummy_class.DummyClass",
+    # Django's class based views, and a view from the test project
+    "core.urls.DummyUpdate",
+    "django.views.generic.CreateView",
+    "django.views.generic.DeleteView",
+    "django.views.generic.DetailView",
+    "django.views.generic.FormView",
+    "django.views.generic.ListView",
+    "django.views.generic.RedirectView",
+    "django.views.generic.TemplateView",
+    "django.views.generic.UpdateView",
+    "django.views.generic.dates.ArchiveIndexView",
+    "django.views.generic.dates.DayArchiveView",
+    "django.views.generic.dates.YearArchiveView",
+]
+
+
+def cold_classify(obj):
+    # forget everything the previous round learnt, so each round does the work
+    # a fresh process would
+    clear_cache()
+    sources.clear()
+    return classify(obj)
+
+
+def to_console(structure, console):
+    renderers.to_console(structure, "monokai", console=console)
+
+
+def to_html(structure, output_path):
+    with contextlib.redirect_stdout(io.StringIO()):
+        renderers.to_html(structure, output_path, serve=False, port=0)
+
+
+def measure(func: Callable, items: Iterable, rounds: int) -> dict[str, float]:
+    """Time func over every item, then measure the memory used doing so"""
+    items = list(items)
+
+    times = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for item in items:
+            func(item)
+        times.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    results = [func(item) for item in items]
+    after, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del results
+
+    return {
+        "seconds": min(times),
+        "allocated": after - before,
+        "peak": peak - before,
+    }
+
+
+def run_phases(paths: list[str], rounds: int) -> dict[str, dict[str, float]]:
+    classes = [resolve(path) for path in paths]
+    structures = [classify(obj) for obj in classes]
+    console = Console(file=io.StringIO(), force_terminal=True, width=120)
+
+    with tempfile.TemporaryDirectory(prefix="classify-bench") as directory:
+        return {
+            "resolve": measure(resolve, paths, rounds),
+            "classify": measure(cold_classify, classes, rounds),
+            "to_string": measure(renderers.to_string, structures, rounds),
+            "to_console": measure(lambda s: to_console(s, console), structures, rounds),
+            "to_html": measure(
+                lambda s: to_html(s, Path(directory)), structures, rounds
+            ),
+        }
+
+
+def regressions(results, baseline, threshold: float) -> list[str]:
+    """Describe each measurement more than threshold worse than the baseline"""
+    found = []
+    for phase, measurements in results.items():
+        for name, value in measurements.items():
+            expected = baseline.get(phase, {}).get(name)
+            if not expected or value <= expected * (1 + threshold):
+                continue
+
+            change = (value - expected) / expected
+            found.append(
+                f"{phase} {name}: {expected:.6g} -> {value:.6g} (+{change:.0%})"
+            )
+
+    return found
+
+
+def report(results, baseline) -> None:
+    click.echo(
+        f"{'phase':<12}{'seconds':>12}{'allocated':>14}{'peak':>14}{'vs baseline':>14}"
+    )
+    for phase, m in results.items():
+        expected = baseline.get(phase, {}).get("seconds")
+        change = f"{m['seconds'] / expected - 1:+.1%}" if expected else "-"
+        click.echo(
+            f"{phase:<12}{m['seconds']:>12.4f}"
+            f"{m['allocated'] / 1024:>12.0f}KB{m['peak'] / 1024:>12.0f}KB"
+            f"{change:>14}"
+        )
+
+
+@click.command()
+@click.option("--rounds", default=5, type=click.IntRange(min=1))
+@click.option(
+    "--save",
+    is_flag=True,
+    help="Record these results as the new baseline",
+)
+@click.option(
+    "--threshold",
+    default=0.25,
+    type=click.FloatRange(min=0),
+    help="How much worse than the baseline a measurement can be, eg 0.25 is 25%",
+)
+def run(rounds, save, threshold):
+    sys.path[:0] = [str(ROOT), str(ROOT / "tests" / "django_proj")]
+    setup_django("core.settings")
+    configure_logging(debug=False)
+
+    results = run_phases(CORPUS, rounds)
+    baseline = json.loads(BASELINE.read_text()) if BASELINE.exists() else {}
+
+    report(results, baseline)
+
+    if save:
+        BASELINE.write_text(json.dumps(results, indent=2, sort_keys=True) + "\n")
+        click.echo(f"Wrote: {BASELINE}")
+        return
+
+    if found := regressions(results, baseline, threshold):
+        click.echo(f"\nRegressed by more than {threshold:.0%}:", err=True)
+        for line in found:
+            click.echo(f"  {line}", err=True)
+        click.echo(
+            f"\nTimings only compare on the machine {BASELINE.name} was recorded "
+            "on, record one here with --save before making changes",
+            err=True,
+        )
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    run()
@@ -11,3 +11,10 @@ def tests(session):
 
     session.run("just", "console", *session.posargs, external=True)
     session.run("just", "html", *session.posargs, external=True)
+
+
+@session(python="3.12")
+def bench(session):
+    session.install(".[dev]")
+
+    session.run("python", "-m", "benchmarks", *session.posargs)
@@ -1,6 +1,4 @@
-from .classification import classify
-from .exceptions import NotAClassError
-from .resolution import resolve
+import importlib
 
 
 __all__ = [
@@ -8,3 +6,20 @@ __all__ = [
     "classify",
     "resolve",
 ]
+
+# classification pulls in most of the package's dependencies, so defer importing
+# it until it's used, keeping the CLI's startup (eg --version) fast
+_lazy = {
+    "NotAClassError": "exceptions",
+    "classify": "classification",
+    "resolve": "resolution",
+}
+
+
+def __getattr__(name):
+    if name not in _lazy:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+
+    module = importlib.import_module(f".{_lazy[name]}", __name__)
+    return getattr(module, name)
@@ -0,0 +1,167 @@
+import importlib
+import inspect
+import pkgutil
+import pydoc
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import TextIO
+
+import structlog
+
+from .cache import cached_classify
+from .dataclasses import Class
+from .django import setup_django
+from .exceptions import NotAClassError
+from .logs import configure_logging
+from .resolution import resolve, resolve_many
+
+
+logger = structlog.get_logger()
+
+
+def _classify_path(
+    path: str, cache_dir: Path | None = None, static: bool = False
+) -> Class | str:
+    """Classify the given path, returning the reason it failed if it can't be"""
+    try:
+        if static:
+            from . import static as engine  # noqa: PLC0415
+
+            return engine.classify(engine.resolve(path))
+
+        return cached_classify(resolve(path), cache_dir)
+    except Exception as e:  # noqa: BLE001
+        return _reason(e)
+
+
+def _classify_resolved(
+    resolved: type | Exception, cache_dir: Path | None = None
+) -> Class | str:
+    """Classify the given resolved class, or give the reason it couldn't be"""
+    if isinstance(resolved, Exception):
+        return _reason(resolved)
+
+    try:
+        return cached_classify(resolved, cache_dir)
+    except Exception as e:  # noqa: BLE001
+        return _reason(e)
+
+
+def _reason(error: Exception) -> str:
+    if isinstance(error, NotAClassError):
+        return "not a class"
+
+    return str(error) or type(error).__name__
+
+
+def _setup_worker(django_settings: str | None, debug: bool) -> None:
+    """Prepare a worker process the same way the CLI prepares the parent"""
+    if django_settings:
+        setup_django(django_settings)
+
+    configure_logging(debug)
+
+
+def classify_all(
+    paths: Iterable[str],
+    jobs: int = 1,
+    django_settings: str | None = None,
+    debug: bool = False,
+    cache_dir: Path | None = None,
+    static: bool = False,
+) -> tuple[list[Class], dict[str, str]]:
+    """
+    Classify each of the given dotted paths
+
+    Paths which can't be resolved or classified don't stop the run, instead
+    they're returned, with the reason, alongside the successful structures.
+
+    With more than one job, paths are classified across a pool of processes,
+    each of which sets up Django once, and the structures are sent back to this
+    process.  Structures which can't be pickled (eg an attribute holding a
+    lock) are classified again here instead.
+
+    In a single process, each module is imported once, in the background, while
+    the classes of modules already imported are classified, see resolve_many.
+
+    Given a cache directory, unchanged classes are loaded from there instead of
+    being classified again.  Classifying statically reads classes from source,
+    and doesn't use the cache.
+    """
+    paths = list(paths)
+
+    if static and jobs == 1:
+        results = [_classify_path(path, cache_dir, static) for path in paths]
+    elif jobs == 1:
+        classified = {
+            path: _classify_resolved(resolved, cache_dir)
+            for path, resolved in resolve_many(paths)
+        }
+        results = [classified[path] for path in paths]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=jobs,
+            initializer=_setup_worker,
+            # nothing is imported when classifying statically, so workers
+            # needn't set up Django
+            initargs=(None if static else django_settings, debug),
+        ) as executor:
+            futures = [
+                executor.submit(_classify_path, path, cache_dir, static)
+                for path in paths
+            ]
+
+            results = []
+            for path, future in zip(paths, futures, strict=True):
+                try:
+                    results.append(future.result())
+                except Exception:  # noqa: BLE001
+                    logger.debug("classifying in parent", path=path)
+                    results.append(_classify_path(path, cache_dir, static))
+
+    structures = []
+    failures = {}
+    for path, result in zip(paths, results, strict=True):
+        if isinstance(result, str):
+            failures[path] = result
+        else:
+            structures.append(result)
+
+    return structures, failures
+
+
+def find_classes(package: str) -> list[str]:
+    """
+    Find the dotted path of every class defined in the given package or module
+
+    Packages are walked recursively, and modules which fail to import are
+    logged and skipped so one bad module doesn't stop the whole run.
+    """
+    module = importlib.import_module(package)
+    modules = [module]
+
+    if hasattr(module, "__path__"):
+        for info in pkgutil.walk_packages(
+            module.__path__,
+            prefix=f"{package}.",
+            onerror=lambda name: logger.warning("could not import", module=name),
+        ):
+            try:
+                modules.append(importlib.import_module(info.name))
+            except Exception:  # noqa: BLE001
+                logger.warning("could not import", module=info.name)
+
+    return sorted(
+        f"{m.__name__}.{name}"
+        for m in modules
+        for name, obj in inspect.getmembers(m, inspect.isclass)
+        # only classes defined in this module, skipping those it imports
+        if obj.__module__ == m.__name__ and pydoc.visiblename(name)
+    )
+
+
+def read_paths(file: TextIO) -> list[str]:
+    """Read dotted paths, one per line, ignoring blank lines and comments"""
+    lines = (line.strip() for line in file)
+    return [line for line in lines if line and not line.startswith("#")]
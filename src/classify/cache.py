@@ -0,0 +1,167 @@
+import functools
+import hashlib
+import importlib.metadata
+import inspect
+import json
+import pickle
+import sys
+from pathlib import Path
+
+import structlog
+
+from .classification import classify
+from .dataclasses import Class, Method
+from .profiling import profiler
+
+
+logger = structlog.get_logger()
+
+# bumped whenever the shape of an entry or a pickled Class changes, so entries
+# written by an older checkout of the same version aren't loaded
+FORMAT = 3
+
+
+def cached_classify[C](obj: type[C], cache_dir: Path | None) -> Class:
+    """
+    Classify the given class, via a cache on disk when a directory is given
+
+    Entries are stored per class, alongside a key built from the source files
+    of every class feeding the structure, so editing any of them invalidates
+    the entry and the class is classified again.  Methods can be defined
+    outside of those files (eg helper = helpers.helper), and their source is
+    read back when they're rendered, so the files of every method are checked
+    too.
+    """
+    if cache_dir is None:
+        return classify(obj)
+
+    path = cache_dir / f"{obj.__module__}.{obj.__qualname__}.pickle"
+    key = cache_key(obj)
+
+    try:
+        with path.open("rb") as f:
+            stored_key, files, structure = pickle.load(f)
+    except FileNotFoundError:
+        pass
+    except Exception:  # noqa: BLE001
+        logger.debug("ignoring unreadable cache entry", path=str(path))
+    else:
+        if stored_key == key and is_unchanged(files):
+            profiler.count("cache_hits")
+            return structure
+
+    profiler.count("cache_misses")
+    structure = classify(obj)
+
+    try:
+        data = pickle.dumps((key, method_files(structure), structure))
+    except Exception:  # noqa: BLE001
+        # attribute values can be anything, including things which can't be
+        # pickled, so some classes can't be cached
+        logger.debug("not caching unpicklable class", path=str(path))
+        return structure
+
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    partial = path.with_suffix(".partial")
+    partial.write_bytes(data)
+    partial.replace(path)
+
+    return structure
+
+
+def cache_key[C](obj: type[C]) -> str:
+    """Hash everything which, when it changes, would change obj's structure"""
+    key = {
+        "classify": version(),
+        "files": fingerprint(obj),
+        "format": FORMAT,
+        "path": f"{obj.__module__}.{obj.__qualname__}",
+        "python": list(sys.version_info[:2]),
+    }
+    return hashlib.sha256(json.dumps(key, sort_keys=True).encode()).hexdigest()
+
+
+def fingerprint[C](obj: type[C]) -> dict[str, list[int]]:
+    """
+    The modification time and size of the source file of each class in obj's
+    MRO, and those of its inner classes
+
+    Stat-ing files is much cheaper than hashing them, and an edit changes at
+    least one of the two.
+    """
+    files = {}
+
+    for cls in source_classes(obj):
+        try:
+            file = inspect.getsourcefile(cls)
+        except TypeError:
+            # builtins have no source to change
+            continue
+
+        if file is None or file in files:
+            continue
+
+        files[file] = stamp(file)
+
+    return files
+
+
+def method_files(structure: Class) -> dict[str, list[int]]:
+    """
+    The modification time and size of the source file of every method in the
+    given structure, and in its inner classes
+    """
+    methods = [
+        method
+        for bucket in (structure.methods, structure.properties)
+        for definitions in bucket.values()
+        for method in definitions
+    ]
+    methods.extend(
+        accessor
+        for definitions in structure.data_descriptors.values()
+        for descriptor in definitions
+        for accessor in (descriptor.getter, descriptor.setter, descriptor.deleter)
+        if isinstance(accessor, Method)
+    )
+
+    files = {m.file: stamp(m.file) for m in methods if m.file is not None}
+    for inner in structure.classes:
+        files |= method_files(inner)
+
+    return files
+
+
+def is_unchanged(files: dict[str, list[int]]) -> bool:
+    """Whether each of the given files still has the stamp it was given"""
+    return all(stamp(file) == stamped for file, stamped in files.items())
+
+
+def stamp(file: str) -> list[int]:
+    """The modification time and size of the given file, if it exists"""
+    try:
+        stat = Path(file).stat()
+    except OSError:
+        return []
+
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def source_classes[C](obj: type[C]) -> list[type]:
+    """Every class in obj's MRO, and recursively the MROs of its inner classes"""
+    classes = []
+
+    for cls in inspect.getmro(obj):
+        classes.append(cls)
+
+        prefix = f"{cls.__qualname__}."
+        for value in vars(cls).values():
+            if inspect.isclass(value) and value.__qualname__.startswith(prefix):
+                classes.extend(source_classes(value))
+
+    return classes
+
+
+@functools.cache
+def version() -> str:
+    return importlib.metadata.version("classify")
@@ -1,22 +1,33 @@
 import builtins
 import collections
+import contextlib
 import inspect
 import pydoc
+import types
+import weakref
 
 import structlog
 
-from .dataclasses import Attribute, Class, DataDescriptor, Member, Method, SimpleClass
-from .filters import (
-    is_attribute,
-    is_data_descriptor,
-    is_inner_class,
-    is_method,
-    is_property,
-)
+from .dataclasses import Class, Member, Members, SimpleClass
+from .filters import Bucket, detect_kind, handle
+from .logs import debugging
+from .profiling import profiler
 
 
 logger = structlog.get_logger()
 
+# memoised members are kept on each class itself, so a value which refers back
+# to its class (eg an instance of it) forms a cycle the collector can break,
+# instead of being pinned by a module level cache
+CACHE_ATTRIBUTE = "_classify_members"
+
+# classes which can't be given attributes (eg builtins) live as long as the
+# interpreter, so holding on to them here costs nothing
+_members_cache: weakref.WeakKeyDictionary[type, Members] = weakref.WeakKeyDictionary()
+
+# every class with members memoised on it, so they can all be forgotten
+_memoised: weakref.WeakSet[type] = weakref.WeakSet()
+
 
 def classify[C](obj: type[C]) -> Class:
     # flatten the MRO of the given class and flip the order so it's the first
@@ -31,39 +42,25 @@ def classify[C](obj: type[C]) -> Class:
     methods = collections.defaultdict(list)
     properties = collections.defaultdict(list)
 
-    structlog.contextvars.clear_contextvars()
+    if debugging():
+        structlog.contextvars.clear_contextvars()
+
     for cls in mro:
-        structlog.contextvars.bind_contextvars(**{"class": cls.__name__})
-        members = list(get_members(cls))
-
-        ## ATTRIBUTES
-        class_attrs = [m for m in members if is_attribute(m)]
-        for member in class_attrs:
-            structlog.contextvars.bind_contextvars(member=member)
-            attributes[member.name].append(Attribute.from_member(member))
-
-        ## CLASSES
-        inner_classes = [m for m in members if is_inner_class(m)]
-        classes.extend(classify(c.obj) for c in inner_classes)
-
-        ## METHODS
-        instance_methods = [m for m in members if is_method(m)]
-        for member in instance_methods:
-            structlog.contextvars.bind_contextvars(member=member)
-            methods[member.name].append(Method.from_member(member))
-
-        ## PROPERTIES
-        props = [m for m in members if is_property(m)]
-        for member in props:
-            logger.debug("extracting property", member=member)
-            prop = Method.from_func(member.obj.fget, member.cls)
-            properties[member.name].append(prop)
-
-        ## DATA DESCRIPTORS
-        descriptors = [m for m in members if is_data_descriptor(m)]
-        for member in descriptors:
-            structlog.contextvars.bind_contextvars(member=member)
-            data_descriptors[member.name].append(DataDescriptor.from_member(member))
+        members = classify_members(cls)
+
+        for name, attribute in members.attributes:
+            attributes[name].append(attribute)
+
+        classes.extend(members.classes)
+
+        for name, method in members.methods:
+            methods[name].append(method)
+
+        for name, prop in members.properties:
+            properties[name].append(prop)
+
+        for name, descriptor in members.data_descriptors:
+            data_descriptors[name].append(descriptor)
 
     ancestors = [SimpleClass.from_class(c) for c in mro[:-1]]
 
@@ -81,9 +78,162 @@ def classify[C](obj: type[C]) -> Class:
     )
 
 
+def classify_members[C](cls: type[C]) -> Members:
+    """
+    Classify the members defined directly on the given class
+
+    Every class in an MRO is classified, so shared bases (eg View) would be
+    introspected again for each subclass.  Results are memoised on the class
+    object, so they go when the class does (eg on reload).
+    """
+    members = cached_members(cls)
+    if members is not None:
+        profiler.count("members_cache_hits")
+        return members
+
+    members = get_members(cls)
+    profiler.count("classes")
+    profiler.count("members", len(members))
+
+    # handle each member in a single pass, building its item and picking its
+    # bucket, only paying for logging context when it'll be logged
+    debug = debugging()
+    buckets = collections.defaultdict(list)
+    for member in members:
+        handled = handle(member)
+        if handled is None:
+            continue
+
+        bucket, item = handled
+        if debug:
+            log_extracting(bucket, member)
+        buckets[bucket].append(item)
+
+    classified = Members(
+        attributes=buckets["attributes"],
+        classes=buckets["classes"],
+        data_descriptors=buckets["data_descriptors"],
+        methods=buckets["methods"],
+        properties=buckets["properties"],
+    )
+    cache_members(cls, classified)
+    return classified
+
+
+def cached_members[C](cls: type[C]) -> Members | None:
+    if cls in _members_cache:
+        return _members_cache[cls]
+
+    # read from the class' own __dict__, as subclasses inherit the attribute
+    return vars(cls).get(CACHE_ATTRIBUTE)
+
+
+def cache_members[C](cls: type[C], members: Members) -> None:
+    try:
+        # skip any __setattr__ a metaclass defines
+        type.__setattr__(cls, CACHE_ATTRIBUTE, members)
+    except TypeError:
+        _members_cache[cls] = members
+    else:
+        _memoised.add(cls)
+
+
+def log_extracting(bucket: Bucket, member: Member) -> None:
+    # inner classes are classified part way through, clearing the context, so
+    # the class is bound with each member
+    structlog.contextvars.bind_contextvars(
+        **{"class": member.cls.__name__}, member=member
+    )
+    logger.debug("extracting %s", bucket)
+
+
+def clear_cache() -> None:
+    """Forget every memoised class, eg when their source has changed"""
+    for cls in list(_memoised):
+        type.__delattr__(cls, CACHE_ATTRIBUTE)
+
+    _memoised.clear()
+    _members_cache.clear()
+
+
 def get_members(obj) -> list[Member]:
     """
-    Get members from the given object
+    Get the visible members defined directly on the given class
+
+    pydoc.classify_class_attrs inspects every attribute a class has, including
+    all those it inherits, so using it for each class in an MRO repeats the
+    work of every level above it.  Instead, each class' own __dict__ is read,
+    classifying its members the same way pydoc does.
+
+    Metaclasses can change which attributes a class lists (__dir__) or where
+    they're looked up (__getattr__), and a metaclass' own members mix with
+    those of type, so those classes go via pydoc instead.
+    """
+    metaclass = type(obj)
+    if (
+        metaclass.__dir__ is not type.__dir__
+        or hasattr(metaclass, "__getattr__")
+        or issubclass(obj, type)
+    ):
+        return get_pydoc_members(obj)
+
+    own = obj.__dict__
+
+    # dir() sorts the names it lists, while inspect lists DynamicClassAttributes
+    # (eg Enum's name and value) a second time, once per class defining them
+    names = sorted(own)
+    names.extend(
+        name
+        for base in inspect.getmro(obj)
+        for name, value in base.__dict__.items()
+        if isinstance(value, types.DynamicClassAttribute)
+        and value.fget is not None
+        and name in own
+    )
+
+    members = []
+    seen = set()
+    for name in names:
+        dict_obj = own[name]
+
+        # getattr can find something more useful than the raw descriptor in
+        # __dict__, but it's only tried the first time a name is seen
+        get_obj = None
+        if name not in seen and name != "__dict__":
+            with contextlib.suppress(Exception):
+                get_obj = getattr(obj, name)
+        seen.add(name)
+
+        value = get_obj if get_obj is not None else dict_obj
+
+        if isinstance(dict_obj, staticmethod | types.BuiltinMethodType):
+            kind, value = "static method", dict_obj
+        elif isinstance(dict_obj, classmethod | types.ClassMethodDescriptorType):
+            kind, value = "class method", dict_obj
+        elif isinstance(dict_obj, property):
+            kind, value = "property", dict_obj
+        elif inspect.isroutine(value):
+            kind = "method"
+        else:
+            kind = "data"
+
+        # pydoc's fixup of inspect's kinds
+        if inspect.isdatadescriptor(value):
+            kind = "data descriptor"
+            if isinstance(value, property) and value.fset is None:
+                kind = "readonly property"
+
+        kind = detect_kind(value) or kind
+
+        if pydoc.visiblename(name, obj=obj):
+            members.append(Member(name=name, kind=kind, cls=obj, obj=value))
+
+    return members
+
+
+def get_pydoc_members(obj) -> list[Member]:
+    """
+    Get members from the given object, via pydoc
 
     classify_class_attrs returns a tuple of:
      - name
@@ -94,7 +244,7 @@ def get_members(obj) -> list[Member]:
     members = [
         Member(
             name=m[0],
-            kind=m[1],
+            kind=detect_kind(m[3]) or m[1],
             cls=m[2],
             obj=m[3],
         )
@@ -108,11 +258,11 @@ def get_members(obj) -> list[Member]:
     ]
 
 
-def get_parents[C](obj: type[C]) -> list[str]:
+def get_parents[C](obj: type[C]) -> list[SimpleClass]:
     tree = inspect.getclasstree([obj])
 
     # getclasstree returns a list of tuples, containing a class, and tuple with
     # that classes parents.  We just want the parents for the given obj.
     raw_parents = tree[-1][0][1]
 
-    return [c for c in raw_parents if c is not builtins.object]
+    return [SimpleClass.from_class(c) for c in raw_parents if c is not builtins.object]
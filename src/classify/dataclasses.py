@@ -1,12 +1,13 @@
 import inspect
 import pydoc
+import weakref
 from typing import Any, Literal, Self
 
-import structlog
-from attrs import frozen
+from attrs import field, frozen
 
+from .profiling import profiler
+from .source import sources
 
-logger = structlog.get_logger()
 
 Kind = Literal[
     "class method",
@@ -27,7 +28,6 @@ class Attribute:
 
     @classmethod
     def from_member(cls, member: "Member") -> Self:
-        logger.debug("extracting attribute", member=member)
         return cls(
             name=member.name,
             defining_class=SimpleClass.from_class(member.cls),
@@ -40,8 +40,8 @@ class Class:
     name: str
     module: str
     docstring: str
-    ancestors: list[str]
-    parents: list[str]
+    ancestors: list["SimpleClass"]
+    parents: list["SimpleClass"]
     attributes: dict[str, list[Attribute]]
     classes: list["Class"]
     properties: dict[str, list["Method"]]
@@ -58,8 +58,6 @@ class DataDescriptor:
 
     @classmethod
     def from_member(cls, member: "Member") -> Self:
-        logger.debug("extracting data descriptor")
-
         # properties are have fget, fset, and fdel objects that are themselves
         # methods, can I pass those methods to build methods?
         getter = Method.from_func(member.obj.fget, member.cls)
@@ -69,6 +67,23 @@ class DataDescriptor:
         return cls(name=member.name, getter=getter, setter=setter, deleter=deleter)
 
 
+@frozen(repr=False)
+class Expression:
+    """
+    An attribute's value which can't be known without running it
+
+    Classifying statically keeps the source of the expression instead, which is
+    shown as it's written.
+    """
+
+    source: str
+
+    def __repr__(self) -> str:
+        return self.source
+
+    __str__ = __repr__
+
+
 @frozen
 class Line:
     start: int
@@ -78,20 +93,48 @@ class Line:
 @frozen
 class Member[C]:
     name: str
-    kind: Kind
+    # one of Kind, or a kind registered by a plugin, see filters.register
+    kind: "Kind | str"
     cls: type[C]
     obj: Any
 
 
+@frozen
+class Members:
+    """The (name, item) pairs of each kind of member defined on a single class"""
+
+    attributes: list[tuple[str, Attribute]]
+    classes: list[Class]
+    data_descriptors: list[tuple[str, DataDescriptor]]
+    methods: list[tuple[str, "Method"]]
+    properties: list[tuple[str, "Method"]]
+
+
 @frozen
 class Method:
+    """
+    A function, along with where its source can be found
+
+    Source is the bulk of a classified class, so when it can be read from its
+    file again it isn't kept, and code reads it back from linecache when it's
+    rendered.  Source which can't be found that way is kept as given.
+    """
+
     name: str
     docstring: str
     defining_class: "SimpleClass"
     arguments: str
-    code: str
     lines: Line
     file: str | None = None
+    _code: str | None = field(default=None, alias="code")
+
+    @property
+    def code(self) -> str:
+        if self._code is not None:
+            return self._code
+
+        end = self.lines.start + self.lines.total - 1
+        return "".join(sources.getlines(self.file, self.lines.start, end))
 
     @classmethod
     def from_func(cls, func, defining_class) -> Self:
@@ -108,23 +151,31 @@ class Method:
         arguments = str(inspect.signature(func))
 
         # Get source line details
-        lines, start_line = inspect.getsourcelines(func)
-
-        file = inspect.getsourcefile(func)
+        with profiler.phase("source"):
+            file = sources.getsourcefile(func)
+            span = sources.locate(func)
+
+            code = None
+            if span is None:
+                lines, start = inspect.getsourcelines(func)
+                code = "".join(lines)
+                total = len(lines)
+            else:
+                _, start, end = span
+                total = end - start + 1
 
         return cls(
             name=func.__name__,
             docstring=pydoc.getdoc(func),
             defining_class=SimpleClass.from_class(defining_class),
             arguments=arguments,
-            code="".join(lines),
-            lines=Line(start=start_line, total=len(lines)),
+            code=code,
+            lines=Line(start=start, total=total),
             file=file,
         )
 
     @classmethod
     def from_member(cls, member: "Member") -> Self:
-        logger.debug("extracting method")
         return cls.from_func(member.obj, member.cls)
 
 
@@ -135,7 +186,19 @@ class SimpleClass:
 
     @staticmethod
     def from_class(klass):
-        return SimpleClass(
+        """The SimpleClass of the given class, shared by all of its members"""
+        try:
+            return _simple_classes[klass]
+        except KeyError:
+            pass
+
+        simple = _simple_classes[klass] = SimpleClass(
             name=klass.__name__,
             module=klass.__module__,
         )
+        return simple
+
+
+_simple_classes: weakref.WeakKeyDictionary[type, SimpleClass] = (
+    weakref.WeakKeyDictionary()
+)
@@ -1,10 +1,18 @@
 import inspect
+import typing
+from collections.abc import Callable
+from typing import Any, Literal
 
-from .dataclasses import Member
+from .dataclasses import Attribute, DataDescriptor, Kind, Member, Method
 
 
-def is_attribute(member: Member) -> bool:
-    return member.kind == "data" and not is_inner_class(member)
+Bucket = Literal["attributes", "classes", "data_descriptors", "methods", "properties"]
+
+BUCKETS = frozenset(typing.get_args(Bucket))
+
+# a handler builds the item for a member of its kind, as Members holds it, along
+# with the bucket it goes in, or gives None to skip the member
+Handler = Callable[[Member], tuple[Bucket, Any] | None]
 
 
 def is_data_descriptor(member: Member) -> bool:
@@ -16,7 +24,7 @@ def is_data_descriptor(member: Member) -> bool:
 
 
 def is_inner_class(member: Member) -> bool:
-    if not inspect.isclass(member.obj):
+    if member.kind != "data" or not inspect.isclass(member.obj):
         return False
 
     # inner class' __qualname__ will reflect that of the class they are defined
@@ -24,12 +32,80 @@ def is_inner_class(member: Member) -> bool:
     # a prefix that can be removed from member.obj's __qualname__.  If the
     # remainder matches member.name then we have an inner class.
     name = member.obj.__qualname__.removeprefix(f"{member.cls.__qualname__}.")
-    return name == member.name and member.kind == "data"
+    return name == member.name
+
+
+def _data(member: Member) -> tuple[Bucket, Any]:
+    if is_inner_class(member):
+        # classification routes members through here, so it's imported late
+        from .classification import classify  # noqa: PLC0415
+
+        return "classes", classify(member.obj)
+
+    return "attributes", (member.name, Attribute.from_member(member))
+
+
+def _data_descriptor(member: Member) -> tuple[Bucket, Any] | None:
+    if not is_data_descriptor(member):
+        return None
+
+    return "data_descriptors", (member.name, DataDescriptor.from_member(member))
+
+
+def _method(member: Member) -> tuple[Bucket, Any]:
+    return "methods", (member.name, Method.from_member(member))
+
+
+def _property(member: Member) -> tuple[Bucket, Any]:
+    return "properties", (member.name, Method.from_func(member.obj.fget, member.cls))
+
+
+handlers: dict[str, Handler] = {
+    "class method": _method,
+    "data": _data,
+    "data descriptor": _data_descriptor,
+    "method": _method,
+    "readonly property": _property,
+    "static method": _method,
+}
+
+# the kinds plugins have added, with a test for the values which are that kind
+detectors: dict[str, Callable[[Any], bool]] = {}
+
+
+def register(
+    kind: Kind | str, handler: Handler, detect: Callable[[Any], bool] | None = None
+) -> None:
+    """
+    Handle members of the given kind with the given handler
+
+    This replaces any existing handler for the kind, eg to skip a kind of member
+    entirely.  Plugins can add kinds of their own (eg an ORM's fields) by also
+    giving a test for the values of that kind, which is tried before working
+    out which of the built in kinds a value is.
+    """
+    handlers[kind] = handler
+    if detect is not None:
+        detectors[kind] = detect
+
+
+def detect_kind(value: Any) -> str | None:
+    """The kind a plugin has registered for the given value, if any"""
+    if not detectors:
+        return None
+
+    return next((kind for kind, test in detectors.items() if test(value)), None)
 
 
-def is_method(member: Member) -> bool:
-    return member.kind in ["method", "class method", "static method"]
+def handle(member: Member) -> tuple[Bucket, Any] | None:
+    """Build the item for the given member, and pick the one bucket it goes in"""
+    handler = handlers.get(member.kind)
+    if handler is None:
+        return None
 
+    handled = handler(member)
+    if handled is not None and handled[0] not in BUCKETS:
+        msg = f"{member.kind!r} handler gave an unknown bucket: {handled[0]!r}"
+        raise ValueError(msg)
 
-def is_property(member: Member) -> bool:
-    return member.kind == "readonly property"
+    return handled
@@ -0,0 +1,27 @@
+import logging
+
+import structlog
+
+
+def debugging() -> bool:
+    """
+    Whether debug events are being logged
+
+    Classifying logs the member being extracted, so hot loops check this once
+    up front and skip binding context and building events which would only be
+    thrown away.
+    """
+    return structlog.get_logger().is_enabled_for(logging.DEBUG)
+
+
+def configure_logging(debug: bool) -> None:
+    default_log_level = logging.DEBUG if debug else logging.WARNING
+    structlog.configure(
+        processors=[
+            structlog.contextvars.merge_contextvars,
+            structlog.processors.StackInfoRenderer(),
+            structlog.dev.set_exc_info,
+            structlog.dev.ConsoleRenderer(),
+        ],
+        wrapper_class=structlog.make_filtering_bound_logger(default_log_level),
+    )
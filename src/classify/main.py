@@ -1,22 +1,61 @@
-import logging
-import pydoc
 import sys
+import time
 from pathlib import Path
 
 import click
-import structlog
-from rich.syntax import DEFAULT_THEME
 
 from . import renderers
-from .classification import classify
 from .django import setup_django
 from .exceptions import NotAClassError
 from .renderers import Renderer
-from .resolution import resolve
+
+
+# rich.syntax.DEFAULT_THEME, defined here so --help and --version don't have to
+# import rich
+DEFAULT_THEME = "monokai"
+
+# the Pygments style HTML is highlighted with, which doesn't need checking
+DEFAULT_HTML_THEME = "default"
+
+# the documentation server imports whatever it's asked for, and shows the source
+# and attribute values of what it finds, while output directories hold the paths
+# of source files, so anything served is only reachable locally by default
+DEFAULT_HOST = "127.0.0.1"
+
+
+def check_html_theme(ctx, param, value):  # noqa: ARG001
+    """Check the chosen theme is a Pygments style"""
+    if value == DEFAULT_HTML_THEME:
+        return value
+
+    from pygments.styles import get_all_styles  # noqa: PLC0415
+
+    if value not in set(get_all_styles()):
+        msg = f"{value!r} isn't a Pygments style"
+        raise click.BadParameter(msg)
+
+    return value
+
+
+def check_renderer(ctx, param, value):  # noqa: ARG001
+    """Check the chosen renderer's optional dependencies are installed"""
+    import importlib.util  # noqa: PLC0415
+
+    if value == Renderer.MSGPACK and importlib.util.find_spec("msgpack") is None:
+        msg = "msgpack isn't installed, install classify[msgpack] to use it"
+        raise click.BadParameter(msg)
+
+    return value
 
 
 @click.command()
-@click.argument("klass")
+@click.argument("klass", required=False)
+@click.option(
+    "--cache-dir",
+    envvar="CLASSIFY_CACHE_DIR",
+    type=click.Path(file_okay=False, path_type=Path),
+    help="Directory to cache classified classes in between runs",
+)
 @click.option(
     "--console-theme",
     default=DEFAULT_THEME,
@@ -24,10 +63,62 @@ from .resolution import resolve
 )
 @click.option("--debug", is_flag=True)
 @click.option("--django-settings")
+@click.option(
+    "--fragments",
+    is_flag=True,
+    help="Share methods between an HTML site's pages, rather than repeating them",
+)
+@click.option(
+    "--from-file",
+    "paths_file",
+    type=click.File(),
+    help="Classify every class listed in the given file, one dotted path per line",
+)
+@click.option(
+    "--host",
+    default=DEFAULT_HOST,
+    help="Address to listen on with --serve, eg 0.0.0.0 for every interface",
+)
+@click.option(
+    "--html-theme",
+    default=DEFAULT_HTML_THEME,
+    callback=check_html_theme,
+    help="Pygments theme to highlight HTML output with",
+)
+@click.option(
+    "--incremental",
+    is_flag=True,
+    help="Only rebuild pages of an HTML site whose classes have changed",
+)
+@click.option(
+    "--index",
+    "index_path",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="SQLite file to index the members of classified classes in, for --query",
+)
+@click.option(
+    "-j",
+    "--jobs",
+    default=1,
+    type=click.IntRange(min=1),
+    help="Number of processes to classify with in batch mode",
+)
+@click.option(
+    "--lazy",
+    is_flag=True,
+    help="Only load the bodies of an HTML site's methods as they're opened",
+)
+@click.option(
+    "--package",
+    "packages",
+    multiple=True,
+    help="Classify every class defined in the given package or module",
+)
 @click.option(
     "--renderer",
     default=Renderer.CONSOLE,
     type=click.Choice(Renderer, case_sensitive=False),
+    callback=check_renderer,
 )
 @click.option(
     "-o",
@@ -38,34 +129,238 @@ from .resolution import resolve
     help="Relative path for output files to be saved",
 )
 @click.option("-p", "--port", default=8000, type=click.INT)
+@click.option(
+    "--profile",
+    is_flag=True,
+    help="Log the time spent in each phase of the run, and the work done, as JSON",
+)
+@click.option(
+    "--profile-output",
+    type=click.Path(file_okay=False, path_type=Path),
+    help="Directory to write cProfile and tracemalloc dumps to, implies --profile",
+)
+@click.option(
+    "--query",
+    help="List the indexed classes with the given member (or glob) instead of classifying",
+)
 @click.option("-s", "--serve", is_flag=True)
+@click.option(
+    "--static",
+    is_flag=True,
+    help="Classify from source, without importing (and so running) any code",
+)
+@click.option(
+    "-w",
+    "--watch",
+    is_flag=True,
+    help="Classify and render again whenever the class' source changes",
+)
 @click.version_option()
 def run(
     klass,
+    cache_dir,
     console_theme,
     debug,
     django_settings,
+    fragments,
+    paths_file,
+    host,
+    html_theme,
+    incremental,
+    index_path,
+    jobs,
+    lazy,
+    packages,
     renderer: Renderer,
     output_path,
     port,
+    profile,
+    profile_output,
+    query,
     serve,
+    static,
+    watch,
 ) -> None:
-    if django_settings:
-        setup_django(django_settings)
-
-    default_log_level = logging.DEBUG if debug else logging.WARNING
-    structlog.configure(
-        processors=[
-            structlog.contextvars.merge_contextvars,
-            structlog.processors.StackInfoRenderer(),
-            structlog.dev.set_exc_info,
-            structlog.dev.ConsoleRenderer(),
-        ],
-        wrapper_class=structlog.make_filtering_bound_logger(default_log_level),
+    # everything past this point is imported as it's needed, keeping startup
+    # fast, and only paying for the dependencies of the chosen code path
+    from .logs import configure_logging  # noqa: PLC0415
+    from .profiling import profiler  # noqa: PLC0415
+
+    start_profiling(profile, profile_output)
+    if query:
+        answer_query(index_path, query)
+        return
+
+    check_options(
+        klass=klass,
+        batch=bool(packages or paths_file),
+        fragments=fragments or lazy,
+        incremental=incremental,
+        renderer=renderer,
+        serve=serve,
+        static=static,
+        watch=watch,
     )
 
+    # nothing is imported when classifying statically, so Django needn't be set up
+    if django_settings and not static:
+        with profiler.phase("django_setup"):
+            setup_django(django_settings)
+
+    configure_logging(debug)
+
+    if packages or paths_file:
+        from .batch import read_paths  # noqa: PLC0415
+
+        with profiler.phase("import"):
+            paths = [
+                path
+                for package in packages
+                for path in find_package_classes(package, static)
+            ]
+            if paths_file:
+                paths.extend(read_paths(paths_file))
+
+        run_batch(
+            list(dict.fromkeys(paths)),
+            renderer=renderer,
+            console_theme=console_theme,
+            html_theme=html_theme,
+            output_path=output_path,
+            serve=serve,
+            port=port,
+            host=host,
+            fragments=fragments,
+            lazy=lazy,
+            incremental=incremental,
+            jobs=jobs,
+            django_settings=django_settings,
+            debug=debug,
+            cache_dir=cache_dir,
+            index_path=index_path,
+            static=static,
+        )
+        return
+
+    if not klass and serve:
+        from .server import run_server  # noqa: PLC0415
+
+        run_server(port, cache_dir, watch=watch, host=host)
+        return
+
+    if not klass:
+        msg = "Missing argument 'KLASS'."
+        raise click.UsageError(msg)
+
+    with profiler.phase("import"):
+        obj = import_class(klass, static)
+
+    # pages are served as HTML, like the documentation server, whichever renderer
+    # was picked
+    if watch and serve:
+        from .server import run_server  # noqa: PLC0415
+
+        run_server(port, cache_dir, watch=True, path=klass, host=host)
+        return
+
+    def render_structure(structure):
+        with profiler.phase("render"):
+            render(
+                structure,
+                renderer,
+                console_theme,
+                output_path,
+                serve,
+                port,
+                html_theme=html_theme,
+                cache_dir=cache_dir,
+                host=host,
+            )
+
+    with profiler.phase("classify"):
+        if static:
+            from .static import classify  # noqa: PLC0415
+
+            structure = classify(obj)
+        else:
+            from .cache import cached_classify  # noqa: PLC0415
+
+            structure = cached_classify(obj, cache_dir)
+
+    render_structure(structure)
+    index_structures([structure], index_path)
+
+    if watch:
+        watch_class(klass, render_structure, cache_dir)
+
+
+def answer_query(index_path, name) -> None:
+    """Print the indexed classes with the given member, and where it's defined"""
+    from .search import query  # noqa: PLC0415
+
+    if index_path is None or not index_path.exists():
+        msg = "--query needs an --index file written by an earlier run"
+        raise click.UsageError(msg)
+
+    for entry in query(index_path, name):
+        defined = "defined" if entry.is_own else f"from {entry.defining_class}"
+        location = f" {entry.file}:{entry.line}" if entry.file else ""
+        click.echo(f"{entry.cls}.{entry.name} ({entry.kind}, {defined}){location}")
+
+
+def check_options(
+    *, klass, batch, fragments, incremental, renderer, serve, static, watch
+) -> None:
+    if fragments and not (batch and renderer == Renderer.HTML):
+        msg = "--fragments and --lazy need batch mode and --renderer html"
+        raise click.UsageError(msg)
+
+    if watch and batch:
+        msg = "--watch works with a single class, or the documentation server"
+        raise click.UsageError(msg)
+
+    # each of these import the classes they're given
+    if static and (incremental or watch or (serve and not klass)):
+        msg = (
+            "--static can't be used with --incremental, --watch, or the "
+            "documentation server"
+        )
+        raise click.UsageError(msg)
+
+
+def find_package_classes(package, static):
+    """
+    Find the classes in the given package, exiting with the reason when it can't
+    be imported
+    """
+    if static:
+        from .static import find_classes  # noqa: PLC0415
+    else:
+        from .batch import find_classes  # noqa: PLC0415
+
     try:
-        obj = resolve(klass)
+        return find_classes(package)
+    except ImportError:
+        click.echo(f"Could not import: {package}", err=True)
+        sys.exit(1)
+    except Exception as e:  # noqa: BLE001
+        click.echo(
+            f"Could not import '{package}', the original error was:\n {e}", err=True
+        )
+        sys.exit(1)
+
+
+def import_class(klass, static):
+    """Find the given class, exiting with the reason when it can't be found"""
+    import pydoc  # noqa: PLC0415
+
+    if static:
+        from .static import resolve  # noqa: PLC0415
+    else:
+        from .resolution import resolve  # noqa: PLC0415
+
+    try:
+        return resolve(klass)
     except ImportError:
         click.echo(f"Could not import: {klass}", err=True)
         sys.exit(1)
@@ -81,17 +376,169 @@ def run(
         )
         sys.exit(1)
 
-    structure = classify(obj)
 
+def start_profiling(profile, output_path) -> None:
+    """Profile the rest of the run, reporting however it ends, eg on an error"""
+    if not (profile or output_path):
+        return
+
+    from .profiling import profiler  # noqa: PLC0415
+
+    profiler.start(output_path)
+    click.get_current_context().call_on_close(profiler.stop)
+
+
+def render(
+    structure,
+    renderer,
+    console_theme,
+    output_path,
+    serve,
+    port,
+    html_theme=DEFAULT_HTML_THEME,
+    cache_dir=None,
+    host=DEFAULT_HOST,
+):
     match renderer:
         case Renderer.CONSOLE:
             renderers.to_console(structure, console_theme)
         case Renderer.HTML:
-            renderers.to_html(structure, output_path, serve, port)
-        case Renderer.PAGER:  # pragma: no branch
+            renderers.to_html(
+                structure, output_path, serve, port, html_theme, cache_dir, host
+            )
+        case Renderer.JSON:
+            renderers.to_json(structure, sys.stdout)
+        case Renderer.MSGPACK:
+            renderers.to_msgpack(structure, sys.stdout.buffer)
+        case Renderer.PAGER:
+            renderers.to_pager(structure, console_theme)
+        case Renderer.STRING:  # pragma: no branch
             # unclear why coverage thinks run() doesn't return, so marking as
             # no branch for now
-            renderers.to_pager(structure, console_theme)
+            renderers.to_stream(structure, sys.stdout)
+            sys.stdout.write("\n")
+
+
+def index_structures(structures, index_path) -> None:
+    if index_path is None:
+        return
+
+    from .profiling import profiler  # noqa: PLC0415
+    from .search import write_index  # noqa: PLC0415
+
+    with profiler.phase("index"):
+        write_index(structures, index_path)
+
+
+def watch_class(klass, render_structure, cache_dir, interval=0.5) -> None:
+    """Render the given class again each time its source changes"""
+    from .cache import cached_classify  # noqa: PLC0415
+    from .resolution import resolve  # noqa: PLC0415
+    from .watch import Watcher  # noqa: PLC0415
+
+    watcher = Watcher([klass])
+    click.echo(f"Watching {klass} for changes, press Ctrl+C to stop", err=True)
+
+    try:
+        while True:
+            time.sleep(interval)
+
+            if watcher.poll():
+                click.clear()
+                render_structure(cached_classify(resolve(klass), cache_dir))
+    except KeyboardInterrupt:
+        pass
+
+
+def run_batch(
+    paths,
+    *,
+    renderer,
+    console_theme,
+    output_path,
+    serve,
+    port,
+    incremental,
+    jobs,
+    django_settings,
+    debug,
+    cache_dir,
+    fragments=False,
+    host=DEFAULT_HOST,
+    html_theme=DEFAULT_HTML_THEME,
+    index_path=None,
+    lazy=False,
+    static=False,
+) -> None:
+    from .batch import classify_all  # noqa: PLC0415
+    from .manifest import Manifest  # noqa: PLC0415
+    from .profiling import profiler  # noqa: PLC0415
+
+    # HTML sites written somewhere which outlives this run record what each page
+    # was built from, so later runs can be incremental
+    manifest = None
+    if renderer == Renderer.HTML and output_path and not static:
+        options = {"fragments": fragments, "lazy": lazy, "theme": html_theme}
+        manifest = Manifest.load(output_path, options)
+        manifest.prune(paths)
+
+    if incremental:
+        if manifest is None:
+            msg = "--incremental needs --renderer html and an --output directory"
+            raise click.UsageError(msg)
+
+        paths = manifest.stale(paths)
+
+    with profiler.phase("classify"):
+        structures, failures = classify_all(
+            paths,
+            jobs=jobs,
+            django_settings=django_settings,
+            debug=debug,
+            cache_dir=cache_dir,
+            static=static,
+        )
+    for path, reason in failures.items():
+        click.echo(f"Could not classify: {path} ({reason})", err=True)
+
+    index_structures(structures, index_path)
+
+    with profiler.phase("render"):
+        match renderer:
+            case Renderer.HTML:
+                index = None
+                if manifest:
+                    built = [p for p in paths if p not in failures]
+                    manifest.record(dict(zip(built, structures, strict=True)), failures)
+                    manifest.save()
+                    index = manifest.index()
+
+                renderers.to_html_site(
+                    structures,
+                    output_path,
+                    serve,
+                    port,
+                    index=index,
+                    fragments=fragments,
+                    lazy=lazy,
+                    theme=html_theme,
+                    cache_dir=cache_dir,
+                    host=host,
+                )
+            case Renderer.PAGER:
+                renderers.to_pager(structures, console_theme)
+            case _:
+                # the rest render a class at a time, one after another
+                for structure in structures:
+                    render(
+                        structure,
+                        renderer,
+                        console_theme,
+                        output_path,
+                        serve,
+                        port,
+                        host=host,
+                    )
 
 
 if __name__ == "__main__":  # pragma: no cover
@@ -0,0 +1,109 @@
+import inspect
+import json
+from collections.abc import Iterable, Mapping
+from pathlib import Path
+
+from .cache import fingerprint, is_unchanged, method_files, version
+from .dataclasses import Class
+from .resolution import resolve
+
+
+FILENAME = ".classify-manifest.json"
+
+
+def dependencies[C](obj: type[C]) -> dict:
+    """The ancestors and source files which feed the given class' page"""
+    return {
+        "ancestors": [f"{c.__module__}.{c.__qualname__}" for c in inspect.getmro(obj)],
+        "files": fingerprint(obj),
+        "page": f"{obj.__module__}.{obj.__name__}.html",
+    }
+
+
+class Manifest:
+    """
+    A record of the inputs of each page in a site, by the path it was built from
+
+    When the ancestors or source files of a class haven't changed since its page
+    was written, and that page still exists, the page is current and doesn't need
+    to be built again.  Editing a mixin changes the files of every class which
+    inherits from it, so exactly those pages are rebuilt.
+
+    The files of the methods on each page are recorded too, since methods can be
+    defined outside of the files of the classes they're on.
+
+    Pages also depend on the options they were built with (eg the theme) and
+    the version of classify which built them, so a site built with any others
+    is entirely stale.
+    """
+
+    def __init__(self, directory: Path, entries: dict[str, dict], build: dict):
+        self.directory = directory
+        self.entries = entries
+        self.build = build
+
+    @classmethod
+    def load(cls, directory: Path, options: Mapping[str, object]) -> "Manifest":
+        """Load the manifest of the site in directory, to build with options"""
+        build = {"classify": version(), "options": dict(options)}
+
+        try:
+            content = json.loads((directory / FILENAME).read_text())
+        except (OSError, ValueError):
+            content = {}
+
+        # manifests from before the build was recorded have no build to match
+        entries = {}
+        if isinstance(content, dict) and content.get("build") == build:
+            entries = content["pages"]
+
+        return cls(directory, entries, build)
+
+    def index(self) -> list[tuple[str, str]]:
+        """The name and filename of every page in the site"""
+        return sorted(
+            (entry["page"].removesuffix(".html"), entry["page"])
+            for entry in self.entries.values()
+        )
+
+    def is_current(self, path: str) -> bool:
+        entry = self.entries.get(path)
+        if entry is None or not (self.directory / entry["page"]).exists():
+            return False
+
+        recorded = dict(entry)
+        methods = recorded.pop("methods", {})
+
+        try:
+            return recorded == dependencies(resolve(path)) and is_unchanged(methods)
+        except Exception:  # noqa: BLE001
+            # let classification report why the path can't be used
+            return False
+
+    def prune(self, paths: Iterable[str]) -> None:
+        """Forget every page which wasn't built from one of the given paths"""
+        paths = set(paths)
+        self.entries = {k: v for k, v in self.entries.items() if k in paths}
+
+    def record(self, structures: Mapping[str, Class], failures: Iterable[str]) -> None:
+        """
+        Record the inputs of newly built pages, by the path each structure was
+        classified from, forgetting those which failed
+        """
+        for path in failures:
+            self.entries.pop(path, None)
+
+        for path, structure in structures.items():
+            self.entries[path] = dependencies(resolve(path)) | {
+                "methods": method_files(structure)
+            }
+
+    def save(self) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        content = json.dumps(
+            {"build": self.build, "pages": self.entries}, indent=2, sort_keys=True
+        )
+        (self.directory / FILENAME).write_text(content)
+
+    def stale(self, paths: Iterable[str]) -> list[str]:
+        return [path for path in paths if not self.is_current(path)]
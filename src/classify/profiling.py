@@ -0,0 +1,116 @@
+import collections
+import contextlib
+import sys
+import time
+from pathlib import Path
+
+import structlog
+
+from .source import sources
+
+
+class Profiler:
+    """
+    Time the phases of a run, and count the work done in them
+
+    Phases and counters are recorded throughout the code, so both are no-ops
+    until the profiler is started, keeping their cost out of normal runs.
+    Phases can nest, eg reading source happens while classifying, so their
+    timings overlap rather than add up to the whole run.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.counters: collections.Counter[str] = collections.Counter()
+        self.phases: dict[str, float] = {}
+        self.output: Path | None = None
+        self._profile = None
+
+    def count(self, name: str, n: int = 1) -> None:
+        if self.enabled:
+            self.counters[name] += n
+
+    def phase(self, name: str) -> contextlib.AbstractContextManager:
+        if not self.enabled:
+            return contextlib.nullcontext()
+
+        return self._timed(name)
+
+    @contextlib.contextmanager
+    def _timed(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self.phases[name] = self.phases.get(name, 0) + elapsed
+
+    def start(self, output: Path | None = None) -> None:
+        """
+        Start recording, and with an output directory, profile the whole run
+
+        cProfile and tracemalloc slow everything down, so they're only run when
+        their output is wanted.
+        """
+        self.enabled = True
+        self.counters.clear()
+        self.phases = {}
+        self.output = output
+
+        if output:
+            import cProfile  # noqa: PLC0415
+            import tracemalloc  # noqa: PLC0415
+
+            tracemalloc.start()
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+
+    def stop(self) -> None:
+        """Stop recording and log what was recorded, as JSON on stderr"""
+        if not self.enabled:
+            return
+
+        self.enabled = False
+        report = {
+            "phases_ms": {name: round(s * 1000, 3) for name, s in self.phases.items()},
+            "counters": dict(sorted(self.counters.items())),
+            "sources": sources.stats(),
+        }
+
+        if self.output:
+            report.update(self.dump(self.output))
+
+        # separate from the configured logger, so it's machine readable and
+        # isn't filtered out when --debug isn't set
+        logger = structlog.wrap_logger(
+            structlog.PrintLogger(sys.stderr),
+            processors=[
+                structlog.processors.TimeStamper(fmt="iso"),
+                structlog.processors.JSONRenderer(),
+            ],
+            wrapper_class=structlog.BoundLogger,
+        )
+        logger.info("profile", **report)
+
+    def dump(self, output: Path) -> dict:
+        import tracemalloc  # noqa: PLC0415
+
+        self._profile.disable()
+        _, peak = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+
+        output.mkdir(parents=True, exist_ok=True)
+        profile_path = output / "classify.prof"
+        snapshot_path = output / "classify.tracemalloc"
+        self._profile.dump_stats(profile_path)
+        snapshot.dump(str(snapshot_path))
+
+        return {
+            "memory_peak": peak,
+            "cprofile": str(profile_path),
+            "tracemalloc": str(snapshot_path),
+        }
+
+
+profiler = Profiler()
@@ -1,13 +1,12 @@
 import enum
-
-from .console import to_console, to_pager
-from .html import to_html
-from .string import to_string
+import importlib
 
 
 class Renderer(enum.StrEnum):
     CONSOLE = enum.auto()
     HTML = enum.auto()
+    JSON = enum.auto()
+    MSGPACK = enum.auto()
     PAGER = enum.auto()
     STRING = enum.auto()
 
@@ -16,6 +15,32 @@ __all__ = [
     "Renderer",
     "to_console",
     "to_html",
+    "to_html_site",
+    "to_json",
+    "to_msgpack",
     "to_pager",
+    "to_stream",
     "to_string",
 ]
+
+# renderers pull in heavy dependencies (eg rich & jinja2), so they're imported
+# on first use, only paying for the renderer that's actually chosen
+_lazy = {
+    "to_console": "console",
+    "to_html": "html",
+    "to_html_site": "html",
+    "to_json": "structured",
+    "to_msgpack": "structured",
+    "to_pager": "console",
+    "to_stream": "string",
+    "to_string": "string",
+}
+
+
+def __getattr__(name):
+    if name not in _lazy:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+
+    module = importlib.import_module(f".{_lazy[name]}", __name__)
+    return getattr(module, name)
@@ -1,19 +1,89 @@
+import functools
+from collections.abc import Iterable, Iterator
+
 from rich.console import Console
 from rich.syntax import Syntax
+from rich.text import Text
+
+from ..dataclasses import Class
+from ..profiling import profiler
+from .string import iter_string
+
+
+class Section(Syntax):
+    """
+    A section of a class' source, highlighted once a process for each theme
+
+    Inherited methods are the same for every class inheriting them, so their
+    highlighted text is cached, see highlighted, and copied out since rich
+    styles it further as it's rendered.
+    """
+
+    def __init__(self, code: str, theme: str):
+        super().__init__(code, "python", theme=theme)
+        self.theme_name = theme
+
+    def highlight(self, code, line_range=None) -> Text:
+        return highlighted(code, self.theme_name, line_range).copy()
+
 
-from .string import to_string
+@functools.lru_cache(maxsize=4096)
+def highlighted(code: str, theme: str, line_range) -> Text:
+    """
+    The given code highlighted in the given theme
+
+    Sections are keyed on their code, so edited source is highlighted afresh,
+    while only the most recently used are kept, so long watch sessions and large
+    batch runs don't hold on to every section they've printed.
+    """
+    profiler.count("console_highlights")
+    return Syntax(code, "python", theme=theme).highlight(code, line_range)
+
+
+def sections(chunks: Iterable[str]) -> Iterator[str]:
+    """
+    Split the given chunks into sections which can be highlighted one by one
+
+    Sections break at newlines between chunks, each of which ends a line, so
+    printing them one after another gives the same lines as printing the whole
+    document, while each method is lexed on its own.
+    """
+    section = ""
+    for chunk in chunks:
+        body = chunk.lstrip("\n")
+        for _ in range(len(chunk) - len(body)):
+            yield section
+            section = ""
+
+        stripped = body.rstrip("\n")
+        section += stripped
+        for _ in range(len(body) - len(stripped)):
+            yield section
+            section = ""
+
+    yield section
 
 
 def to_console(structure, theme, console=None):
+    """
+    Print the given class, a section at a time
+
+    Highlighting the whole document at once lexes all of it before printing
+    anything, so large classes were slow to start appearing.
+    """
     if not console:
         console = Console()
 
-    content = to_string(structure)
-    syntax = Syntax(content, "python", theme=theme)
-    console.print(syntax)
+    for section in sections(iter_string(structure)):
+        console.print(Section(section, theme))
+
 
+def to_pager(structures, theme):
+    """Page through the given classes, or a single class, one after another"""
+    if isinstance(structures, Class):
+        structures = [structures]
 
-def to_pager(structure, theme):
     console = Console()
     with console.pager(styles=True):
-        to_console(structure, theme, console=console)
+        for structure in structures:
+            to_console(structure, theme, console=console)
@@ -0,0 +1,91 @@
+"""
+Highlight source as HTML with Pygments, highlighting each distinct source once
+
+An inherited method's source is the same on the page of every class which
+inherits it, and Pygments is slow, so highlighted HTML is cached by a hash of
+the source: in memory for the run, and given a directory, on disk between runs.
+Tokens are only marked up with CSS classes, so the HTML is the same whatever the
+theme, which just picks the stylesheet pages include.
+"""
+
+import functools
+import hashlib
+from pathlib import Path
+
+from markupsafe import Markup
+
+from ..profiling import profiler
+
+
+DEFAULT_THEME = "default"
+
+
+class Highlighter:
+    def __init__(self):
+        self.directory: Path | None = None
+        self._highlighted: dict[str, str] = {}
+
+    def __call__(self, code: str) -> Markup:
+        key = self.key(code)
+        try:
+            return Markup(self._highlighted[key])
+        except KeyError:
+            pass
+
+        html = self.read(key)
+        if html is None:
+            html = highlight(code)
+            self.write(key, html)
+
+        self._highlighted[key] = html
+        return Markup(html)
+
+    def cache_in(self, cache_dir: Path | None) -> None:
+        """Keep highlighted source under the given cache directory, if any"""
+        self.directory = cache_dir / "highlight" if cache_dir else None
+
+    @staticmethod
+    def key(code: str) -> str:
+        import pygments  # noqa: PLC0415
+
+        # another version of Pygments could tokenize the same source differently
+        content = f"{pygments.__version__}\0{code}".encode()
+        return hashlib.sha256(content).hexdigest()
+
+    def read(self, key: str) -> str | None:
+        if self.directory is None:
+            return None
+
+        try:
+            return (self.directory / f"{key}.html").read_text()
+        except OSError:
+            return None
+
+    def write(self, key: str, html: str) -> None:
+        if self.directory is None:
+            return
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        partial = self.directory / f"{key}.partial"
+        partial.write_text(html)
+        partial.replace(self.directory / f"{key}.html")
+
+
+def highlight(code: str) -> str:
+    from pygments import highlight  # noqa: PLC0415
+    from pygments.formatters import HtmlFormatter  # noqa: PLC0415
+    from pygments.lexers import PythonLexer  # noqa: PLC0415
+
+    profiler.count("highlights")
+    return highlight(code, PythonLexer(), HtmlFormatter())
+
+
+@functools.cache
+def stylesheet(theme: str = DEFAULT_THEME) -> str:
+    """The CSS for highlighted source in the given Pygments theme"""
+    from pygments.formatters import HtmlFormatter  # noqa: PLC0415
+
+    return HtmlFormatter(style=theme).get_style_defs(".highlight")
+
+
+highlighter = Highlighter()
@@ -1,15 +1,112 @@
 import contextlib
 import functools
+import hashlib
 import inspect
+import json
 import os
-import socketserver
 import tempfile
 import webbrowser
 from collections.abc import Generator
-from http.server import SimpleHTTPRequestHandler
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 
-from ..dataclasses import Class
+from ..dataclasses import Class, Method
+from .highlight import DEFAULT_THEME, highlighter, stylesheet
+
+
+# output directories hold more than pages, eg the manifest of an incremental
+# site, with the paths of its source files, so they're only served locally by
+# default
+DEFAULT_HOST = "127.0.0.1"
+
+
+class Fragments:
+    """
+    The HTML of each method declaration, rendered once and shared between pages
+
+    Ancestors' declarations are shown on the page of every class inheriting
+    them, so in large hierarchies most of a site is the same methods over and
+    over.  Instead each is rendered once, and bundled with the rest of its
+    defining class' declarations in fragments/<class>.js, which pages load to
+    fill in placeholders, keyed by a hash of the HTML they're replaced with.
+
+    Lazy fragments are the bodies of declarations, each in its own bundle,
+    fragments/<key>.js, which pages load when a method is opened.  Their
+    names change with their content, so existing bundles are never rewritten.
+    """
+
+    # bundles are scripts, so they load from a site on disk as well as served
+    PREFIX = "classifyFragments.add("
+    SUFFIX = ");\n"
+
+    def __init__(self, template, *, lazy: bool = False):
+        self.template = template
+        self.lazy = lazy
+        self.bundles: dict[str, dict[str, str]] = {}
+        self._keys: dict[tuple[str, int], tuple[str, str]] = {}
+
+    def key(self, name: str, declaration: Method) -> str:
+        """The key of the given declaration's fragment"""
+        return self.fragment(name, declaration)[1]
+
+    def bundles_of(self, structure: Class) -> list[str]:
+        """The bundles of the given class' declarations, and its inner classes'"""
+        bundles = {
+            self.fragment(name, declaration)[0]
+            for name, declarations in structure.methods.items()
+            for declaration in declarations
+        }
+        for inner in structure.classes:
+            bundles.update(self.bundles_of(inner))
+
+        return sorted(bundles)
+
+    def fragment(self, name: str, declaration: Method) -> tuple[str, str]:
+        """The bundle and key of the given declaration, rendering it the first time"""
+        # declarations are shared by every class inheriting them, so each is
+        # only rendered once a run
+        try:
+            return self._keys[name, id(declaration)]
+        except KeyError:
+            pass
+
+        html = self.template.render(name=name, declaration=declaration)
+        key = hashlib.sha256(html.encode()).hexdigest()[:16]
+        defining_class = declaration.defining_class
+        bundle = key if self.lazy else f"{defining_class.module}.{defining_class.name}"
+
+        self.bundles.setdefault(bundle, {})[key] = html
+        self._keys[name, id(declaration)] = (bundle, key)
+        return bundle, key
+
+    def write(self, path: Path, *, merge: bool) -> None:
+        """
+        Write each bundle to the fragments directory under path
+
+        When only some pages are rebuilt, the fragments of the other pages are
+        kept by merging them into the rewritten bundles.
+        """
+        directory = path / "fragments"
+        directory.mkdir(exist_ok=True)
+
+        for bundle, fragments in self.bundles.items():
+            bundle_path = directory / f"{bundle}.js"
+            if self.lazy and bundle_path.exists():
+                continue
+
+            if merge:
+                fragments = {**self.read(bundle_path), **fragments}  # noqa: PLW2901
+
+            content = json.dumps(fragments, separators=(",", ":"), sort_keys=True)
+            bundle_path.write_text(f"{self.PREFIX}{content}{self.SUFFIX}")
+
+    @classmethod
+    def read(cls, bundle_path: Path) -> dict[str, str]:
+        try:
+            content = bundle_path.read_text()
+            return json.loads(content.removeprefix(cls.PREFIX).removesuffix(cls.SUFFIX))
+        except (OSError, ValueError):
+            return {}
 
 
 class Handler(SimpleHTTPRequestHandler):  # pragma: no cover
@@ -45,23 +142,93 @@ def _(empty: None) -> Generator:  # noqa: ARG001
     directory.cleanup()
 
 
-def serve_output(port: int) -> None:  # pragma: no cover
-    httpd = socketserver.TCPServer(("", port), Handler)
+def page_name(structure: Class) -> str:
+    return f"{structure.module}.{structure.name}.html"
+
+
+def write_search(
+    path: Path, structures: list[Class], index: list[tuple[str, str]] | None
+) -> None:
+    """
+    Write search.json, the members of each page's class, for the index to search
+
+    When only some pages are being rebuilt, the other pages' entries are kept
+    from the existing file.
+    """
+    from ..search import entries  # noqa: PLC0415
+
+    search_path = path / "search.json"
+    classes = {}
+    if index is not None:
+        try:
+            existing = json.loads(search_path.read_text())["classes"]
+        except (OSError, ValueError, KeyError):
+            existing = {}
+
+        names = {name for name, _ in index}
+        classes = {name: c for name, c in existing.items() if name in names}
+
+    for structure in structures:
+        classes[f"{structure.module}.{structure.name}"] = {
+            "page": page_name(structure),
+            "members": [[e.name, e.kind, e.defining_class] for e in entries(structure)],
+        }
+
+    content = {"schema": 1, "classes": dict(sorted(classes.items()))}
+    search_path.write_text(json.dumps(content, separators=(",", ":")))
+
+
+def serve_output(
+    port: int, handler=Handler, host: str = DEFAULT_HOST
+) -> None:  # pragma: no cover
+    httpd = ThreadingHTTPServer((host, port), handler)
 
     if not os.environ.get("TEST_MODE", None):
-        print(f"Serving on port: {port}")
+        print(f"Serving on {host}, port: {port}")
         webbrowser.open_new_tab(f"http://localhost:{port}/")
 
     httpd.serve_forever()
 
 
-def to_html(structure: Class, output_path: Path | None, serve: bool, port: int) -> None:
-    from jinja2 import Environment, PackageLoader  # noqa: PLC0415
+@functools.cache
+def environment():
+    """
+    The Jinja environment, built once per process
+
+    Compiled templates are kept by the environment, and their bytecode cached
+    on disk, so neither batch builds nor later runs pay to compile them again.
+    The templates ship with the package, so there's no need to check whether
+    they've changed on every render.
+    """
+    from jinja2 import (  # noqa: PLC0415
+        Environment,
+        FileSystemBytecodeCache,
+        PackageLoader,
+    )
 
-    env = Environment(loader=PackageLoader("classify", "templates"))
+    env = Environment(
+        auto_reload=False,
+        bytecode_cache=FileSystemBytecodeCache(),
+        loader=PackageLoader("classify", "templates"),
+    )
     env.filters["attribute"] = attribute_value
-    template = env.get_template("web.html")
-    output = template.render(klass=structure)
+    env.filters["highlight"] = highlighter
+    env.globals["stylesheet"] = stylesheet
+    return env
+
+
+def to_html(
+    structure: Class,
+    output_path: Path | None,
+    serve: bool,
+    port: int,
+    theme: str = DEFAULT_THEME,
+    cache_dir: Path | None = None,
+    host: str = DEFAULT_HOST,
+) -> None:
+    highlighter.cache_in(cache_dir)
+    template = environment().get_template("web.html")
+    output = template.render(klass=structure, theme=theme)
 
     with resolve_path(output_path) as path:
         full_path = path / "classify.html"
@@ -72,4 +239,70 @@ def to_html(structure: Class, output_path: Path | None, serve: bool, port: int)
             return
 
         with contextlib.chdir(path):  # pragma: no cover
-            serve_output(port)
+            serve_output(port, host=host)
+
+
+def to_html_site(
+    structures: list[Class],
+    output_path: Path | None,
+    serve: bool,
+    port: int,
+    index: list[tuple[str, str]] | None = None,
+    fragments: bool = False,
+    lazy: bool = False,
+    theme: str = DEFAULT_THEME,
+    cache_dir: Path | None = None,
+    host: str = DEFAULT_HOST,
+) -> None:
+    """
+    Write a page for each class, and an index page linking them together
+
+    The index page can search the members of every class, from search.json.
+    The index lists the given structures, unless the name and filename of every
+    page in the site are passed in, eg when only some pages are being rebuilt.
+    With fragments, methods are shared between pages, and lazy pages only load
+    their methods' bodies as they're opened, see Fragments.  Highlighted source
+    is cached under cache_dir between runs, see Highlighter.
+    """
+    highlighter.cache_in(cache_dir)
+    env = environment()
+    template = env.get_template("web.html")
+
+    shared = None
+    if lazy:
+        shared = Fragments(env.get_template("method_body.html"), lazy=True)
+    elif fragments:
+        shared = Fragments(env.get_template("method.html"))
+
+    with resolve_path(output_path) as path:
+        for structure in structures:
+            context = {}
+            if shared:
+                context = {
+                    "bundles": [] if lazy else shared.bundles_of(structure),
+                    "fragment": shared.key,
+                    "lazy": lazy,
+                }
+
+            output = template.render(
+                klass=structure, index="index.html", theme=theme, **context
+            )
+            (path / page_name(structure)).write_text(output)
+
+        if shared:
+            shared.write(path, merge=index is not None)
+
+        write_search(path, structures, index)
+
+        if index is None:
+            index = sorted((f"{s.module}.{s.name}", page_name(s)) for s in structures)
+        content = env.get_template("index.html").render(pages=index)
+        full_path = path / "index.html"
+        full_path.write_text(content)
+
+        if not serve:
+            print(f"Wrote {len(structures)} pages, index: {full_path}")
+            return
+
+        with contextlib.chdir(path):  # pragma: no cover
+            serve_output(port, handler=SimpleHTTPRequestHandler, host=host)
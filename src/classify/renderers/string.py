@@ -1,4 +1,6 @@
 import inspect
+from collections.abc import Iterable, Iterator
+from typing import TextIO
 
 from ..dataclasses import Class, DataDescriptor, Method
 
@@ -9,23 +11,32 @@ DEFAULT_INDENT_WIDTH = 4
 
 
 def attributes(attributes, indent) -> str:
-    attrs = []
+    return "".join(iter_attributes(attributes, indent))
+
+
+def iter_attributes(attributes, indent) -> Iterator[str]:
     for name, definitions in attributes.items():
-        value = definitions[-1].value
+        yield f"{indent}{name} = {attribute_text(definitions[-1].value)}\n"
+
 
-        if isinstance(value, str):
-            value = f'"{value}"'
+def attribute_text(value) -> str:
+    """The text an attribute's value is shown as"""
+    if isinstance(value, str):
+        return f'"{value}"'
 
-        if inspect.isclass(value):
-            value = value.__name__
+    if inspect.isclass(value):
+        return value.__name__
 
-        attrs.append(f"{indent}{name} = {value}\n")
-    return "".join(attrs)
+    return str(value)
 
 
 def classes(classes, indent) -> str:
-    content = [to_string(c, indent=indent + indent) for c in classes]
-    return "".join(content)
+    return "".join(iter_classes(classes, indent))
+
+
+def iter_classes(classes, indent) -> Iterator[str]:
+    for c in classes:
+        yield from iter_string(c, indent=indent + indent)
 
 
 def declaration(name, parents, indent) -> str:
@@ -33,7 +44,7 @@ def declaration(name, parents, indent) -> str:
     content = f"{indent}class {name}"
 
     if parents:
-        parents = ", ".join([p.__name__ for p in parents])
+        parents = ", ".join([p.name for p in parents])
         content = f"{content}({parents})"
 
     return f"{content}:"
@@ -49,74 +60,115 @@ def docstring(docstring, indent) -> str:
     return f"{quotes}{block}{quotes}"
 
 
+def code(method: Method, indent) -> str:
+    lines = method.code.split("\n")[:-1]
+    # TODO: dedent code at source so defined indent isn't tied to presentation
+    # indent
+    return "".join(f"{indent}{line[4:]}\n" for line in lines)
+
+
 def methods(methods: dict[str, list[Method]], indent) -> str:
-    content = ""
-    for definitions in methods.values():
-        for i, method in enumerate(definitions):
-            if len(definitions) > 1 and i == 0:
-                content += f"{indent}# Defined on: {method.defining_class.name}\n"
-            lines = method.code.split("\n")[:-1]
-            for line in lines:
-                # TODO: dedent code at source so defined indent isn't tied to
-                # presentation indent
-                content += f"{indent}{line[4:]}\n"
-            content += "\n"
+    return "".join(iter_methods(methods, indent))
+
+
+def iter_methods(methods: dict[str, list[Method]], indent) -> Iterator[str]:
+    def blocks():
+        for definitions in methods.values():
+            for i, method in enumerate(definitions):
+                if len(definitions) > 1 and i == 0:
+                    yield f"{indent}# Defined on: {method.defining_class.name}\n"
+                yield code(method, indent)
+                yield "\n"
 
-    # add strip to remove the trailing newline, rather than polluting the loop
-    # with logic to work out if we're on the final loop iteration
-    return content.strip("\n")
+    # strip the newlines surrounding the methods as they're streamed, rather
+    # than polluting the loop with logic to work out if we're on the final
+    # loop iteration
+    yield from strip_newlines(blocks())
 
 
 def properties(properties: dict[str, list[Method]], indent) -> str:
-    content = ""
+    return "".join(iter_properties(properties, indent))
+
+
+def iter_properties(properties: dict[str, list[Method]], indent) -> Iterator[str]:
     for definitions in properties.values():
         for i, prop in enumerate(definitions):
             if len(definitions) > 1 and i == 0:
-                content += f"{indent}# Defined on: {prop.defining_class.name}\n"
-            lines = prop.code.split("\n")[:-1]
-            for line in lines:
-                # TODO: dedent code at source so defined indent isn't tied to
-                # presentation indent
-                content += f"{indent}{line[4:]}\n"
-            content += "\n"
-
-    return content
+                yield f"{indent}# Defined on: {prop.defining_class.name}\n"
+            yield code(prop, indent)
+            yield "\n"
 
 
 def data_descriptors(data_descriptors: dict[str, list[DataDescriptor]], indent) -> str:
+    return "".join(iter_data_descriptors(data_descriptors, indent))
+
+
+def iter_data_descriptors(
+    data_descriptors: dict[str, list[DataDescriptor]], indent
+) -> Iterator[str]:
     """
     KISS to start: display any methods for a dd as a group
     Loop the definitions of each name
     try each of getter, setter, and deleter, outputting them as a method
     """
-    content = ""
     for definitions in data_descriptors.values():
         for i, descriptor in enumerate(definitions):
             for name in ["getter", "setter", "deleter"]:
                 func = getattr(descriptor, name)
 
                 if len(definitions) > 1 and i == 0:
-                    content += f"{indent}# Defined on: {func.defining_class.name}\n"
+                    yield f"{indent}# Defined on: {func.defining_class.name}\n"
+
+                yield code(func, indent)
+                yield "\n"
 
-                lines = func.code.split("\n")[:-1]
-                for line in lines:
-                    # TODO: dedent code at source so defined indent isn't tied
-                    # to presentation indent
-                    content += f"{indent}{line[4:]}\n"
-                content += "\n"
 
-    return content
+def iter_string(
+    structure: Class, indent: str = " " * DEFAULT_INDENT_WIDTH
+) -> Iterator[str]:
+    """
+    Render the given structure as a stream of chunks
+
+    Chunks are yielded per section, or per method, so output can be written as
+    it's rendered rather than built up in memory first.
+    """
+    yield declaration(structure.name, structure.parents, indent)
+    yield "\n"
+    yield docstring(structure.docstring, indent)
+    yield from iter_attributes(structure.attributes, indent)
+    yield "\n"
+    yield from iter_classes(structure.classes, indent)
+    yield from iter_properties(structure.properties, indent)
+    yield from iter_data_descriptors(structure.data_descriptors, indent)
+    yield from iter_methods(structure.methods, indent)
+
+
+def strip_newlines(chunks: Iterable[str]) -> Iterator[str]:
+    """The streaming equivalent of "".join(chunks).strip("\\n")"""
+    started = False
+    pending = ""
+
+    for chunk in chunks:
+        if not started:
+            chunk = chunk.lstrip("\n")  # noqa: PLW2901
+            if not chunk:
+                continue
+            started = True
+
+        # hold back trailing newlines until we know more content follows them
+        stripped = chunk.rstrip("\n")
+        if stripped:
+            yield f"{pending}{stripped}"
+            pending = chunk[len(stripped) :]
+        else:
+            pending += chunk
+
+
+def to_stream(
+    structure: Class, file: TextIO, indent: str = " " * DEFAULT_INDENT_WIDTH
+) -> None:
+    file.writelines(iter_string(structure, indent))
 
 
 def to_string(structure: Class, indent: str = " " * DEFAULT_INDENT_WIDTH) -> str:
-    content = declaration(structure.name, structure.parents, indent)
-    content += "\n"
-    content += docstring(structure.docstring, indent) if docstring else ""
-    content += attributes(structure.attributes, indent)
-    content += "\n"
-    content += classes(structure.classes, indent)
-    content += properties(structure.properties, indent)
-    content += data_descriptors(structure.data_descriptors, indent)
-    content += methods(structure.methods, indent)
-
-    return content
+    return "".join(iter_string(structure, indent))
@@ -0,0 +1,226 @@
+"""
+Render classes as data, as JSON or MessagePack, for other tools to consume
+
+Both formats share a schema, versioned by its "schema" key:
+
+    {
+        "schema": 1,
+        "name": "FormView",
+        "module": "django.views.generic.edit",
+        "docstring": "...",
+        "ancestors": [{"name": ..., "module": ...}, ...],
+        "parents": [{"name": ..., "module": ...}, ...],
+        "attributes": {name: [{"defining_class": ..., "value": "..."}, ...]},
+        "classes": [{"name": ..., ...}, ...],
+        "properties": {name: [method, ...]},
+        "data_descriptors": {name: [{"getter": method, "setter": ..., ...}]},
+        "methods": {name: [method, ...]},
+    }
+
+where each method is:
+
+    {
+        "name": ...,
+        "docstring": ...,
+        "defining_class": {"name": ..., "module": ...},
+        "arguments": "(self, *args, **kwargs)",
+        "file": "/path/to/module.py",
+        "lines": {"start": 10, "end": 20},
+    }
+
+Definitions of a member are listed from the furthest ancestor to the class
+itself, so the last one is the one in effect.  Attribute values which are
+literals or classes are the text the string renderer shows for them, anything
+else is named by its type, eg "<logging.Manager object>", since its text can
+change from run to run (eg with a memory address).  Source isn't included, it
+can be read from the file and lines given.
+
+Structures are written as they're walked, a member at a time, rather than
+building the whole document before writing it out.
+"""
+
+import ast
+import inspect
+import json
+from collections.abc import Iterable, Iterator
+from typing import Any, BinaryIO, TextIO
+
+from attrs import frozen
+
+from ..dataclasses import (
+    Attribute,
+    Class,
+    DataDescriptor,
+    Expression,
+    Method,
+    SimpleClass,
+)
+from .string import attribute_text
+
+
+SCHEMA_VERSION = 1
+
+
+@frozen
+class LazyList:
+    """A list of the given size, whose items are produced as it's written"""
+
+    size: int
+    items: Iterable[Any]
+
+
+@frozen
+class LazyMap:
+    """A map of the given size, whose items are produced as it's written"""
+
+    size: int
+    items: Iterable[tuple[str, Any]]
+
+
+def attribute(definition: Attribute) -> dict:
+    return {
+        "defining_class": simple_class(definition.defining_class),
+        "value": value_text(definition.value),
+    }
+
+
+def data_descriptor(definition: DataDescriptor) -> dict:
+    return {
+        "getter": method(definition.getter),
+        "setter": method(definition.setter),
+        "deleter": method(definition.deleter),
+    }
+
+
+def definitions(members: dict[str, list], serialise) -> LazyMap:
+    return LazyMap(
+        size=len(members),
+        items=((name, [serialise(d) for d in defs]) for name, defs in members.items()),
+    )
+
+
+def document(structure: Class) -> LazyMap:
+    """The given class, along with the version of the schema it follows"""
+    fields = [("schema", SCHEMA_VERSION), *fields_of(structure)]
+    return LazyMap(size=len(fields), items=fields)
+
+
+def fields_of(structure: Class) -> list[tuple[str, Any]]:
+    return [
+        ("name", structure.name),
+        ("module", structure.module),
+        ("docstring", structure.docstring),
+        ("ancestors", [simple_class(a) for a in structure.ancestors]),
+        ("parents", [simple_class(p) for p in structure.parents]),
+        ("attributes", definitions(structure.attributes, attribute)),
+        (
+            "classes",
+            LazyList(
+                size=len(structure.classes),
+                items=(inner_class(c) for c in structure.classes),
+            ),
+        ),
+        ("properties", definitions(structure.properties, method)),
+        ("data_descriptors", definitions(structure.data_descriptors, data_descriptor)),
+        ("methods", definitions(structure.methods, method)),
+    ]
+
+
+def inner_class(structure: Class) -> LazyMap:
+    fields = fields_of(structure)
+    return LazyMap(size=len(fields), items=fields)
+
+
+def method(definition: Method | None) -> dict | None:
+    if definition is None:
+        return None
+
+    return {
+        "name": definition.name,
+        "docstring": definition.docstring,
+        "defining_class": simple_class(definition.defining_class),
+        "arguments": definition.arguments,
+        "file": definition.file,
+        "lines": {
+            "start": definition.lines.start,
+            "end": definition.lines.start + definition.lines.total - 1,
+        },
+    }
+
+
+def simple_class(cls: SimpleClass) -> dict:
+    return {"name": cls.name, "module": cls.module}
+
+
+def value_text(value: Any) -> str:
+    """The text of an attribute's value, which is the same for every run"""
+    # classifying statically keeps the source of the values it can't evaluate
+    stable = isinstance(value, str | Expression) or inspect.isclass(value)
+    if stable or is_literal(value):
+        return attribute_text(value)
+
+    kind = type(value)
+    return f"<{kind.__module__}.{kind.__qualname__} object>"
+
+
+def is_literal(value: Any) -> bool:
+    try:
+        ast.literal_eval(repr(value))
+    except Exception:  # noqa: BLE001
+        return False
+
+    return True
+
+
+def iter_json(node) -> Iterator[str]:
+    """Encode the given node as compact JSON, a piece at a time"""
+    match node:
+        case LazyMap():
+            yield "{"
+            for i, (key, value) in enumerate(node.items):
+                yield f",{json.dumps(key)}:" if i else f"{json.dumps(key)}:"
+                yield from iter_json(value)
+            yield "}"
+        case LazyList():
+            yield "["
+            for i, item in enumerate(node.items):
+                if i:
+                    yield ","
+                yield from iter_json(item)
+            yield "]"
+        case _:
+            yield json.dumps(node, separators=(",", ":"))
+
+
+def to_json(structure: Class, file: TextIO) -> None:
+    """Write the given class to file as a single line of JSON"""
+    file.writelines(iter_json(document(structure)))
+    file.write("\n")
+
+
+def to_msgpack(structure: Class, file: BinaryIO) -> None:
+    """
+    Write the given class to file as MessagePack
+
+    MessagePack objects are self delimiting, so classes can be written one
+    after another to the same file, and read back with msgpack.Unpacker.
+    """
+    import msgpack  # noqa: PLC0415
+
+    packer = msgpack.Packer()
+
+    def pack(node):
+        match node:
+            case LazyMap():
+                file.write(packer.pack_map_header(node.size))
+                for key, value in node.items:
+                    file.write(packer.pack(key))
+                    pack(value)
+            case LazyList():
+                file.write(packer.pack_array_header(node.size))
+                for item in node.items:
+                    pack(item)
+            case _:
+                file.write(packer.pack(node))
+
+    pack(document(structure))
@@ -1,13 +1,28 @@
+import contextlib
+import importlib
 import inspect
 import pydoc
 import sys
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 
 from .exceptions import NotAClassError
 
 
+def add_working_directory() -> None:
+    """
+    Make modules in the working directory importable
+
+    It's only added once, rather than growing sys.path with every class resolved
+    in a long running process.
+    """
+    if "" not in sys.path:
+        sys.path.insert(0, "")
+
+
 def resolve[C](thing: str) -> type[C]:
     """Find the given thing and ensure it's a class"""
-    sys.path.insert(0, "")
+    add_working_directory()
 
     obj, _ = pydoc.resolve(thing)  # ty: ignore[not-iterable]
 
@@ -15,3 +30,48 @@ def resolve[C](thing: str) -> type[C]:
         raise NotAClassError
 
     return obj
+
+
+def resolve_many(paths: Iterable[str]) -> Iterator[tuple[str, type | Exception]]:
+    """
+    Resolve each of the given dotted paths, with the error for those which fail
+
+    Paths are grouped by module, and each module is imported once, in a
+    background thread, ahead of its paths being resolved.  Results are yielded
+    a module at a time, so the caller can classify the classes of one module
+    while the next is still importing.
+
+    Preloading is best effort, modules which fail to import are left for
+    resolve to report.
+    """
+    modules: dict[str, list[str]] = {}
+    for path in paths:
+        modules.setdefault(path.rpartition(".")[0], []).append(path)
+
+    add_working_directory()
+
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="classify-import")
+    try:
+        preloads = {module: executor.submit(preload, module) for module in modules}
+
+        for module, group in modules.items():
+            preloads[module].result()
+
+            for path in group:
+                try:
+                    yield path, resolve(path)
+                except Exception as e:  # noqa: BLE001
+                    yield path, e
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+
+def preload(module: str) -> None:
+    if not module:
+        return
+
+    # anything a module raises, including SystemExit, is left in this thread,
+    # and the module is imported again by resolve, on the caller's thread, as
+    # it would be without preloading
+    with contextlib.suppress(BaseException):
+        importlib.import_module(module)
@@ -0,0 +1,163 @@
+"""
+Index the members of classified classes, to find where each is defined
+
+Batch runs can write an SQLite index (--index) with a row for every member of
+every class, and the definition in effect for it.  --query answers from the
+index alone, so finding which classes define or inherit get_context_data is a
+lookup rather than classifying everything again.
+"""
+
+import contextlib
+import sqlite3
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+from attrs import frozen
+
+from .dataclasses import Attribute, Class, DataDescriptor, Method
+
+
+# stored in the database's user_version, bumped whenever the schema changes
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS members (
+    class TEXT NOT NULL,
+    name TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    defining_class TEXT NOT NULL,
+    file TEXT,
+    line INTEGER,
+    PRIMARY KEY (class, name)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS members_by_name ON members (name);
+"""
+
+KINDS = {
+    "attributes": "attribute",
+    "data_descriptors": "data descriptor",
+    "methods": "method",
+    "properties": "property",
+}
+
+
+@frozen
+class Entry:
+    """A member of a class, and where the definition in effect comes from"""
+
+    cls: str
+    name: str
+    kind: str
+    defining_class: str
+    file: str | None = None
+    line: int | None = None
+
+    @property
+    def is_own(self) -> bool:
+        """Whether the class defines the member itself, or overrides it"""
+        return self.cls == self.defining_class
+
+
+def dotted(cls) -> str:
+    return f"{cls.module}.{cls.name}"
+
+
+def entries(structure: Class) -> Iterator[Entry]:
+    """
+    The member of the given class for each name, as it's defined in effect
+
+    A name can be more than one kind of member across the MRO, eg an attribute
+    overriding an inherited method, so the definition from the class nearest
+    the given one wins, as it does on lookup.
+    """
+    path = dotted(structure)
+
+    # the given class last, so more derived classes have higher ranks
+    ranks = {dotted(c): i for i, c in enumerate(structure.ancestors)}
+    ranks[path] = len(ranks)
+
+    found: dict[str, Entry] = {}
+    for bucket, kind in KINDS.items():
+        for name, definitions in getattr(structure, bucket).items():
+            defining_class, file, line = location(definitions[-1], path)
+            entry = Entry(path, name, kind, defining_class, file, line)
+
+            current = found.get(name)
+            if current is None or ranks.get(defining_class, -1) > ranks.get(
+                current.defining_class, -1
+            ):
+                found[name] = entry
+
+    yield from found.values()
+
+
+def location(
+    definition: Attribute | DataDescriptor | Method, path: str
+) -> tuple[str, str | None, int | None]:
+    """The defining class, file, and line of the given definition"""
+    match definition:
+        case Method():
+            return (
+                dotted(definition.defining_class),
+                definition.file,
+                definition.lines.start,
+            )
+        case DataDescriptor():
+            accessors = [definition.getter, definition.setter, definition.deleter]
+            accessor = next((a for a in accessors if a is not None), None)
+            if accessor is None:
+                return path, None, None
+            return location(accessor, path)
+        case _:
+            return dotted(definition.defining_class), None, None
+
+
+def connect(path: Path) -> sqlite3.Connection:
+    connection = sqlite3.connect(path)
+    (version,) = connection.execute("PRAGMA user_version").fetchone()
+
+    # indexes written with another schema are rebuilt from scratch
+    if version != SCHEMA_VERSION:
+        connection.execute("DROP TABLE IF EXISTS members")
+        connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    connection.executescript(SCHEMA)
+    return connection
+
+
+def write_index(structures: Iterable[Class], path: Path) -> None:
+    """
+    Index the members of the given classes in the SQLite file at path
+
+    Classes already in the index are replaced and the rest are kept, so one
+    index can be built up over several runs, eg incremental ones.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with contextlib.closing(connect(path)) as connection, connection:
+        for structure in structures:
+            connection.execute(
+                "DELETE FROM members WHERE class = ?", (dotted(structure),)
+            )
+            connection.executemany(
+                "INSERT INTO members VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    (e.cls, e.name, e.kind, e.defining_class, e.file, e.line)
+                    for e in entries(structure)
+                ),
+            )
+
+
+def query(path: Path, name: str) -> list[Entry]:
+    """
+    The members of indexed classes matching the given name, by class
+
+    Names can be glob patterns, eg get_*, matched case sensitively.
+    """
+    # opened read only, so a missing index isn't created
+    uri = f"{path.resolve().as_uri()}?mode=ro"
+    with contextlib.closing(sqlite3.connect(uri, uri=True)) as connection:
+        rows = connection.execute(
+            "SELECT * FROM members WHERE name GLOB ? ORDER BY class, name", (name,)
+        ).fetchall()
+
+    return [Entry(*row) for row in rows]
@@ -0,0 +1,213 @@
+import collections
+import hashlib
+import os
+import pydoc
+import threading
+import time
+import webbrowser
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import unquote, urlsplit
+
+import structlog
+from attrs import frozen
+
+from .cache import cached_classify
+from .exceptions import NotAClassError
+from .renderers.html import environment
+from .resolution import resolve
+from .watch import Watcher
+
+
+logger = structlog.get_logger()
+
+
+@frozen
+class Page:
+    content: bytes
+    etag: str
+
+    @classmethod
+    def from_content(cls, content: str) -> "Page":
+        data = content.encode("utf-8")
+        return cls(content=data, etag=f'"{hashlib.sha256(data).hexdigest()}"')
+
+
+class Pages:
+    """
+    An LRU of rendered class pages, by dotted path
+
+    Lookups are locked, but rendering isn't, so a slow import for one browser
+    tab doesn't block another tab from being served a page that's ready.
+
+    Given a watcher, the classes of rendered pages are watched for changes, and
+    pages include a script to reload themselves when they've been changed.
+    """
+
+    def __init__(
+        self,
+        size: int = 128,
+        cache_dir: Path | None = None,
+        watcher: Watcher | None = None,
+    ):
+        self.cache_dir = cache_dir
+        self.size = size
+        self.watcher = watcher
+        self._lock = threading.Lock()
+        self._pages: collections.OrderedDict[str, Page] = collections.OrderedDict()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._pages.clear()
+
+    def discard(self, paths: list[str]) -> None:
+        with self._lock:
+            for path in paths:
+                self._pages.pop(path, None)
+
+    def get(self, path: str) -> Page:
+        with self._lock:
+            if path in self._pages:
+                self._pages.move_to_end(path)
+                return self._pages[path]
+
+        structure = cached_classify(resolve(path), self.cache_dir)
+        template = environment().get_template("web.html")
+        page = Page.from_content(
+            template.render(klass=structure, live_reload=self.watcher is not None)
+        )
+
+        if self.watcher:
+            self.watcher.add(path)
+
+        with self._lock:
+            self._pages[path] = page
+            self._pages.move_to_end(path)
+            while len(self._pages) > self.size:
+                self._pages.popitem(last=False)
+
+        return page
+
+    def paths(self) -> list[str]:
+        with self._lock:
+            return sorted(self._pages)
+
+    def refresh(self) -> None:
+        """Drop pages whose classes have changed, so they're rendered again"""
+        if self.watcher:
+            self.discard(self.watcher.poll())
+
+
+class Handler(BaseHTTPRequestHandler):
+    """Serve /<dotted.path.to.Class> by classifying and rendering it on demand"""
+
+    server: "Server"
+
+    def do_GET(self):
+        self.respond(include_body=True)
+
+    def do_HEAD(self):
+        self.respond(include_body=False)
+
+    def log_message(self, format, *args):  # noqa: A002
+        if not os.environ.get("TEST_MODE", None):  # pragma: no cover
+            super().log_message(format, *args)
+
+    def respond(self, include_body: bool) -> None:
+        path = unquote(urlsplit(self.path).path).strip("/")
+
+        if not path:
+            pages = [(p, f"/{p}") for p in self.server.pages.paths()]
+            content = environment().get_template("index.html").render(pages=pages)
+            page = Page.from_content(content)
+            return self.send_page(page, include_body)
+
+        try:
+            page = self.server.pages.get(path)
+        except Exception as e:  # noqa: BLE001
+            return self.send_failure(path, e)
+
+        if self.headers.get("If-None-Match") == page.etag:
+            return self.send_not_modified(page)
+
+        return self.send_page(page, include_body)
+
+    def send_failure(self, path: str, error: Exception) -> None:
+        """Tell the client why the class at path couldn't be served"""
+        match error:
+            case ImportError():
+                msg = f"Could not import: {path}"
+            case pydoc.ErrorDuringImport():
+                msg = f"Could not import '{path}', the original error was:\n {error}"
+            case NotAClassError():
+                msg = (
+                    f"{path} doesn't look like a class, please specify the path to "
+                    "a class"
+                )
+            case _:
+                # anything else is a class which can't be classified or rendered,
+                # eg because of one of its attribute values
+                logger.error("could not classify", path=path, exc_info=error)
+                reason = str(error) or type(error).__name__
+                msg = f"Could not classify: {path} ({reason})"
+                return self.send_text(HTTPStatus.INTERNAL_SERVER_ERROR, msg)
+
+        return self.send_text(HTTPStatus.NOT_FOUND, msg)
+
+    def send_not_modified(self, page: Page) -> None:
+        self.send_response(HTTPStatus.NOT_MODIFIED)
+        self.send_header("ETag", page.etag)
+        self.end_headers()
+
+    def send_page(self, page: Page, include_body: bool) -> None:
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(page.content)))
+        self.send_header("ETag", page.etag)
+        self.end_headers()
+        self.wfile.write(page.content if include_body else b"")
+
+    def send_text(self, status: HTTPStatus, text: str) -> None:
+        data = text.encode("utf-8")
+
+        self.send_response(status)
+        self.send_header("Content-Type", "text/plain; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+class Server(ThreadingHTTPServer):
+    def __init__(self, address, pages: Pages):
+        super().__init__(address, Handler)
+        self.pages = pages
+
+
+def refresh_forever(pages: Pages, interval: float) -> None:  # pragma: no cover
+    while True:
+        time.sleep(interval)
+        pages.refresh()
+
+
+def run_server(
+    port: int,
+    cache_dir: Path | None = None,
+    watch: bool = False,
+    path: str = "",
+    host: str = "127.0.0.1",
+) -> None:  # pragma: no cover
+    pages = Pages(cache_dir=cache_dir, watcher=Watcher() if watch else None)
+    server = Server((host, port), pages)
+
+    if watch:
+        thread = threading.Thread(
+            target=refresh_forever, args=(pages, 0.5), daemon=True
+        )
+        thread.start()
+
+    if not os.environ.get("TEST_MODE", None):
+        print(f"Serving on {host}, port: {port}")
+        webbrowser.open_new_tab(f"http://localhost:{port}/{path}")
+
+    server.serve_forever()
@@ -0,0 +1,147 @@
+import ast
+import inspect
+import linecache
+from collections.abc import Iterable
+
+
+class SourceIndex:
+    """
+    The line span of every function, indexed by source file
+
+    inspect.getsourcelines re-tokenizes a file from a function's first line on
+    every call, and the same inherited methods are looked up for every subclass.
+    Instead each file is parsed once, recording where each function starts and
+    ends, so later lookups are a dict hit and a slice of linecache's lines.
+    """
+
+    def __init__(self):
+        self._files: dict[str, str | None] = {}
+        self._spans: dict[str, dict[int, int]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def clear(self) -> None:
+        self._files.clear()
+        self._spans.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def forget(self, files: Iterable[str]) -> None:
+        """Drop the spans found in the given files, eg once they've been edited"""
+        for file in files:
+            self._spans.pop(file, None)
+
+    def getsourcefile(self, func) -> str | None:
+        code = getattr(func, "__code__", None)
+        if code is None:
+            return inspect.getsourcefile(func)
+
+        if code.co_filename not in self._files:
+            self._files[code.co_filename] = inspect.getsourcefile(func)
+
+        return self._files[code.co_filename]
+
+    def getlines(self, file: str, start: int, end: int) -> list[str]:
+        """The given (1-indexed, inclusive) lines of a file, via linecache"""
+        return linecache.getlines(file)[start - 1 : end]
+
+    def getsourcelines(self, func) -> tuple[list[str], int]:
+        """A drop in for inspect.getsourcelines"""
+        span = self.locate(func)
+        if span is None:
+            return inspect.getsourcelines(func)
+
+        file, start, end = span
+        return self.getlines(file, start, end), start
+
+    def locate(self, func) -> tuple[str, int, int] | None:
+        """
+        The file, and first and last lines, of the given function's source
+
+        Functions the index can't find (eg without a source file, or defined
+        by exec) give None, leaving inspect to find their source instead.
+        """
+        func = inspect.unwrap(func)
+        code = getattr(func, "__code__", None)
+        file = self.getsourcefile(func) if code is not None else None
+        if file is None:
+            self.misses += 1
+            return None
+
+        start = code.co_firstlineno
+        end = self.end(file, start, func.__globals__)
+        if end is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return file, start, end
+
+    def end(
+        self,
+        file: str,
+        start: int,
+        module_globals: dict | None = None,
+        tree: ast.Module | None = None,
+    ) -> int | None:
+        """
+        The last line of the function starting on the given line of a file
+
+        Callers which have already parsed the file can pass its tree along, so
+        it isn't parsed again.
+        """
+        if file not in self._spans:
+            lines = linecache.getlines(file, module_globals)
+            self._spans[file] = spans(lines, tree)
+
+        return self._spans[file].get(start)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "files": len(self._spans),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+def spans(lines: list[str], tree: ast.Module | None = None) -> dict[int, int]:
+    """
+    Map the first line of each function to its last line
+
+    A function's first line is its first decorator, matching co_firstlineno.
+    Like inspect.getblock, comments trailing the body are part of the function
+    if they're indented at least as far as the body.
+    """
+    if tree is None:
+        try:
+            tree = ast.parse("".join(lines))
+        except (SyntaxError, ValueError):
+            return {}
+
+    found = {}
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.FunctionDef | ast.AsyncFunctionDef):
+            continue
+
+        start = min([node.lineno, *(d.lineno for d in node.decorator_list)])
+        end = node.end_lineno or node.lineno
+
+        # a body on its own lines can be followed by comments which belong to it
+        body = node.body[0]
+        if body.lineno != node.lineno:
+            for number in range(end, len(lines)):
+                line = lines[number]
+                stripped = line.lstrip()
+                if not stripped:
+                    continue
+                if not stripped.startswith("#"):
+                    break
+                if len(line) - len(stripped) >= body.col_offset:
+                    end = number + 1
+
+        found.setdefault(start, end)
+
+    return found
+
+
+sources = SourceIndex()
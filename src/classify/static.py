@@ -0,0 +1,863 @@
+"""
+Classify classes from their source, without importing them
+
+Importing a class runs its module, and every module it imports, which can be
+slow, have side effects, or fail outright without settings or a database.
+Instead modules are found on sys.path and parsed, bases are followed through
+import statements, and each MRO is linearised the way Python does (C3), to
+build the same Class structure as classification.classify.
+
+Without running any code some things can't be known, so:
+ - attribute values are literals, or otherwise the source of their expression
+ - annotations in signatures are shown as written
+ - decorators, other than property and its setters and deleters, are assumed
+   to return the function they're given (eg via functools.wraps)
+ - classes without source (eg builtins) are listed as ancestors, but only the
+   docstrings of builtins are read from them, they contribute no members
+ - metaclasses, and members added to a class other than by its body, are
+   ignored
+"""
+
+import ast
+import builtins
+import collections
+import importlib.machinery
+import inspect
+import linecache
+import pkgutil
+import pydoc
+import re
+import sys
+from importlib.machinery import ModuleSpec
+
+import structlog
+from attrs import evolve, field, frozen
+
+from .dataclasses import (
+    Attribute,
+    Class,
+    DataDescriptor,
+    Expression,
+    Line,
+    Members,
+    Method,
+    SimpleClass,
+)
+from .exceptions import NotAClassError
+from .profiling import profiler
+from .source import sources
+
+
+logger = structlog.get_logger()
+
+
+@frozen
+class External:
+    """A class whose source can't be read, eg a builtin"""
+
+    name: str
+    module: str
+
+
+OBJECT = External(name="object", module="builtins")
+
+# methods Python makes class methods without a decorator
+IMPLICIT_CLASS_METHODS = {"__class_getitem__", "__init_subclass__"}
+
+
+@frozen
+class Import:
+    """A name bound by an import, of a whole module when name is None"""
+
+    module: str
+    name: str | None = None
+
+
+@frozen(eq=False)
+class Alias:
+    """A name bound by assignment, eg View = BaseView"""
+
+    node: ast.expr
+
+
+@frozen(eq=False)
+class Module:
+    name: str
+    file: str
+    package: str
+    tree: ast.Module
+    future_annotations: bool
+    # every binding of each name, with the line it's bound on
+    namespace: dict[str, list[tuple[int, "Binding"]]] = field(factory=dict)
+    stars: list[str] = field(factory=list)
+
+    @property
+    def is_package(self) -> bool:
+        return self.package == self.name
+
+    def bind(self, name: str, line: int, binding: "Binding") -> None:
+        self.namespace.setdefault(name, []).append((line, binding))
+
+    def lookup(self, name: str, before: int | None = None) -> "Binding | None":
+        """The binding of the given name, as it was before the given line"""
+        for line, binding in reversed(self.namespace.get(name, [])):
+            if before is None or line < before:
+                return binding
+
+        return None
+
+
+@frozen(eq=False)
+class SourceClass:
+    """A class statement, along with the class it's nested in, if any"""
+
+    module: Module
+    node: ast.ClassDef
+    parent: "SourceClass | None" = None
+    classes: dict[str, "SourceClass"] = field(factory=dict)
+
+    @property
+    def name(self) -> str:
+        return self.node.name
+
+
+@frozen
+class Property:
+    """The functions a property is built from"""
+
+    getter: ast.FunctionDef | ast.AsyncFunctionDef | None = None
+    setter: ast.FunctionDef | ast.AsyncFunctionDef | None = None
+    deleter: ast.FunctionDef | ast.AsyncFunctionDef | None = None
+
+
+Function = ast.FunctionDef | ast.AsyncFunctionDef
+Binding = Alias | Function | Import | SourceClass
+Target = External | Function | Module | SourceClass
+
+_specs: dict[str, ModuleSpec | None] = {}
+_modules: dict[str, Module | None] = {}
+_mros: dict[External | SourceClass, list[External | SourceClass]] = {}
+_definitions: dict[SourceClass, dict] = {}
+_members: dict[SourceClass, Members] = {}
+_simple_classes: dict[External | SourceClass, SimpleClass] = {}
+_linearising: set[External | SourceClass] = set()
+_looking_up: set[tuple[str, str]] = set()
+
+
+def clear_cache() -> None:
+    """Forget every module parsed, eg when their source has changed"""
+    for cache in [_specs, _modules, _mros, _definitions, _members, _simple_classes]:
+        cache.clear()
+
+
+def find_spec(name: str) -> ModuleSpec | None:
+    """Find the given module, without importing it or its parent packages"""
+    if name in _specs:
+        return _specs[name]
+
+    parent, _, _ = name.rpartition(".")
+    if parent:
+        parent_spec = find_spec(parent)
+        path = parent_spec and parent_spec.submodule_search_locations
+    else:
+        # like resolution.resolve, look in the current directory first
+        path = ["", *sys.path]
+
+    spec = importlib.machinery.PathFinder.find_spec(name, path) if path else None
+
+    _specs[name] = spec
+    return spec
+
+
+def load(name: str) -> Module | None:
+    """Parse the given module, if its source can be found"""
+    if name in _modules:
+        return _modules[name]
+
+    _modules[name] = None
+
+    spec = find_spec(name)
+    file = spec and spec.origin
+    if not file or not file.endswith(".py"):
+        return None
+
+    try:
+        tree = ast.parse("".join(linecache.getlines(file)), file)
+    except (SyntaxError, ValueError):
+        logger.debug("could not parse module", module=name)
+        return None
+
+    profiler.count("modules")
+
+    is_package = spec.submodule_search_locations is not None
+    module = Module(
+        name=name,
+        file=file,
+        package=name if is_package else name.rpartition(".")[0],
+        tree=tree,
+        future_annotations=any(
+            isinstance(node, ast.ImportFrom)
+            and node.module == "__future__"
+            and any(alias.name == "annotations" for alias in node.names)
+            for node in tree.body
+        ),
+    )
+    bind(module, tree.body)
+
+    _modules[name] = module
+    return module
+
+
+def bind(module: Module, statements: list[ast.stmt]) -> None:
+    """Record the names the given top level statements bind in a module"""
+    for statement in statements:
+        match statement:
+            case ast.ClassDef(name=name):
+                module.bind(name, statement.lineno, source_class(module, statement))
+            case ast.FunctionDef(name=name) | ast.AsyncFunctionDef(name=name):
+                module.bind(name, statement.lineno, statement)
+            case ast.Import() | ast.ImportFrom():
+                bind_import(module, statement)
+            case ast.Assign(targets=targets, value=value):
+                for name, expression in assignments(targets, value):
+                    module.bind(name, statement.lineno, Alias(expression))
+            case ast.If(body=body):
+                # eg TYPE_CHECKING or version checks, following the first branch
+                bind(module, body)
+            case ast.Try(body=body, orelse=orelse):
+                bind(module, [*body, *orelse])
+
+
+def assignments(targets: list[ast.expr], value: ast.expr):
+    """
+    The names an assignment binds, with the expression each is bound to
+
+    Unpacking is followed when both sides are written out, eg a, b = 1, 2, but
+    other targets (eg attributes) don't bind names.
+    """
+    sequence = ast.Tuple | ast.List
+    for target in targets:
+        match target:
+            case ast.Name(id=name):
+                yield name, value
+            case ast.Tuple(elts=names) | ast.List(elts=names) if isinstance(
+                value, sequence
+            ) and len(names) == len(value.elts):
+                for name, element in zip(names, value.elts, strict=True):
+                    yield from assignments([name], element)
+
+
+def bind_import(module: Module, statement: ast.Import | ast.ImportFrom) -> None:
+    for alias in statement.names:
+        if isinstance(statement, ast.Import):
+            # import a.b binds a, while import a.b as c binds c to a.b
+            binding = Import(alias.name if alias.asname else alias.name.split(".")[0])
+            name = alias.asname or binding.module
+        elif alias.name == "*":
+            module.stars.append(absolute(module, statement.module, statement.level))
+            continue
+        else:
+            base = absolute(module, statement.module, statement.level)
+            binding = Import(base, alias.name)
+            name = alias.asname or alias.name
+
+        module.bind(name, statement.lineno, binding)
+
+
+def absolute(module: Module, name: str | None, level: int) -> str:
+    """The absolute name of a module imported by the given module"""
+    if not level:
+        return name or ""
+
+    base = module.package
+    for _ in range(level - 1):
+        base = base.rpartition(".")[0]
+
+    return f"{base}.{name}" if name else base
+
+
+def source_class(
+    module: Module, node: ast.ClassDef, parent: SourceClass | None = None
+) -> SourceClass:
+    cls = SourceClass(module=module, node=node, parent=parent)
+
+    for statement in node.body:
+        if isinstance(statement, ast.ClassDef):
+            cls.classes[statement.name] = source_class(module, statement, cls)
+
+    return cls
+
+
+def lookup(module: Module, name: str, before: int | None = None) -> Target | None:
+    """Find what the given name refers to in a module"""
+    # modules can import names from each other, directly or via star imports
+    key = (module.name, name)
+    if key in _looking_up:
+        return None
+
+    _looking_up.add(key)
+    try:
+        binding = module.lookup(name, before)
+        if binding is not None:
+            return bound(binding, module)
+
+        for star in module.stars:
+            star_module = load(star)
+            if star_module and (found := lookup(star_module, name)):
+                return found
+
+        return load(f"{module.name}.{name}") if module.is_package else None
+    finally:
+        _looking_up.discard(key)
+
+
+def bound(binding: Binding, module: Module) -> Target | None:
+    match binding:
+        case Import(module=name, name=None):
+            return load(name)
+        case Import(module=name, name=attr):
+            imported = load(name)
+            if imported and (found := lookup(imported, attr)):
+                return found
+
+            return load(f"{name}.{attr}") or External(name=attr, module=name)
+        case Alias(node=node):
+            return evaluate(node, module)
+        case _:
+            return binding
+
+
+def evaluate(
+    node: ast.expr,
+    module: Module,
+    scope: SourceClass | None = None,
+    before: int | None = None,
+) -> Target | None:
+    """
+    Find what the given expression refers to
+
+    Expressions in a class body (eg the bases of a nested class) can refer to
+    the classes defined before them in that body, as well as the module's names.
+    """
+    match node:
+        case ast.Name(id=name) if scope and name in scope.classes:
+            return scope.classes[name]
+        case ast.Name(id=name):
+            found = lookup(module, name, before)
+            if found is None and inspect.isclass(getattr(builtins, name, None)):
+                found = External(name=name, module="builtins")
+
+            return found
+        case ast.Attribute(value=value, attr=attr):
+            return attribute(evaluate(value, module, scope, before), attr)
+        case ast.Subscript(value=value):
+            # eg Generic[T]
+            return evaluate(value, module, scope, before)
+
+    return None
+
+
+def attribute(target: Target | None, name: str) -> Target | None:
+    """Find the given attribute of a module, or a class nested in a class"""
+    match target:
+        case Module():
+            return lookup(target, name)
+        case SourceClass():
+            return target.classes.get(name)
+
+    return None
+
+
+def resolve(path: str) -> SourceClass:
+    """Find the class at the given dotted path, from its source"""
+    parts = path.split(".")
+
+    for i in range(len(parts), 0, -1):
+        module = load(".".join(parts[:i]))
+        if module is not None:
+            break
+    else:
+        msg = f"No source found for {path}"
+        raise ImportError(msg, name=path)
+
+    target = module
+    for part in parts[i:]:
+        target = attribute(target, part)
+        if target is None:
+            msg = f"{path} isn't defined in {module.file}"
+            raise ImportError(msg, name=path)
+
+    match target:
+        case SourceClass():
+            return target
+        case External():
+            msg = f"No source found for {path}, it's defined in {target.module}"
+            raise ImportError(msg, name=path)
+
+    raise NotAClassError
+
+
+def find_classes(package: str) -> list[str]:
+    """
+    Find the dotted path of every class defined in the given package or module
+
+    Like batch.find_classes, but packages are walked and modules read from
+    source, rather than being imported.
+    """
+    spec = find_spec(package)
+    if spec is None:
+        msg = f"No module named {package!r}"
+        raise ModuleNotFoundError(msg, name=package)
+
+    names = [package]
+    if spec.submodule_search_locations:
+        names.extend(walk(package, spec.submodule_search_locations))
+
+    paths = []
+    for name in names:
+        module = load(name)
+        if module is None:
+            logger.warning("could not parse", module=name)
+            continue
+
+        paths.extend(
+            f"{name}.{attr}"
+            for attr in module.namespace
+            if isinstance(module.lookup(attr), SourceClass) and pydoc.visiblename(attr)
+        )
+
+    return sorted(paths)
+
+
+def walk(package: str, locations: list[str]):
+    """Every module in the given package, recursively, without importing any"""
+    for info in pkgutil.iter_modules(locations, prefix=f"{package}."):
+        yield info.name
+
+        spec = find_spec(info.name) if info.ispkg else None
+        if spec and spec.submodule_search_locations:
+            yield from walk(info.name, spec.submodule_search_locations)
+
+
+def bases(cls: External | SourceClass) -> list[External | SourceClass]:
+    match cls:
+        case External(module="builtins"):
+            # builtins are always loaded, so their real bases can be used
+            obj = getattr(builtins, cls.name)
+            return [
+                External(name=b.__name__, module=b.__module__) for b in obj.__bases__
+            ]
+        case External():
+            return [OBJECT]
+
+    found = [base(cls, node) for node in cls.node.bases]
+    return found or [OBJECT]
+
+
+def base(cls: SourceClass, node: ast.expr) -> External | SourceClass:
+    """The base class the given expression in a class statement refers to"""
+    target = evaluate(node, cls.module, cls.parent, before=cls.node.lineno)
+    if isinstance(target, External | SourceClass):
+        return target
+
+    # name what can't be found (eg a class built by a function call) as best we
+    # can, using the module it was imported from
+    dotted = ast.unparse(node.value if isinstance(node, ast.Subscript) else node)
+    head, _, rest = dotted.partition(".")
+
+    binding = cls.module.lookup(head)
+    if isinstance(binding, Import):
+        head = ".".join(filter(None, [binding.module, binding.name]))
+
+    module, _, name = ".".join(filter(None, [head, rest])).rpartition(".")
+    return External(name=name, module=module or cls.module.name)
+
+
+def mro(cls: External | SourceClass) -> list[External | SourceClass]:
+    """The method resolution order of the given class"""
+    if cls in _mros:
+        return _mros[cls]
+
+    # Python can't run source where a class inherits from itself, but it can be
+    # written, eg two modules importing a class from each other
+    if cls in _linearising:
+        msg = f"{cls.name} inherits from itself"
+        raise TypeError(msg)
+
+    _linearising.add(cls)
+    try:
+        _mros[cls] = linearise(cls, bases(cls))
+    finally:
+        _linearising.discard(cls)
+
+    return _mros[cls]
+
+
+def linearise(cls, direct: list) -> list:
+    """Merge the MROs of the given class' bases, via C3 linearisation"""
+    sequences = [list(mro(b)) for b in direct] + [list(direct)]
+    linearised = [cls]
+
+    while sequences := [s for s in sequences if s]:
+        for sequence in sequences:
+            head = sequence[0]
+            if not any(head in s[1:] for s in sequences):
+                break
+        else:
+            msg = f"Cannot create a consistent MRO for {cls.name}"
+            raise TypeError(msg)
+
+        linearised.append(head)
+        for sequence in sequences:
+            if sequence[0] == head:
+                del sequence[0]
+
+    return linearised
+
+
+def classify(cls: SourceClass) -> Class:
+    """Build the structure of the given class, the same way classify does"""
+    mro_ = [c for c in reversed(mro(cls)) if c != OBJECT]
+
+    attributes = collections.defaultdict(list)
+    classes = []
+    data_descriptors = collections.defaultdict(list)
+    methods = collections.defaultdict(list)
+    properties = collections.defaultdict(list)
+
+    for c in mro_:
+        if isinstance(c, External):
+            continue
+
+        members = classify_members(c)
+
+        for name, attribute in members.attributes:
+            attributes[name].append(attribute)
+
+        classes.extend(members.classes)
+
+        for name, method_ in members.methods:
+            methods[name].append(method_)
+
+        for name, prop in members.properties:
+            properties[name].append(prop)
+
+        for name, descriptor in members.data_descriptors:
+            data_descriptors[name].append(descriptor)
+
+    return Class(
+        name=cls.name,
+        module=cls.module.name,
+        docstring=class_docstring(cls),
+        ancestors=[simple_class(c) for c in mro_[:-1]],
+        parents=[simple_class(b) for b in bases(cls) if b != OBJECT],
+        attributes=dict(sorted(attributes.items())),
+        classes=sorted(classes, key=lambda c: c.name),
+        properties=dict(sorted(properties.items())),
+        data_descriptors=dict(sorted(data_descriptors.items())),
+        methods=dict(sorted(methods.items())),
+    )
+
+
+def classify_members(cls: SourceClass) -> Members:
+    """Classify the members defined directly in the given class' body"""
+    if cls in _members:
+        profiler.count("members_cache_hits")
+        return _members[cls]
+
+    found = definitions(cls)
+    profiler.count("classes")
+    profiler.count("members", len(found))
+
+    buckets = collections.defaultdict(list)
+    for name in sorted(found):
+        if not pydoc.visiblename(name):
+            continue
+
+        match found[name]:
+            case SourceClass() as inner:
+                buckets["classes"].append(classify(inner))
+            case ast.FunctionDef() | ast.AsyncFunctionDef() as node:
+                buckets["methods"].append((name, method(node, cls)))
+            case Property(getter=getter, setter=None, deleter=None):
+                buckets["properties"].append((name, method(getter, cls)))
+            case Property(getter=getter, setter=setter, deleter=deleter):
+                descriptor = DataDescriptor(
+                    name=name,
+                    getter=method(getter, cls),
+                    setter=method(setter, cls),
+                    deleter=method(deleter, cls),
+                )
+                buckets["data_descriptors"].append((name, descriptor))
+            case value:
+                attribute = Attribute(
+                    name=name, defining_class=simple_class(cls), value=value
+                )
+                buckets["attributes"].append((name, attribute))
+
+    _members[cls] = Members(
+        attributes=buckets["attributes"],
+        classes=buckets["classes"],
+        data_descriptors=buckets["data_descriptors"],
+        methods=buckets["methods"],
+        properties=buckets["properties"],
+    )
+    return _members[cls]
+
+
+def definitions(cls: SourceClass) -> dict:
+    """
+    What each name in the given class' body is bound to when it's finished
+
+    Names map to the nested class, function, Property, or attribute value bound
+    to them, with later statements replacing earlier ones, as they do when the
+    body is run.
+    """
+    if cls in _definitions:
+        return _definitions[cls]
+
+    found = {}
+    annotations = {}
+    for statement in cls.node.body:
+        match statement:
+            case ast.ClassDef(name=name):
+                found[name] = cls.classes[name]
+            case ast.FunctionDef() | ast.AsyncFunctionDef():
+                found[statement.name] = function(statement, found)
+            case ast.Assign(targets=targets, value=value):
+                for name, expression in assignments(targets, value):
+                    found[name] = value_of(expression, cls, found)
+            case ast.AnnAssign(target=ast.Name(id=name), annotation=annotation):
+                annotations[name] = annotation_of(annotation, cls.module)
+                if statement.value is not None:
+                    found[name] = value_of(statement.value, cls, found)
+
+    # names Python binds in class bodies itself
+    if annotations:
+        found["__annotations__"] = annotations
+    if "__eq__" in found and "__hash__" not in found:
+        found["__hash__"] = None
+
+    _definitions[cls] = found
+    return found
+
+
+def function(node: Function, found: dict) -> Function | Property:
+    """The function the given def binds, or the property it builds"""
+    if not node.decorator_list:
+        return node
+
+    match node.decorator_list[0]:
+        case ast.Name(id="property"):
+            return Property(getter=node)
+        case ast.Attribute(
+            value=ast.Name(id=name), attr="getter" | "setter" | "deleter" as accessor
+        ) if isinstance(found.get(name), Property):
+            return evolve(found[name], **{accessor: node})
+
+    return node
+
+
+def value_of(node: ast.expr, cls: SourceClass, found: dict):
+    """The value an assignment in the given class' body binds"""
+    match node:
+        case ast.Name(id=name) if isinstance(found.get(name), Function | Property):
+            # eg head = get
+            return found[name]
+        case ast.Call(func=ast.Name(id="property"), args=args):
+            functions = [
+                found.get(a.id) if isinstance(a, ast.Name) else None for a in args
+            ]
+            accessors = [f if isinstance(f, Function) else None for f in functions]
+            return Property(*accessors[:3])
+
+    try:
+        return ast.literal_eval(node)
+    except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
+        pass
+
+    # classes are shown by name, as the other renderers show them
+    target = evaluate(node, cls.module, cls.parent)
+    if isinstance(target, External | SourceClass):
+        return Expression(target.name)
+
+    return Expression(ast.unparse(node))
+
+
+def annotation_of(node: ast.expr, module: Module) -> Expression | str:
+    # postponed annotations are kept as strings
+    if module.future_annotations:
+        return ast.unparse(node)
+
+    return Expression(ast.unparse(node))
+
+
+def method(node: Function | None, cls: SourceClass) -> Method | None:
+    if node is None:
+        return None
+
+    module = cls.module
+    start = min([node.lineno, *(d.lineno for d in node.decorator_list)])
+    end = sources.end(module.file, start, tree=module.tree) or node.end_lineno
+
+    return Method(
+        name=node.name,
+        docstring=method_docstring(node, cls, start),
+        defining_class=simple_class(cls),
+        arguments=signature(node, module),
+        lines=Line(start=start, total=end - start + 1),
+        file=module.file,
+    )
+
+
+def signature(node: Function, module: Module) -> str:
+    """The given function's signature, formatted like inspect.Signature"""
+    args = node.args
+
+    def parameter(arg: ast.arg, default: ast.expr | None = None) -> str:
+        text = arg.arg
+        if arg.annotation:
+            text = f"{text}: {annotation_text(arg.annotation, module)}"
+        if default is not None:
+            separator = " = " if arg.annotation else "="
+            text = f"{text}{separator}{ast.unparse(default)}"
+        return text
+
+    positional = [*args.posonlyargs, *args.args]
+    defaults = [None] * (len(positional) - len(args.defaults)) + args.defaults
+
+    parameters = []
+    for i, (arg, default) in enumerate(zip(positional, defaults, strict=True), 1):
+        parameters.append(parameter(arg, default))
+        if i == len(args.posonlyargs):
+            parameters.append("/")
+
+    if args.vararg:
+        parameters.append(f"*{parameter(args.vararg)}")
+    elif args.kwonlyargs:
+        parameters.append("*")
+
+    parameters.extend(
+        parameter(arg, default)
+        for arg, default in zip(args.kwonlyargs, args.kw_defaults, strict=True)
+    )
+
+    if args.kwarg:
+        parameters.append(f"**{parameter(args.kwarg)}")
+
+    text = f"({', '.join(parameters)})"
+    if node.returns:
+        text = f"{text} -> {annotation_text(node.returns, module)}"
+
+    return text
+
+
+def annotation_text(node: ast.expr, module: Module) -> str:
+    return repr(annotation_of(node, module))
+
+
+def class_docstring(cls: SourceClass) -> str:
+    """
+    The given class' docstring, found the way pydoc.getdoc finds it
+
+    Unlike methods, classes don't inherit docstrings, instead undocumented
+    classes use any comments immediately above them.
+    """
+    doc = ast.get_docstring(cls.node)
+    if doc is not None:
+        return tidy(doc)
+
+    start = min([cls.node.lineno, *(d.lineno for d in cls.node.decorator_list)])
+    return tidy(comments(linecache.getlines(cls.module.file), start))
+
+
+def method_docstring(node: Function, cls: SourceClass, start: int) -> str:
+    """
+    The given method's docstring, found the way pydoc.getdoc finds it
+
+    Undocumented methods inherit the docstring of the method they override,
+    unless they're decorated (other than by staticmethod) or implicitly class
+    methods, otherwise any comments immediately above the method are used.
+    """
+    doc = ast.get_docstring(node, clean=False)
+
+    inherits = node.name not in IMPLICIT_CLASS_METHODS and all(
+        isinstance(d, ast.Name) and d.id == "staticmethod" for d in node.decorator_list
+    )
+    if doc is None and inherits:
+        doc = inherited_docstring(node.name, cls)
+
+    if doc is not None:
+        return tidy(inspect.cleandoc(doc))
+
+    return tidy(comments(linecache.getlines(cls.module.file), start))
+
+
+def inherited_docstring(name: str, cls: SourceClass) -> str | None:
+    for c in mro(cls):
+        match c:
+            case SourceClass():
+                doc = own_docstring(definitions(c).get(name))
+            case External(module="builtins"):
+                doc = builtin_docstring(c, name)
+            case _:
+                doc = None
+
+        if doc is not None:
+            return doc
+
+    return None
+
+
+def own_docstring(definition) -> str | None:
+    match definition:
+        case ast.FunctionDef() | ast.AsyncFunctionDef():
+            return ast.get_docstring(definition, clean=False)
+        case Property(getter=getter) if getter:
+            return ast.get_docstring(getter, clean=False)
+
+    return None
+
+
+def builtin_docstring(cls: External, name: str) -> str | None:
+    # eg object.__init__'s, which every undocumented __init__ inherits
+    value = getattr(getattr(builtins, cls.name), name, None)
+    doc = value.__doc__
+    return None if doc == type(value).__doc__ else doc
+
+
+def comments(lines: list[str], start: int) -> str | None:
+    """The comments immediately above the given line, like inspect.getcomments"""
+    number = start - 1
+    if number <= 0:
+        return None
+
+    indent = inspect.indentsize(lines[number])
+    block = []
+    for line in reversed(lines[:number]):
+        if line.lstrip()[:1] != "#" or inspect.indentsize(line) != indent:
+            break
+        block.insert(0, line.expandtabs().lstrip())
+
+    if not block:
+        return None
+
+    while block and block[0].strip() == "#":
+        del block[0]
+    while block and block[-1].strip() == "#":
+        del block[-1]
+
+    return "".join(block)
+
+
+def tidy(doc: str | None) -> str:
+    # as pydoc.getdoc does
+    return (doc and re.sub("^ *\n", "", doc.rstrip())) or ""
+
+
+def simple_class(cls: External | SourceClass) -> SimpleClass:
+    if cls not in _simple_classes:
+        module = cls.module if isinstance(cls, External) else cls.module.name
+        _simple_classes[cls] = SimpleClass(name=cls.name, module=module)
+
+    return _simple_classes[cls]
@@ -0,0 +1,159 @@
+import importlib
+import inspect
+import linecache
+import sys
+import threading
+import types
+from collections.abc import Iterable, Iterator
+
+import structlog
+
+from .cache import fingerprint, method_files, stamp
+from .classification import classify
+from .resolution import resolve
+from .source import sources
+
+
+logger = structlog.get_logger()
+
+
+def reload_modules(classes: Iterable[type], files: set[str]) -> None:
+    """
+    Reload the modules of the given classes' MROs which are backed by the
+    given files, along with those of every class which inherits from them
+
+    Reloading a base's module creates a new base class, so the modules of its
+    subclasses have to be reloaded after it, to inherit from the new one.
+    Methods can be defined in other modules (eg helper = helpers.helper), so
+    those are reloaded first, and then the class' module, to pick up the new
+    functions.  Modules are only reloaded once, however many classes they back.
+    """
+    reloaded = set()
+
+    def reload(module: str) -> None:
+        if module in reloaded:
+            return
+
+        logger.debug("reloading", module=module)
+        importlib.reload(sys.modules[module])
+        reloaded.add(module)
+
+    for obj in classes:
+        stale = False
+
+        # walk up from the bases so reloaded bases are picked up by subclasses
+        for cls in reversed(inspect.getmro(obj)):
+            helpers = sorted(
+                {
+                    func.__module__
+                    for func in functions(cls)
+                    if func.__module__ in sys.modules
+                    and inspect.getsourcefile(func) in files
+                }
+            )
+            for module in helpers:
+                reload(module)
+
+            try:
+                file = inspect.getsourcefile(cls)
+            except TypeError:
+                continue
+
+            stale = stale or file in files or bool(helpers)
+            if stale:
+                reload(cls.__module__)
+
+
+def functions(cls: type) -> Iterator[types.FunctionType]:
+    """The functions behind the methods, and accessors, defined on a class"""
+    for value in vars(cls).values():
+        if isinstance(value, classmethod | staticmethod):
+            accessors = [value.__func__]
+        elif isinstance(value, property):
+            accessors = [value.fget, value.fset, value.fdel]
+        else:
+            accessors = [value]
+
+        for accessor in accessors:
+            func = inspect.unwrap(accessor) if accessor is not None else None
+            if inspect.isfunction(func):
+                yield func
+
+
+def watched_files(path: str) -> dict[str, list[int]]:
+    """
+    The stamps of the source files behind the given class, including those of
+    methods defined outside of its MRO's modules
+    """
+    obj = resolve(path)
+    return fingerprint(obj) | method_files(classify(obj))
+
+
+class Watcher:
+    """
+    Watch the source files behind classes, reloading them when they change
+
+    Classes are watched by dotted path, as reloading their modules replaces the
+    class objects, which are then found again by resolving their paths.
+    """
+
+    def __init__(self, paths: Iterable[str] = ()):
+        self._lock = threading.Lock()
+        self._stamps: dict[str, dict[str, list[int]]] = {}
+
+        for path in paths:
+            self.add(path)
+
+    def add(self, path: str) -> None:
+        with self._lock:
+            if path not in self._stamps:
+                self._stamps[path] = watched_files(path)
+
+    def poll(self) -> list[str]:
+        """
+        Reload any changes to the watched classes' source files
+
+        Returns the paths of the watched classes which were affected, and so
+        need classifying again.
+        """
+        with self._lock:
+            changed = {
+                file
+                for stamps in self._stamps.values()
+                for file, value in stamps.items()
+                if stamp(file) != value
+            }
+            if not changed:
+                return []
+
+            affected = [p for p, s in self._stamps.items() if changed & s.keys()]
+
+            # the source of methods is read from these, so they have to forget
+            # the old versions of the changed files
+            for file in changed:
+                linecache.checkcache(file)
+            sources.forget(changed)
+
+            # resolve the classes before any reloading changes what's found
+            classes = []
+            for path in affected:
+                try:
+                    classes.append(resolve(path))
+                except Exception:  # noqa: BLE001
+                    logger.warning("could not resolve", path=path)
+
+            try:
+                reload_modules(classes, changed)
+            except Exception as e:  # noqa: BLE001
+                # probably a half finished edit, so wait for the next change
+                logger.warning("could not reload", error=str(e))
+                affected = []
+
+            for path, stamps in self._stamps.items():
+                try:
+                    self._stamps[path] = watched_files(path)
+                except Exception:  # noqa: BLE001
+                    # keep watching the same files until the class is back
+                    self._stamps[path] = {file: stamp(file) for file in stamps}
+
+            return affected
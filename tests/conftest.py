@@ -1,3 +1,5 @@
+import sys
+
 import pytest
 
 from classify.dataclasses import Attribute, Class, Line, Method, SimpleClass
@@ -39,6 +41,37 @@ def method(name, **kwargs):
     )
 
 
+@pytest.fixture
+def hierarchy(tmp_path, monkeypatch):
+    """
+    A small class hierarchy, written to disk so tests can edit its source
+
+    hierarchy_base.Base is inherited by hierarchy_views.Child, while
+    hierarchy_views.Standalone stands alone, with a method defined in
+    hierarchy_helpers.
+    """
+    source = tmp_path / "hierarchy"
+    source.mkdir()
+    (source / "hierarchy_base.py").write_text(
+        "class Base:\n    def one(self):\n        pass\n"
+    )
+    (source / "hierarchy_helpers.py").write_text(
+        "def helper(self):\n    return 'helped'\n"
+    )
+    (source / "hierarchy_views.py").write_text(
+        "from hierarchy_base import Base\n"
+        "from hierarchy_helpers import helper\n\n\n"
+        "class Child(Base):\n    pass\n\n\n"
+        "class Standalone:\n    helper = helper\n"
+    )
+    monkeypatch.syspath_prepend(source)
+
+    yield source
+
+    for name in ["hierarchy_base", "hierarchy_helpers", "hierarchy_views"]:
+        sys.modules.pop(name, None)
+
+
 @pytest.fixture
 def dummy_class():
     return Class(
@@ -46,7 +79,7 @@ def dummy_class():
         module="",
         docstring="",
         ancestors=[],
-        parents=["ParentClass"],
+        parents=[SimpleClass(name="ParentClass", module="")],
         attributes={},
         classes=[
             inner_class("Meta"),
@@ -0,0 +1 @@
+raise Exception("this module cannot be imported")
@@ -0,0 +1,5 @@
+import threading
+
+
+class LockingView:
+    lock = threading.Lock()
@@ -0,0 +1,19 @@
+from tests.dummy_class import DummyParent
+
+
+class _PrivateView:
+    pass
+
+
+class BaseView(DummyParent):
+    template_name = "base.html"
+
+    def get(self):
+        pass
+
+
+class DetailView(BaseView):
+    template_name = "detail.html"
+
+    def get_object(self):
+        pass
@@ -0,0 +1,6 @@
+"""A module which exits as it's imported, eg a script without a main guard"""
+
+import sys
+
+
+sys.exit(1)
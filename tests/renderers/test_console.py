@@ -0,0 +1,73 @@
+import io
+
+import pytest
+from rich.console import Console
+from rich.syntax import Syntax
+
+from classify.classification import classify
+from classify.profiling import profiler
+from classify.renderers import console
+from classify.renderers.console import highlighted, sections, to_console, to_pager
+from classify.renderers.string import to_string
+from classify.resolution import resolve
+
+
+def recording_console():
+    return Console(file=io.StringIO(), width=100, force_terminal=True)
+
+
+@pytest.mark.parametrize(
+    ("chunks", "expected"),
+    [
+        ([], [""]),
+        (["class A:", "\n", "    x = 1\n", "\n"], ["class A:", "    x = 1", "", ""]),
+        (
+            ["    def a():\n        pass", "\n\n    def b():"],
+            ["    def a():\n        pass", "", "    def b():"],
+        ),
+    ],
+)
+def test_sections(chunks, expected):
+    assert list(sections(chunks)) == expected
+    assert "\n".join(sections(chunks)) == "".join(chunks)
+
+
+def test_to_console():
+    highlighted.cache_clear()
+    structure = classify(resolve("tests.dummy_class.DummyClass"))
+    whole = recording_console()
+    whole.print(Syntax(to_string(structure), "python", theme="monokai"))
+
+    profiler.start()
+    try:
+        outputs = []
+        counts = []
+        for _ in range(2):
+            console = recording_console()
+            to_console(structure, "monokai", console=console)
+            outputs.append(console.file.getvalue())
+            counts.append(profiler.counters["console_highlights"])
+    finally:
+        profiler.enabled = False
+
+    # printing section by section looks the same as the whole document
+    assert outputs == [whole.file.getvalue()] * 2
+
+    # the second time round, every section is already highlighted
+    assert counts[0] > 0
+    assert counts[1] == counts[0]
+
+
+@pytest.mark.parametrize("many", [True, False], ids=["classes", "class"])
+def test_to_pager(monkeypatch, many):
+    printed = []
+
+    def recording(structure, theme, console):  # noqa: ARG001
+        printed.append(structure.name)
+
+    monkeypatch.setattr(console, "to_console", recording)
+    structure = classify(resolve("tests.dummy_class.DummyClass"))
+
+    to_pager([structure, structure] if many else structure, "monokai")
+
+    assert printed == (["DummyClass", "DummyClass"] if many else ["DummyClass"])
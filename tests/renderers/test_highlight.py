@@ -0,0 +1,54 @@
+import pytest
+
+from classify.profiling import profiler
+from classify.renderers.highlight import Highlighter, stylesheet
+
+
+CODE = "def one(self):\n    pass\n"
+
+
+@pytest.fixture
+def profiled():
+    profiler.start()
+    yield profiler
+    profiler.enabled = False
+
+
+def test_highlighter(profiled):
+    highlighter = Highlighter()
+
+    html = highlighter(CODE)
+
+    assert '<div class="highlight">' in html
+    assert '<span class="k">def</span>' in html
+    assert highlighter(CODE) == html
+    assert profiled.counters["highlights"] == 1
+
+
+def test_highlighter_with_cache_dir(tmp_path, profiled):
+    first = Highlighter()
+    first.cache_in(tmp_path)
+    html = first(CODE)
+
+    # highlighted source outlives the run which highlighted it
+    second = Highlighter()
+    second.cache_in(tmp_path)
+
+    assert second(CODE) == html
+    assert profiled.counters["highlights"] == 1
+    assert [p.suffix for p in (tmp_path / "highlight").iterdir()] == [".html"]
+
+
+def test_highlighter_without_cache_dir(tmp_path):
+    highlighter = Highlighter()
+    highlighter.cache_in(tmp_path)
+    highlighter.cache_in(None)
+
+    highlighter(CODE)
+
+    assert not (tmp_path / "highlight").exists()
+
+
+def test_stylesheet():
+    assert stylesheet("monokai") != stylesheet()
+    assert ".highlight .k" in stylesheet()
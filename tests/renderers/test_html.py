@@ -1,3 +1,4 @@
+import json
 import subprocess
 import tempfile
 import time
@@ -6,7 +7,16 @@ from pathlib import Path
 import httpx
 import pytest
 
-from classify.renderers.html import resolve_path, to_html
+from classify.classification import classify
+from classify.renderers.html import (
+    Fragments,
+    environment,
+    resolve_path,
+    to_html,
+    to_html_site,
+    write_search,
+)
+from classify.resolution import resolve
 
 
 @pytest.fixture(scope="session")
@@ -37,6 +47,14 @@ def classify_server():
     ds_proc.terminate()
 
 
+def test_environment_is_reused():
+    env = environment()
+
+    assert environment() is env
+    assert env.bytecode_cache is not None
+    assert env.get_template("web.html") is env.get_template("web.html")
+
+
 def test_to_html(dummy_class):
     with tempfile.TemporaryDirectory() as path:
         path = Path(path)  # noqa: PLW2901
@@ -69,3 +87,115 @@ def test_resolve_path_without_path():
         assert path.exists()
 
     assert not path.exists()
+
+
+def test_write_search(tmp_path):
+    parent = classify(resolve("tests.dummy_class.DummyParent"))
+    child = classify(resolve("tests.dummy_class.DummyClass"))
+
+    write_search(tmp_path, [parent, child], None)
+    # rebuilding one page keeps the entries of the site's other pages
+    write_search(
+        tmp_path,
+        [child],
+        [
+            ("tests.dummy_class.DummyClass", "tests.dummy_class.DummyClass.html"),
+            ("tests.dummy_class.DummyParent", "tests.dummy_class.DummyParent.html"),
+        ],
+    )
+
+    search = json.loads((tmp_path / "search.json").read_text())
+    assert list(search["classes"]) == [
+        "tests.dummy_class.DummyClass",
+        "tests.dummy_class.DummyParent",
+    ]
+    parent_entry = search["classes"]["tests.dummy_class.DummyParent"]
+    assert parent_entry["page"] == "tests.dummy_class.DummyParent.html"
+    assert ["one", "method", "tests.dummy_class.DummyParent"] in parent_entry["members"]
+
+
+def test_write_search_with_broken_search(tmp_path):
+    (tmp_path / "search.json").write_text("{")
+    child = classify(resolve("tests.dummy_class.DummyClass"))
+
+    write_search(tmp_path, [child], [("tests.dummy_class.DummyParent", "")])
+
+    search = json.loads((tmp_path / "search.json").read_text())
+    assert list(search["classes"]) == ["tests.dummy_class.DummyClass"]
+
+
+def test_fragments():
+    structure = classify(resolve("tests.dummy_class.DummyClass"))
+    fragments = Fragments(environment().get_template("method.html"))
+    (parent_one, one) = structure.methods["one"]
+
+    key = fragments.key("one", one)
+
+    assert fragments.key("one", one) == key
+    assert fragments.key("one", parent_one) != key
+    assert fragments.bundles_of(structure) == [
+        "tests.dummy_class.DummyClass",
+        "tests.dummy_class.DummyParent",
+    ]
+
+
+def test_to_html_site_with_fragments(tmp_path):
+    child = classify(resolve("tests.dummy_class.DummyClass"))
+    parent = classify(resolve("tests.dummy_class.DummyParent"))
+
+    to_html_site([child, parent], tmp_path, serve=False, port=8000, fragments=True)
+
+    bundle = tmp_path / "fragments" / "tests.dummy_class.DummyParent.js"
+    fragments = Fragments.read(bundle)
+    (key,) = [k for k, html in fragments.items() if "def three" in html]
+
+    # each page references the one copy of an inherited method
+    for page in ["DummyClass", "DummyParent"]:
+        content = (tmp_path / f"tests.dummy_class.{page}.html").read_text()
+        assert f'data-fragment="{key}"' in content
+        assert "def three" not in content
+        assert '<script src="fragments/tests.dummy_class.DummyParent.js">' in content
+
+    # rebuilding some pages keeps the fragments of the rest
+    bundle.write_text(bundle.read_text().replace(key, "kept"))
+    to_html_site(
+        [child],
+        tmp_path,
+        serve=False,
+        port=8000,
+        index=[("tests.dummy_class.DummyClass", "tests.dummy_class.DummyClass.html")],
+        fragments=True,
+    )
+
+    assert set(Fragments.read(bundle)) == {*fragments, "kept"}
+
+
+def test_to_html_site_with_lazy_fragments(tmp_path):
+    structure = classify(resolve("tests.dummy_class.DummyClass"))
+
+    to_html_site([structure], tmp_path, serve=False, port=8000, lazy=True)
+
+    content = (tmp_path / "tests.dummy_class.DummyClass.html").read_text()
+    assert "<summary>def three(self): [DummyParent]</summary>" in content
+    assert "<script src=" not in content
+
+    bundles = list((tmp_path / "fragments").glob("*.js"))
+    assert len(bundles) == sum(len(d) for d in structure.methods.values())
+    for bundle in bundles:
+        (key,) = Fragments.read(bundle)
+        assert bundle.name == f"{key}.js"
+        assert f'data-src="fragments/{key}.js"' in content
+
+    # bundles are named by their content, so existing ones are left alone
+    bundles[0].write_text("kept")
+    to_html_site([structure], tmp_path, serve=False, port=8000, lazy=True)
+
+    assert bundles[0].read_text() == "kept"
+
+
+def test_fragments_read_missing_or_broken(tmp_path):
+    broken = tmp_path / "broken.js"
+    broken.write_text("classifyFragments.add({);\n")
+
+    assert Fragments.read(tmp_path / "missing.js") == {}
+    assert Fragments.read(broken) == {}
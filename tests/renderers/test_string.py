@@ -1,7 +1,20 @@
+import io
+
 import pytest
 
+from classify.classification import classify
 from classify.dataclasses import Attribute, SimpleClass
-from classify.renderers.string import attributes, docstring
+from classify.renderers import string
+from classify.renderers.string import (
+    attributes,
+    docstring,
+    iter_string,
+    strip_newlines,
+    to_stream,
+    to_string,
+)
+
+from ..dummy_class import DummyClass
 
 
 class MyClass:
@@ -44,3 +57,53 @@ def test_attributes(attr, expected):
 
 def test_docstring():
     assert docstring("", indent="    ") == ""
+
+
+@pytest.mark.parametrize(
+    "section", ["attributes", "classes", "data_descriptors", "methods", "properties"]
+)
+def test_sections(section):
+    structure = classify(DummyClass)
+    render = getattr(string, section)
+    iter_section = getattr(string, f"iter_{section}")
+
+    content = render(getattr(structure, section), indent="    ")
+
+    assert content
+    assert content == "".join(iter_section(getattr(structure, section), "    "))
+
+
+def test_iter_string():
+    structure = classify(DummyClass)
+
+    chunks = list(iter_string(structure))
+
+    # methods are yielded individually rather than as one big string
+    assert len(chunks) > len(structure.methods)
+    assert "".join(chunks) == to_string(structure)
+    assert to_string(structure).startswith(
+        'class DummyClass(DummyParent):\n    """\n    The main testing class\n'
+    )
+
+
+@pytest.mark.parametrize(
+    "chunks",
+    [
+        [],
+        ["\n", "\n"],
+        ["\na\n", "\n", "b", "\n\n"],
+        ["a\n\n", "", "\nb\n", "c"],
+    ],
+    ids=["empty", "only-newlines", "surrounded", "interior"],
+)
+def test_strip_newlines(chunks):
+    assert "".join(strip_newlines(chunks)) == "".join(chunks).strip("\n")
+
+
+def test_to_stream():
+    structure = classify(DummyClass)
+    file = io.StringIO()
+
+    to_stream(structure, file)
+
+    assert file.getvalue() == to_string(structure)
@@ -0,0 +1,111 @@
+import io
+import json
+import logging
+
+import msgpack
+import pytest
+
+from classify.classification import classify
+from classify.renderers.structured import (
+    SCHEMA_VERSION,
+    LazyList,
+    LazyMap,
+    iter_json,
+    method,
+    to_json,
+    to_msgpack,
+    value_text,
+)
+
+from ..dummy_class import DummyClass
+
+
+def dummy_json():
+    output = io.StringIO()
+    to_json(classify(DummyClass), output)
+    return output.getvalue()
+
+
+def test_method_with_none():
+    assert method(None) is None
+
+
+def test_to_json():
+    output = dummy_json()
+
+    assert output.endswith("}\n")
+    assert output.count("\n") == 1
+
+    data = json.loads(output)
+    assert data["schema"] == SCHEMA_VERSION
+    assert data["name"] == "DummyClass"
+    assert data["module"] == "tests.dummy_class"
+    assert data["docstring"] == "The main testing class"
+    assert data["parents"] == [{"name": "DummyParent", "module": "tests.dummy_class"}]
+
+    assert data["attributes"]["my_int"] == [
+        {
+            "defining_class": {"name": "DummyClass", "module": "tests.dummy_class"},
+            "value": "7",
+        }
+    ]
+    assert data["attributes"]["my_string"][0]["value"] == '"value"'
+
+    one = data["methods"]["one"]
+    assert [d["defining_class"]["name"] for d in one] == ["DummyParent", "DummyClass"]
+    assert one[-1]["arguments"] == "(self)"
+    assert one[-1]["file"].endswith("dummy_class.py")
+    assert one[-1]["lines"]["start"] <= one[-1]["lines"]["end"]
+    assert "code" not in one[-1]
+
+    descriptor = data["data_descriptors"]["my_data_descriptor"][-1]
+    assert descriptor["getter"]["name"] == "my_data_descriptor"
+    assert descriptor["setter"]["name"] == "my_data_descriptor"
+
+    (meta,) = data["classes"]
+    assert meta["name"] == "Meta"
+    assert "schema" not in meta
+    assert meta["attributes"]["abc"][0]["value"] == "123"
+
+
+class Unrepresentable:
+    def __repr__(self):
+        raise RuntimeError
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("text", '"text"'),
+        (7, "7"),
+        ({"a": [1, None]}, "{'a': [1, None]}"),
+        (DummyClass, "DummyClass"),
+        (logging.Manager(None), "<logging.Manager object>"),
+        (Unrepresentable(), "<tests.renderers.test_structured.Unrepresentable object>"),
+    ],
+    ids=lambda value: type(value).__name__,
+)
+def test_value_text(value, expected):
+    assert value_text(value) == expected
+
+
+def test_iter_json():
+    node = LazyMap(
+        size=2,
+        items=[("a", LazyList(size=2, items=[1, {"b": None}])), ("c", "d")],
+    )
+
+    assert "".join(iter_json(node)) == '{"a":[1,{"b":null}],"c":"d"}'
+
+
+def test_to_msgpack_matches_json():
+    output = io.BytesIO()
+
+    # MessagePack is self delimiting, so several classes can share a stream
+    to_msgpack(classify(DummyClass), output)
+    to_msgpack(classify(DummyClass), output)
+
+    output.seek(0)
+    unpacked = list(msgpack.Unpacker(output))
+    expected = json.loads(dummy_json())
+    assert unpacked == [expected, expected]
@@ -0,0 +1,117 @@
+import io
+
+import pytest
+
+from classify import batch
+from classify.batch import _setup_worker, classify_all, find_classes, read_paths
+
+
+def test_classify_all():
+    structures, failures = classify_all(
+        [
+            "tests.dummy_package.views.DetailView",
+            "tests.dummy_package.views",
+            "tests.import_error.Foo",
+        ]
+    )
+
+    assert [s.name for s in structures] == ["DetailView"]
+    assert failures["tests.dummy_package.views"] == "not a class"
+    assert "tests.import_error.Foo" in failures
+
+
+def test_classify_all_with_failing_class(monkeypatch):
+    def broken(obj, cache_dir):  # noqa: ARG001
+        raise ValueError
+
+    monkeypatch.setattr("classify.batch.cached_classify", broken)
+
+    structures, failures = classify_all(["tests.dummy_class.DummyClass"])
+
+    assert structures == []
+    assert failures == {"tests.dummy_class.DummyClass": "ValueError"}
+
+
+def test_classify_all_with_static():
+    structures, failures = classify_all(
+        ["tests.dummy_package.views.DetailView", "tests.dummy_package.missing.View"],
+        static=True,
+    )
+
+    assert [s.name for s in structures] == ["DetailView"]
+    assert list(failures) == ["tests.dummy_package.missing.View"]
+
+
+def test_classify_all_with_jobs():
+    structures, failures = classify_all(
+        [
+            "tests.dummy_package.views.BaseView",
+            "tests.dummy_package.views.DetailView",
+            "tests.dummy_package.unpicklable.LockingView",
+            "tests.import_error.Foo",
+        ],
+        jobs=2,
+    )
+
+    assert [s.name for s in structures] == ["BaseView", "DetailView", "LockingView"]
+    assert list(failures) == ["tests.import_error.Foo"]
+
+
+def test_classify_all_with_static_and_jobs(monkeypatch):
+    # workers which fail to start fall back to classifying in this process, so
+    # how they're started is recorded instead
+    initargs = []
+    executor = batch.ProcessPoolExecutor
+
+    def recording(**kwargs):
+        initargs.append(kwargs["initargs"])
+        return executor(**kwargs)
+
+    monkeypatch.setattr(batch, "ProcessPoolExecutor", recording)
+
+    structures, failures = classify_all(
+        ["tests.dummy_package.views.BaseView", "tests.dummy_package.views.DetailView"],
+        jobs=2,
+        django_settings="unimportable.settings",
+        static=True,
+    )
+
+    assert [s.name for s in structures] == ["BaseView", "DetailView"]
+    assert failures == {}
+    assert initargs == [(None, False)]
+
+
+@pytest.mark.parametrize(
+    "django_settings",
+    [None, "classify.contrib.django.settings"],
+    ids=["without-django", "with-django"],
+)
+def test_setup_worker(django_settings):
+    _setup_worker(django_settings=django_settings, debug=False)
+
+
+def test_find_classes_with_module():
+    assert find_classes("tests.dummy_package.views") == [
+        "tests.dummy_package.views.BaseView",
+        "tests.dummy_package.views.DetailView",
+    ]
+
+
+def test_find_classes_with_package():
+    assert find_classes("tests.dummy_package") == [
+        "tests.dummy_package.PackageClass",
+        "tests.dummy_package.unpicklable.LockingView",
+        "tests.dummy_package.views.BaseView",
+        "tests.dummy_package.views.DetailView",
+    ]
+
+
+def test_read_paths():
+    file = io.StringIO(
+        "tests.dummy_class.DummyClass\n\n# a comment\n  tests.dummy_class.DummyParent \n"
+    )
+
+    assert read_paths(file) == [
+        "tests.dummy_class.DummyClass",
+        "tests.dummy_class.DummyParent",
+    ]
@@ -0,0 +1,131 @@
+import importlib
+import inspect
+import threading
+
+import pytest
+
+from classify import cache
+from classify.cache import cached_classify, fingerprint, source_classes
+
+from .dummy_class import DummyClass, DummyParent
+
+
+def count_classify(monkeypatch):
+    calls = []
+    original = cache.classify
+
+    def counting_classify(obj):
+        calls.append(obj)
+        return original(obj)
+
+    monkeypatch.setattr(cache, "classify", counting_classify)
+    return calls
+
+
+def test_cached_classify_without_a_directory(monkeypatch):
+    calls = count_classify(monkeypatch)
+
+    cached_classify(DummyClass, cache_dir=None)
+    cached_classify(DummyClass, cache_dir=None)
+
+    assert calls == [DummyClass, DummyClass]
+
+
+def test_cached_classify_hits(monkeypatch, tmp_path):
+    calls = count_classify(monkeypatch)
+
+    first = cached_classify(DummyClass, cache_dir=tmp_path)
+    second = cached_classify(DummyClass, cache_dir=tmp_path)
+
+    assert calls == [DummyClass]
+    assert first == second
+    assert (tmp_path / "tests.dummy_class.DummyClass.pickle").exists()
+
+
+def test_cached_classify_invalidates_on_ancestor_change(
+    hierarchy, monkeypatch, tmp_path
+):
+    calls = count_classify(monkeypatch)
+    cache_dir = tmp_path / "cache"
+
+    child = importlib.import_module("hierarchy_views").Child
+
+    cached_classify(child, cache_dir=cache_dir)
+    cached_classify(child, cache_dir=cache_dir)
+    assert calls == [child]
+
+    (hierarchy / "hierarchy_base.py").write_text("class Base:\n    pass\n")
+
+    cached_classify(child, cache_dir=cache_dir)
+    assert calls == [child, child]
+
+
+def test_cached_classify_invalidates_on_method_file_change(
+    hierarchy, monkeypatch, tmp_path
+):
+    calls = count_classify(monkeypatch)
+    cache_dir = tmp_path / "cache"
+
+    standalone = importlib.import_module("hierarchy_views").Standalone
+
+    cached_classify(standalone, cache_dir=cache_dir)
+    cached_classify(standalone, cache_dir=cache_dir)
+    assert calls == [standalone]
+
+    # helper is defined outside of the MRO's files, but its source is rendered
+    (hierarchy / "hierarchy_helpers.py").write_text("\n\ndef helper(self):\n    pass\n")
+
+    cached_classify(standalone, cache_dir=cache_dir)
+    assert calls == [standalone, standalone]
+
+
+def test_cached_classify_with_unreadable_entry(monkeypatch, tmp_path):
+    calls = count_classify(monkeypatch)
+    (tmp_path / "tests.dummy_class.DummyClass.pickle").write_text("not a pickle")
+
+    cached_classify(DummyClass, cache_dir=tmp_path)
+    cached_classify(DummyClass, cache_dir=tmp_path)
+
+    assert calls == [DummyClass]
+
+
+def test_cached_classify_with_unpicklable_class(monkeypatch, tmp_path):
+    calls = count_classify(monkeypatch)
+    locking = type("Locking", (), {"lock": threading.Lock()})
+
+    cached_classify(locking, cache_dir=tmp_path)
+    cached_classify(locking, cache_dir=tmp_path)
+
+    assert calls == [locking, locking]
+    assert not list(tmp_path.iterdir())
+
+
+def test_fingerprint():
+    files = fingerprint(DummyClass)
+
+    # object is a builtin, and DummyClass.Meta lives in the same file
+    assert list(files) == [inspect.getsourcefile(DummyClass)]
+
+
+@pytest.mark.parametrize(
+    ("file", "expected"),
+    [
+        (None, {}),
+        ("/does/not/exist.py", {"/does/not/exist.py": []}),
+    ],
+    ids=["no-source", "missing-file"],
+)
+def test_fingerprint_without_a_source_file(monkeypatch, file, expected):
+    monkeypatch.setattr(cache.inspect, "getsourcefile", lambda _: file)
+
+    assert fingerprint(DummyParent) == expected
+
+
+def test_source_classes():
+    assert source_classes(DummyClass) == [
+        DummyClass,
+        DummyClass.Meta,
+        object,
+        DummyParent,
+        object,
+    ]
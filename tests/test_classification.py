@@ -1,6 +1,28 @@
+import argparse
+import collections
+import enum
+import gc
+import inspect
+import pathlib
+import types
+import weakref
+
 import pytest
+import structlog
+from django.views.generic import UpdateView
 
-from classify.classification import get_members
+from classify import classification
+from classify.classification import (
+    cache_members,
+    cached_members,
+    classify,
+    classify_members,
+    clear_cache,
+    get_members,
+    get_pydoc_members,
+)
+from classify.dataclasses import Members
+from classify.logs import configure_logging
 
 from .dummy_class import DummyClass, DummyParent
 
@@ -48,3 +70,152 @@ def test_get_members(cls, expected):
     names = [m.name for m in members]
 
     assert names == expected, names
+
+
+def test_classify_members_is_memoised(monkeypatch):
+    clear_cache()
+
+    calls = []
+
+    def counting_get_members(obj):
+        calls.append(obj)
+        return get_members(obj)
+
+    monkeypatch.setattr(classification, "get_members", counting_get_members)
+
+    classify(DummyClass)
+    classify(DummyClass)
+    classify(DummyParent)
+
+    assert calls.count(DummyParent) == 1
+    assert calls.count(DummyClass) == 1
+
+
+def test_classify_members_cache_is_weak():
+    temporary = type("Temporary", (), {"value": 1})
+    ref = weakref.ref(temporary)
+
+    classify_members(temporary)
+    structlog.contextvars.clear_contextvars()
+
+    del temporary
+    gc.collect()
+
+    assert ref() is None
+
+
+def test_classify_members_cache_is_weak_with_self_references():
+    temporary = type("Temporary", (), {"method": lambda self: self})
+    temporary.instance = temporary()
+    temporary.own_class = temporary
+    ref = weakref.ref(temporary)
+
+    assert classify(temporary).attributes["own_class"][0].value is temporary
+    structlog.contextvars.clear_contextvars()
+
+    del temporary
+    gc.collect()
+
+    assert ref() is None
+
+
+def test_classify_members_cache_with_builtins():
+    clear_cache()
+    members = Members(
+        attributes=[], classes=[], data_descriptors=[], methods=[], properties=[]
+    )
+
+    cache_members(int, members)
+
+    assert cached_members(int) is members
+    assert "_classify_members" not in vars(int)
+
+    clear_cache()
+
+    assert cached_members(int) is None
+
+
+@pytest.mark.parametrize("debug", [True, False], ids=["debug", "quiet"])
+def test_classify_members_only_logs_when_debugging(debug):
+    configure_logging(debug)
+    clear_cache()
+    structlog.contextvars.clear_contextvars()
+
+    with structlog.testing.capture_logs() as logs:
+        classify(DummyClass)
+
+    events = {log["event"] for log in logs}
+    context = structlog.contextvars.get_contextvars()
+    structlog.contextvars.clear_contextvars()
+    structlog.reset_defaults()
+
+    if debug:
+        assert events == {
+            "extracting attributes",
+            "extracting classes",
+            "extracting data_descriptors",
+            "extracting methods",
+            "extracting properties",
+        }
+        assert context
+    else:
+        assert events == set()
+        assert context == {}
+
+
+class Raising:
+    """A descriptor which can't be read from the class"""
+
+    def __get__(self, instance, owner):
+        raise AttributeError
+
+
+class WithDynamicAttribute:
+    broken = Raising()
+
+    @types.DynamicClassAttribute
+    def dynamic(self):  # pragma: no cover
+        return 1
+
+    @staticmethod
+    def static():  # pragma: no cover
+        pass
+
+
+class ListingMeta(type):
+    def __dir__(cls):
+        return ["listed"]
+
+
+class Listing(metaclass=ListingMeta):
+    listed = 1
+    unlisted = 2
+
+
+class LookupMeta(type):
+    def __getattr__(cls, name):
+        return name
+
+
+class Lookup(metaclass=LookupMeta):
+    value = 1
+
+
+@pytest.mark.parametrize(
+    "cls",
+    [
+        *inspect.getmro(DummyClass),
+        *inspect.getmro(UpdateView),
+        *inspect.getmro(argparse.ArgumentParser),
+        *inspect.getmro(enum.IntFlag),
+        *inspect.getmro(pathlib.PosixPath),
+        collections.OrderedDict,
+        WithDynamicAttribute,
+        Listing,
+        Lookup,
+        ListingMeta,
+    ],
+    ids=lambda cls: cls.__qualname__,
+)
+def test_get_members_matches_pydoc(cls):
+    assert get_members(cls) == get_pydoc_members(cls)
@@ -0,0 +1,31 @@
+import inspect
+import pickle
+
+from classify.dataclasses import Method, SimpleClass
+
+from .dummy_class import DummyClass, DummyParent
+
+
+square = lambda x: x * x  # noqa: E731
+
+
+def test_method_code_is_read_lazily():
+    method = Method.from_func(DummyParent.one, DummyParent)
+
+    assert method._code is None  # noqa: SLF001
+    assert method.code == "".join(inspect.getsourcelines(DummyParent.one)[0])
+    assert pickle.loads(pickle.dumps(method)).code == method.code
+
+
+def test_method_code_is_kept_when_it_cant_be_read_again():
+    method = Method.from_func(square, DummyClass)
+
+    assert method.code == "square = lambda x: x * x  # noqa: E731\n"
+    assert method.lines.total == 1
+
+
+def test_simple_class_is_shared():
+    assert SimpleClass.from_class(DummyClass) is SimpleClass.from_class(DummyClass)
+    assert SimpleClass.from_class(DummyClass) == SimpleClass(
+        name="DummyClass", module="tests.dummy_class"
+    )
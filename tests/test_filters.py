@@ -0,0 +1,100 @@
+import pytest
+
+from classify import filters
+from classify.classification import classify, clear_cache, get_members
+from classify.dataclasses import Attribute, Class, Member, SimpleClass
+from classify.filters import handle, register
+
+from .dummy_class import DummyClass, DummyParent
+
+
+def member(name, cls=DummyClass):
+    return next(m for m in get_members(cls) if m.name == name)
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    """Register handlers and kinds for a single test"""
+    monkeypatch.setattr(filters, "handlers", dict(filters.handlers))
+    monkeypatch.setattr(filters, "detectors", {})
+    clear_cache()
+
+    yield
+
+    clear_cache()
+
+
+class Field:
+    """A plugin's own kind of member, like an ORM's fields"""
+
+    def __init__(self, column):
+        self.column = column
+
+
+class Model:
+    name = Field("name_column")
+
+
+@pytest.mark.parametrize(
+    ("member", "bucket"),
+    [
+        (member("my_int"), "attributes"),
+        (member("my_class"), "attributes"),
+        (member("Meta"), "classes"),
+        (member("my_data_descriptor", DummyParent), "data_descriptors"),
+        (member("one"), "methods"),
+        (member("class_method"), "methods"),
+        (member("static_method"), "methods"),
+        (member("my_prop", DummyParent), "properties"),
+        (member("__weakref__", DummyParent), None),
+    ],
+    ids=lambda value: getattr(value, "name", value),
+)
+def test_handle(member, bucket):
+    handled = handle(member)
+
+    assert (handled and handled[0]) == bucket
+
+
+def test_handle_builds_items():
+    bucket, (name, attribute) = handle(member("my_int"))
+    assert (bucket, name) == ("attributes", "my_int")
+    assert attribute.value == 7  # noqa: PLR2004
+
+    bucket, inner = handle(member("Meta"))
+    assert bucket == "classes"
+    assert isinstance(inner, Class)
+    assert inner.name == "Meta"
+
+
+def test_handle_unknown_kind():
+    assert handle(Member(name="x", kind="unknown", cls=DummyClass, obj=None)) is None
+
+
+def test_handle_unknown_bucket(registry):  # noqa: ARG001
+    register("static method", lambda m: ("widgets", m.obj))
+
+    with pytest.raises(ValueError, match="unknown bucket: 'widgets'"):
+        handle(member("static_method"))
+
+
+def test_register(registry):  # noqa: ARG001
+    register("static method", lambda _: None)
+
+    assert handle(member("static_method")) is None
+    assert handle(member("one"))[0] == "methods"
+
+
+def test_register_a_kind(registry):  # noqa: ARG001
+    def field(member):
+        attribute = Attribute(
+            name=member.name,
+            defining_class=SimpleClass.from_class(member.cls),
+            value=member.obj.column,
+        )
+        return "attributes", (member.name, attribute)
+
+    register("field", field, detect=lambda value: isinstance(value, Field))
+
+    assert member("name", Model).kind == "field"
+    assert classify(Model).attributes["name"][0].value == "name_column"
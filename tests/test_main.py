@@ -1,9 +1,79 @@
+import io
+import json
+import subprocess
+import sys
 from pathlib import Path
 
+import msgpack
 import pytest
 from click.testing import CliRunner
 
+import classify
+from classify import renderers
+from classify.classification import clear_cache
 from classify.main import run
+from classify.renderers.highlight import stylesheet
+
+
+# importing the CLI took ~190ms when it imported every dependency up front, it
+# now takes ~20ms, this leaves plenty of headroom for slower machines while
+# still catching a heavy import sneaking back in
+STARTUP_BUDGET_US = 100_000
+
+
+def import_times(statement):
+    """Cumulative time, in microseconds, to import each module the statement does"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+
+    times = {}
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+
+    return times
+
+
+@pytest.mark.parametrize(
+    ("statement", "unwanted"),
+    [
+        (
+            "import classify.main",
+            {"attrs", "jinja2", "pydoc", "pygments", "rich", "structlog"},
+        ),
+        ("import classify", {"attrs", "pydoc", "structlog"}),
+        # structlog imports rich itself, so only jinja2 can be avoided here
+        ("from classify.renderers import to_string", {"jinja2"}),
+    ],
+    ids=["cli", "package", "string-renderer"],
+)
+def test_imports_are_lazy(statement, unwanted):
+    imported = {name.split(".")[0] for name in import_times(statement)}
+
+    assert not imported & unwanted
+
+
+@pytest.mark.parametrize(
+    "package", [classify, renderers], ids=["classify", "renderers"]
+)
+def test_lazy_attributes(package):
+    for name in package.__all__:
+        assert getattr(package, name)
+
+    with pytest.raises(AttributeError, match="has no attribute 'missing'"):
+        package.missing  # noqa: B018
+
+
+def test_startup_budget():
+    times = import_times("import classify.main")
+
+    assert times["classify.main"] < STARTUP_BUDGET_US, times["classify.main"]
 
 
 @pytest.mark.parametrize(
@@ -28,6 +98,227 @@ def test_run(invocation):
     assert "DummyClass" in result.output
 
 
+def test_run_with_cache_dir(tmp_path):
+    runner = CliRunner()
+
+    result = runner.invoke(
+        run, ["tests.dummy_class.DummyClass", "--cache-dir", str(tmp_path)]
+    )
+
+    assert result.exit_code == 0
+    assert (tmp_path / "tests.dummy_class.DummyClass.pickle").exists()
+
+
+def test_run_with_from_file(tmp_path):
+    paths = tmp_path / "paths.txt"
+    paths.write_text("tests.dummy_class.DummyClass\ntests.import_error.Foo\n")
+
+    runner = CliRunner()
+
+    result = runner.invoke(run, ["--from-file", str(paths)])
+
+    assert result.exit_code == 0
+    assert "class DummyClass(DummyParent):" in result.output
+    assert "Could not classify: tests.import_error.Foo" in result.output
+
+
+def test_run_with_package_and_html_renderer(tmp_path):
+    runner = CliRunner()
+
+    result = runner.invoke(
+        run,
+        [
+            "--package",
+            "tests.dummy_package",
+            "--renderer",
+            "html",
+            "--output",
+            str(tmp_path),
+            "--jobs",
+            "2",
+        ],
+    )
+
+    assert result.exit_code == 0
+    assert f"Wrote 4 pages, index: {tmp_path / 'index.html'}\n" in result.output
+
+    index = (tmp_path / "index.html").read_text()
+    assert 'href="tests.dummy_package.views.DetailView.html"' in index
+    assert (tmp_path / "tests.dummy_package.views.DetailView.html").exists()
+
+
+def test_run_with_fragments(tmp_path):
+    runner = CliRunner()
+
+    result = runner.invoke(
+        run,
+        [
+            "--package",
+            "tests.dummy_package",
+            "--renderer",
+            "html",
+            "--output",
+            str(tmp_path),
+            "--fragments",
+        ],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert list((tmp_path / "fragments").glob("*.js"))
+
+
+def test_run_with_lazy(tmp_path):
+    runner = CliRunner()
+
+    result = runner.invoke(
+        run,
+        [
+            "--package",
+            "tests.dummy_package",
+            "--renderer",
+            "html",
+            "--output",
+            str(tmp_path),
+            "--lazy",
+        ],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert (
+        "<details"
+        in (tmp_path / "tests.dummy_package.views.DetailView.html").read_text()
+    )
+
+
+def test_run_with_fragments_without_a_site():
+    runner = CliRunner()
+
+    result = runner.invoke(run, ["tests.dummy_class.DummyClass", "--fragments"])
+
+    assert result.exit_code == 2  # noqa: PLR2004
+    assert "--fragments and --lazy need batch mode and --renderer html" in result.output
+
+
+def test_run_with_package_and_html_renderer_without_output():
+    runner = CliRunner()
+
+    result = runner.invoke(
+        run, ["--package", "tests.dummy_package.views", "--renderer", "html"]
+    )
+
+    assert result.exit_code == 0
+    assert result.output.startswith("Wrote 2 pages, index: ")
+
+
+def test_run_with_incremental(hierarchy, tmp_path):
+    paths = tmp_path / "paths.txt"
+    paths.write_text(
+        "hierarchy_base.Base\nhierarchy_views.Child\nhierarchy_views.Standalone\n"
+    )
+    output = tmp_path / "output"
+    invocation = [
+        "--from-file",
+        str(paths),
+        "--renderer",
+        "html",
+        "--output",
+        str(output),
+        "--incremental",
+    ]
+
+    runner = CliRunner()
+
+    result = runner.invoke(run, invocation)
+    assert result.exit_code == 0
+    assert result.output.startswith("Wrote 3 pages")
+
+    result = runner.invoke(run, invocation)
+    assert result.exit_code == 0
+    assert result.output.startswith("Wrote 0 pages")
+
+    (hierarchy / "hierarchy_base.py").write_text("class Base:\n    pass\n")
+    standalone = output / "hierarchy_views.Standalone.html"
+    before = standalone.stat().st_mtime_ns
+
+    result = runner.invoke(run, invocation)
+    assert result.exit_code == 0
+    assert result.output.startswith("Wrote 2 pages")
+    assert standalone.stat().st_mtime_ns == before
+
+    # every page is still in the index, regardless of whether it was rebuilt
+    index = (output / "index.html").read_text()
+    assert 'href="hierarchy_views.Standalone.html"' in index
+
+    # pages built with other options are all rebuilt
+    result = runner.invoke(run, [*invocation, "--html-theme", "monokai"])
+    assert result.exit_code == 0
+    assert result.output.startswith("Wrote 3 pages")
+
+
+def test_run_with_index_and_query(tmp_path):
+    runner = CliRunner()
+    index = str(tmp_path / "classify.sqlite")
+
+    result = runner.invoke(
+        run,
+        ["--package", "tests.dummy_package", "--renderer", "string", "--index", index],
+    )
+    assert result.exit_code == 0, result.output
+    result = runner.invoke(
+        run, ["tests.dummy_class.DummyClass", "--renderer", "string", "--index", index]
+    )
+    assert result.exit_code == 0, result.output
+
+    result = runner.invoke(run, ["--query", "thre*", "--index", index])
+
+    assert result.exit_code == 0, result.output
+    lines = result.output.splitlines()
+    assert lines[0].startswith(
+        "tests.dummy_class.DummyClass.three (method, from tests.dummy_class.DummyParent) "
+    )
+    assert lines[0].endswith("tests/dummy_class.py:19")
+
+    result = runner.invoke(run, ["--query", "my_class", "--index", index])
+
+    assert (
+        result.output == "tests.dummy_class.DummyClass.my_class (attribute, defined)\n"
+    )
+
+
+def test_run_with_query_without_index():
+    runner = CliRunner()
+
+    result = runner.invoke(run, ["--query", "get"])
+
+    assert result.exit_code == 2  # noqa: PLR2004
+    assert "--query needs an --index file" in result.output
+
+
+def test_run_with_incremental_without_output():
+    runner = CliRunner()
+
+    result = runner.invoke(
+        run, ["--package", "tests.dummy_package.views", "--incremental"]
+    )
+
+    assert result.exit_code == 2  # noqa: PLR2004
+    assert "--incremental needs --renderer html and an --output directory" in (
+        result.output
+    )
+
+
+def test_run_with_package_and_pager_renderer():
+    runner = CliRunner()
+
+    result = runner.invoke(
+        run, ["--package", "tests.dummy_package.views", "--renderer", "pager"]
+    )
+
+    assert result.exit_code == 0
+    assert "class BaseView(DummyParent):" in result.output
+    assert "class DetailView(BaseView):" in result.output
+
+
 def test_run_with_html_renderer():
     runner = CliRunner()
 
@@ -40,6 +331,36 @@ def test_run_with_html_renderer():
     assert result.output.startswith("Wrote:")
 
 
+@pytest.mark.parametrize("theme", ["default", "monokai"])
+def test_run_with_html_theme(theme):
+    runner = CliRunner()
+
+    result = runner.invoke(
+        run,
+        [
+            "tests.dummy_class.DummyClass",
+            "--renderer",
+            "html",
+            "--output",
+            "output",
+            "--html-theme",
+            theme,
+        ],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert stylesheet(theme) in Path("output/classify.html").read_text()
+
+
+def test_run_with_unknown_html_theme():
+    runner = CliRunner()
+
+    result = runner.invoke(run, ["tests.dummy_class.DummyClass", "--html-theme", "x"])
+
+    assert result.exit_code == 2  # noqa: PLR2004
+    assert "'x' isn't a Pygments style" in result.output
+
+
 def test_run_with_html_renderer_and_output_set():
     runner = CliRunner()
 
@@ -72,6 +393,28 @@ def test_run_with_import_error():
     )
 
 
+def test_run_with_package_import_error():
+    runner = CliRunner()
+
+    result = runner.invoke(run, ["--package", "tests.import_error"])
+
+    assert result.exit_code == 1
+    assert result.output == (
+        "Could not import 'tests.import_error', the original error was:\n"
+        " this module cannot be imported\n"
+    )
+
+
+@pytest.mark.parametrize("static", [[], ["--static"]])
+def test_run_with_unknown_package(static):
+    runner = CliRunner()
+
+    result = runner.invoke(run, ["--package", "unknown", *static])
+
+    assert result.exit_code == 1
+    assert result.output == "Could not import: unknown\n"
+
+
 def test_run_with_pager_renderer():
     runner = CliRunner()
 
@@ -81,6 +424,202 @@ def test_run_with_pager_renderer():
     assert "DummyClass" in result.output
 
 
+def test_run_without_a_path():
+    runner = CliRunner()
+
+    result = runner.invoke(run, [])
+
+    assert result.exit_code == 2  # noqa: PLR2004
+    assert "Missing argument 'KLASS'." in result.output
+
+
+def test_run_with_serve_and_no_class(monkeypatch):
+    calls = []
+    monkeypatch.setattr(
+        "classify.server.run_server",
+        lambda *args, **kwargs: calls.append((args, kwargs)),
+    )
+
+    runner = CliRunner()
+
+    result = runner.invoke(run, ["--serve", "--port", "8123"])
+
+    assert result.exit_code == 0
+    assert calls == [((8123, None), {"watch": False, "host": "127.0.0.1"})]
+
+
+def test_run_with_serve_and_a_host(monkeypatch):
+    calls = []
+    monkeypatch.setattr(
+        "classify.server.run_server",
+        lambda *args, **kwargs: calls.append((args, kwargs)),
+    )
+
+    runner = CliRunner()
+
+    result = runner.invoke(run, ["--serve", "--host", "0.0.0.0"])
+
+    assert result.exit_code == 0
+    assert calls == [((8000, None), {"watch": False, "host": "0.0.0.0"})]
+
+
+@pytest.mark.parametrize(
+    ("invocation", "host"),
+    [
+        (["tests.dummy_class.DummyClass"], "127.0.0.1"),
+        (["--package", "tests.dummy_package.views", "--host", "0.0.0.0"], "0.0.0.0"),
+    ],
+    ids=["class", "batch"],
+)
+def test_run_with_serve_and_html(monkeypatch, tmp_path, invocation, host):
+    calls = []
+    monkeypatch.setattr(
+        "classify.renderers.html.serve_output",
+        lambda port, **kwargs: calls.append((port, kwargs["host"])),
+    )
+
+    runner = CliRunner()
+
+    result = runner.invoke(
+        run,
+        [*invocation, "--renderer", "html", "--output", str(tmp_path), "--serve"],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert calls == [(8000, host)]
+
+
+def test_run_with_static():
+    runner = CliRunner()
+
+    result = runner.invoke(
+        run, ["tests.dummy_class.DummyClass", "--static", "--renderer", "string"]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "class DummyClass(DummyParent):" in result.output
+
+
+def test_run_with_static_and_package():
+    runner = CliRunner()
+
+    result = runner.invoke(
+        run,
+        ["--package", "tests.dummy_package", "--static", "--renderer", "string"],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "class DetailView(BaseView):" in result.output
+
+
+def test_run_with_static_and_unknown_path():
+    runner = CliRunner()
+
+    result = runner.invoke(run, ["unknown.Thing", "--static"])
+
+    assert result.exit_code == 1
+    assert result.output == "Could not import: unknown.Thing\n"
+
+
+@pytest.mark.parametrize(
+    "invocation",
+    [
+        ["--package", "tests.dummy_package", "--incremental", "--renderer", "html"],
+        ["tests.dummy_class.DummyClass", "--watch"],
+        ["--serve"],
+    ],
+    ids=["incremental", "watch", "serve"],
+)
+def test_run_with_static_and_importing_options(invocation):
+    runner = CliRunner()
+
+    result = runner.invoke(run, [*invocation, "--static", "--output", "output"])
+
+    assert result.exit_code == 2  # noqa: PLR2004
+    assert "--static can't be used with --incremental" in result.output
+
+
+def test_run_with_string_renderer():
+    runner = CliRunner()
+
+    result = runner.invoke(
+        run, ["tests.dummy_class.DummyClass", "--renderer", "string"]
+    )
+
+    assert result.exit_code == 0
+    assert result.output.startswith("class DummyClass(DummyParent):\n")
+
+
+def test_run_with_package_and_string_renderer():
+    runner = CliRunner()
+
+    result = runner.invoke(
+        run, ["--package", "tests.dummy_package.views", "--renderer", "string"]
+    )
+
+    assert result.exit_code == 0
+    assert "class BaseView(DummyParent):" in result.output
+    assert "\nclass DetailView(BaseView):" in result.output
+
+
+def test_run_with_json_renderer():
+    runner = CliRunner()
+
+    result = runner.invoke(run, ["tests.dummy_class.DummyClass", "--renderer", "json"])
+
+    assert result.exit_code == 0
+    assert json.loads(result.output)["name"] == "DummyClass"
+
+
+def test_run_with_package_and_json_renderer():
+    runner = CliRunner()
+
+    result = runner.invoke(
+        run, ["--package", "tests.dummy_package.views", "--renderer", "json"]
+    )
+
+    assert result.exit_code == 0
+    names = [json.loads(line)["name"] for line in result.output.splitlines()]
+    assert "BaseView" in names
+    assert "DetailView" in names
+
+
+def test_run_with_msgpack_renderer():
+    runner = CliRunner()
+
+    result = runner.invoke(
+        run, ["tests.dummy_class.DummyClass", "--renderer", "msgpack"]
+    )
+
+    assert result.exit_code == 0
+    assert msgpack.unpackb(result.stdout_bytes)["name"] == "DummyClass"
+
+
+def test_run_with_package_and_msgpack_renderer():
+    runner = CliRunner()
+
+    result = runner.invoke(
+        run, ["--package", "tests.dummy_package.views", "--renderer", "msgpack"]
+    )
+
+    assert result.exit_code == 0
+    names = [s["name"] for s in msgpack.Unpacker(io.BytesIO(result.stdout_bytes))]
+    assert "BaseView" in names
+    assert "DetailView" in names
+
+
+def test_run_with_msgpack_renderer_without_msgpack(monkeypatch):
+    monkeypatch.setattr("importlib.util.find_spec", lambda _: None)
+    runner = CliRunner()
+
+    result = runner.invoke(
+        run, ["tests.dummy_class.DummyClass", "--renderer", "msgpack"]
+    )
+
+    assert result.exit_code == 2  # noqa: PLR2004
+    assert "install classify[msgpack]" in result.output
+
+
 def test_run_with_unknown_path():
     runner = CliRunner()
 
@@ -100,3 +639,105 @@ def test_run_without_a_class():
         result.output
         == "tests.dummy_class doesn't look like a class, please specify the path to a class\n"
     )
+
+
+def test_run_with_watch(hierarchy, monkeypatch):
+    sleeps = []
+
+    def sleep(interval):
+        sleeps.append(interval)
+        if len(sleeps) == 2:  # noqa: PLR2004
+            (hierarchy / "hierarchy_base.py").write_text(
+                "class Base:\n    def two(self):\n        pass\n"
+            )
+        elif len(sleeps) > 2:  # noqa: PLR2004
+            raise KeyboardInterrupt
+
+    monkeypatch.setattr("time.sleep", sleep)
+
+    runner = CliRunner()
+
+    result = runner.invoke(
+        run, ["hierarchy_views.Child", "--renderer", "string", "--watch"]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "def one" in result.output
+    assert "def two" in result.output
+    assert "Watching hierarchy_views.Child for changes" in result.output
+
+
+@pytest.mark.parametrize(
+    "renderer", [[], ["--renderer", "html"]], ids=["default", "html"]
+)
+def test_run_with_watch_and_serve(monkeypatch, renderer):
+    calls = []
+    monkeypatch.setattr(
+        "classify.server.run_server",
+        lambda *args, **kwargs: calls.append((args, kwargs)),
+    )
+
+    runner = CliRunner()
+
+    result = runner.invoke(
+        run,
+        ["tests.dummy_class.DummyClass", *renderer, "--serve", "--watch"],
+    )
+
+    assert result.exit_code == 0
+    assert calls == [
+        (
+            (8000, None),
+            {
+                "watch": True,
+                "path": "tests.dummy_class.DummyClass",
+                "host": "127.0.0.1",
+            },
+        )
+    ]
+
+
+def test_run_with_watch_and_package():
+    runner = CliRunner()
+
+    result = runner.invoke(run, ["--package", "tests.dummy_package", "--watch"])
+
+    assert result.exit_code == 2  # noqa: PLR2004
+    assert "--watch works with a single class" in result.output
+
+
+def test_run_with_profile():
+    # classify everything again, rather than reusing earlier tests' members
+    clear_cache()
+
+    runner = CliRunner()
+
+    result = runner.invoke(
+        run, ["tests.dummy_class.DummyClass", "--renderer", "string", "--profile"]
+    )
+
+    assert result.exit_code == 0
+    report = json.loads(result.stderr.splitlines()[-1])
+    assert {"import", "classify", "render"} <= report["phases_ms"].keys()
+    assert report["counters"]["members"] > 0
+
+
+def test_run_with_profile_and_batch(tmp_path):
+    runner = CliRunner()
+
+    result = runner.invoke(
+        run,
+        [
+            "--package",
+            "tests.dummy_package",
+            "--renderer",
+            "string",
+            "--profile-output",
+            str(tmp_path),
+        ],
+    )
+
+    assert result.exit_code == 0
+    report = json.loads(result.stderr.splitlines()[-1])
+    assert {"import", "classify", "render"} <= report["phases_ms"].keys()
+    assert (tmp_path / "classify.prof").exists()
@@ -0,0 +1,146 @@
+import importlib
+import json
+
+from classify import manifest as manifest_module
+from classify.classification import classify
+from classify.manifest import FILENAME, Manifest, dependencies
+from classify.resolution import resolve
+
+
+PATHS = [
+    "hierarchy_base.Base",
+    "hierarchy_views.Child",
+    "hierarchy_views.Standalone",
+]
+
+OPTIONS = {"fragments": False, "lazy": False, "theme": "default"}
+
+
+def build(directory, paths):
+    """Record the given paths, and write their pages, like a site build would"""
+    manifest = Manifest.load(directory, OPTIONS)
+    manifest.record({p: classify(resolve(p)) for p in paths}, failures=[])
+    manifest.save()
+
+    for entry in manifest.entries.values():
+        (directory / entry["page"]).write_text("")
+
+    return manifest
+
+
+def test_dependencies(hierarchy):
+    child = importlib.import_module("hierarchy_views").Child
+
+    entry = dependencies(child)
+
+    assert entry["ancestors"] == [
+        "hierarchy_views.Child",
+        "hierarchy_base.Base",
+        "builtins.object",
+    ]
+    assert sorted(entry["files"]) == [
+        str(hierarchy / "hierarchy_base.py"),
+        str(hierarchy / "hierarchy_views.py"),
+    ]
+    assert entry["page"] == "hierarchy_views.Child.html"
+
+
+def test_manifest_index(hierarchy, tmp_path):  # noqa: ARG001
+    manifest = build(tmp_path, PATHS)
+
+    assert manifest.index() == [
+        ("hierarchy_base.Base", "hierarchy_base.Base.html"),
+        ("hierarchy_views.Child", "hierarchy_views.Child.html"),
+        ("hierarchy_views.Standalone", "hierarchy_views.Standalone.html"),
+    ]
+
+
+def test_manifest_load_without_a_manifest(tmp_path):
+    assert Manifest.load(tmp_path, OPTIONS).entries == {}
+
+
+def test_manifest_load_with_an_invalid_manifest(tmp_path):
+    (tmp_path / FILENAME).write_text("{")
+
+    assert Manifest.load(tmp_path, OPTIONS).entries == {}
+
+
+def test_manifest_load_without_a_build(hierarchy, tmp_path):  # noqa: ARG001
+    manifest = build(tmp_path, PATHS)
+    # written before builds were recorded, with pages at the top level
+    (tmp_path / FILENAME).write_text(json.dumps(manifest.entries))
+
+    assert Manifest.load(tmp_path, OPTIONS).entries == {}
+
+
+def test_manifest_stale_with_other_options(hierarchy, tmp_path):  # noqa: ARG001
+    build(tmp_path, PATHS)
+
+    manifest = Manifest.load(tmp_path, OPTIONS | {"lazy": True})
+
+    assert manifest.stale(PATHS) == PATHS
+
+
+def test_manifest_stale_with_another_version(
+    hierarchy, monkeypatch, tmp_path  # noqa: ARG001
+):
+    build(tmp_path, PATHS)
+    monkeypatch.setattr(manifest_module, "version", lambda: "0.0.0")
+
+    assert Manifest.load(tmp_path, OPTIONS).stale(PATHS) == PATHS
+
+
+def test_manifest_prune(hierarchy, tmp_path):  # noqa: ARG001
+    manifest = build(tmp_path, PATHS)
+
+    manifest.prune(["hierarchy_base.Base", "not.built.Before"])
+
+    assert list(manifest.entries) == ["hierarchy_base.Base"]
+
+
+def test_manifest_record_forgets_failures(hierarchy, tmp_path):  # noqa: ARG001
+    manifest = build(tmp_path, PATHS)
+
+    manifest.record({}, failures=["hierarchy_views.Child"])
+
+    assert "hierarchy_views.Child" not in manifest.entries
+
+
+def test_manifest_stale_after_editing_a_base(hierarchy, tmp_path):
+    build(tmp_path, PATHS)
+    assert Manifest.load(tmp_path, OPTIONS).stale(PATHS) == []
+
+    (hierarchy / "hierarchy_base.py").write_text("class Base:\n    pass\n")
+
+    # Base's own page, and that of the class inheriting from it
+    assert Manifest.load(tmp_path, OPTIONS).stale(PATHS) == [
+        "hierarchy_base.Base",
+        "hierarchy_views.Child",
+    ]
+
+
+def test_manifest_stale_after_editing_a_method_file(hierarchy, tmp_path):
+    build(tmp_path, PATHS)
+
+    (hierarchy / "hierarchy_helpers.py").write_text("\n\ndef helper(self):\n    pass\n")
+
+    manifest = Manifest.load(tmp_path, OPTIONS)
+    assert manifest.stale(PATHS) == ["hierarchy_views.Standalone"]
+
+
+def test_manifest_stale_with_a_missing_page(hierarchy, tmp_path):  # noqa: ARG001
+    build(tmp_path, PATHS)
+    (tmp_path / "hierarchy_views.Standalone.html").unlink()
+
+    stale = Manifest.load(tmp_path, OPTIONS).stale(PATHS)
+
+    assert stale == ["hierarchy_views.Standalone"]
+
+
+def test_manifest_stale_with_unknown_paths(hierarchy, tmp_path):  # noqa: ARG001
+    manifest = build(tmp_path, PATHS)
+    manifest.entries["hierarchy_views.Gone"] = manifest.entries[PATHS[0]]
+
+    stale = manifest.stale(["hierarchy_views.Gone", "hierarchy_views.Unseen"])
+
+    assert stale == ["hierarchy_views.Gone", "hierarchy_views.Unseen"]
@@ -0,0 +1,54 @@
+import json
+import tracemalloc
+
+from classify.profiling import Profiler
+
+
+def test_profiler_is_disabled_by_default():
+    profiler = Profiler()
+
+    with profiler.phase("classify"):
+        profiler.count("classes")
+
+    assert profiler.phases == {}
+    assert profiler.counters == {}
+
+
+def test_profiler_records_phases_and_counters(capsys):
+    profiler = Profiler()
+    profiler.start()
+
+    for _ in range(2):
+        with profiler.phase("classify"):
+            profiler.count("classes")
+    profiler.count("members", 3)
+
+    profiler.stop()
+
+    report = json.loads(capsys.readouterr().err)
+    assert report["event"] == "profile"
+    assert list(report["phases_ms"]) == ["classify"]
+    assert report["counters"] == {"classes": 2, "members": 3}
+    assert set(report["sources"]) == {"files", "hits", "misses"}
+
+
+def test_profiler_stop_when_not_started(capsys):
+    Profiler().stop()
+
+    assert capsys.readouterr().err == ""
+
+
+def test_profiler_dumps_profiles(capsys, tmp_path):
+    profiler = Profiler()
+    profiler.start(tmp_path / "profile")
+
+    with profiler.phase("classify"):
+        sorted(range(100))
+
+    profiler.stop()
+
+    report = json.loads(capsys.readouterr().err)
+    assert report["cprofile"] == str(tmp_path / "profile" / "classify.prof")
+    assert report["memory_peak"] > 0
+    assert tracemalloc.Snapshot.load(report["tracemalloc"])
+    assert not tracemalloc.is_tracing()
@@ -0,0 +1,65 @@
+import pydoc
+import sys
+
+import pytest
+
+from classify.exceptions import NotAClassError
+from classify.resolution import resolve, resolve_many
+
+from .dummy_class import DummyClass, DummyParent
+
+
+def test_resolve_leaves_sys_path_alone(monkeypatch):
+    monkeypatch.setattr(sys, "path", [p for p in sys.path if p])
+
+    resolve("tests.dummy_class.DummyClass")
+    before = list(sys.path)
+    resolve("tests.dummy_class.DummyParent")
+
+    assert sys.path == before
+    assert sys.path.count("") == 1
+
+
+def test_resolve_many(hierarchy):  # noqa: ARG001
+    paths = [
+        "hierarchy_views.Child",
+        "tests.dummy_class.DummyClass",
+        "hierarchy_views.Standalone",
+        "tests.dummy_class",
+        "unknown",
+        "tests.dummy_class.DummyParent",
+    ]
+
+    resolved = dict(resolve_many(paths))
+
+    assert list(resolved) == [
+        "hierarchy_views.Child",
+        "hierarchy_views.Standalone",
+        "tests.dummy_class.DummyClass",
+        "tests.dummy_class.DummyParent",
+        "tests.dummy_class",
+        "unknown",
+    ]
+    assert resolved["hierarchy_views.Child"].__name__ == "Child"
+    assert resolved["tests.dummy_class.DummyClass"] is DummyClass
+    assert resolved["tests.dummy_class.DummyParent"] is DummyParent
+    assert isinstance(resolved["tests.dummy_class"], NotAClassError)
+    assert isinstance(resolved["unknown"], ImportError)
+
+
+def test_resolve_many_with_exit_on_import():
+    resolved = dict(resolve_many(["tests.exit_on_import.Foo"]))
+
+    error = resolved["tests.exit_on_import.Foo"]
+    assert isinstance(error, pydoc.ErrorDuringImport)
+    assert error.exc is SystemExit
+
+
+def test_resolve_many_stopped_early(hierarchy):  # noqa: ARG001
+    results = resolve_many(["tests.dummy_class.DummyClass", "hierarchy_views.Child"])
+
+    assert next(results) == ("tests.dummy_class.DummyClass", DummyClass)
+    results.close()
+
+    with pytest.raises(StopIteration):
+        next(results)
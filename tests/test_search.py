@@ -0,0 +1,120 @@
+import sqlite3
+
+import attrs
+
+from classify.classification import classify
+from classify.dataclasses import DataDescriptor
+from classify.resolution import resolve
+from classify.search import Entry, entries, query, write_index
+
+
+def test_entries():
+    structure = classify(resolve("tests.dummy_class.DummyClass"))
+
+    found = {e.name: e for e in entries(structure)}
+
+    one = found["one"]
+    assert one.kind == "method"
+    assert one.is_own
+    assert one.file.endswith("tests/dummy_class.py")
+    assert one.line == 55  # noqa: PLR2004
+
+    three = found["three"]
+    assert not three.is_own
+    assert three.defining_class == "tests.dummy_class.DummyParent"
+
+    assert found["my_data_descriptor"].kind == "data descriptor"
+    assert found["my_data_descriptor"].line == 71  # noqa: PLR2004
+    assert found["my_class"] == Entry(
+        cls="tests.dummy_class.DummyClass",
+        name="my_class",
+        kind="attribute",
+        defining_class="tests.dummy_class.DummyClass",
+    )
+
+
+def test_entries_with_data_descriptor_without_accessors(dummy_class):
+    structure = attrs.evolve(
+        dummy_class,
+        data_descriptors={"empty": [DataDescriptor("empty", None, None, None)]},
+        methods={},
+    )
+
+    assert list(entries(structure)) == [
+        Entry(
+            cls=".MyClass",
+            name="empty",
+            kind="data descriptor",
+            defining_class=".MyClass",
+        )
+    ]
+
+
+class Parent:
+    def overridden(self):  # pragma: no cover
+        pass
+
+    def kept(self):  # pragma: no cover
+        pass
+
+
+class Child(Parent):
+    overridden = True
+
+
+def test_entries_with_attribute_overriding_method():
+    structure = classify(Child)
+
+    found = {e.name: e for e in entries(structure)}
+
+    assert len(found) == len(list(entries(structure)))
+    assert found["overridden"].kind == "attribute"
+    assert found["overridden"].is_own
+    assert found["kept"].kind == "method"
+    assert not found["kept"].is_own
+
+
+def test_write_index_with_attribute_overriding_method(tmp_path):
+    path = tmp_path / "classify.sqlite"
+
+    write_index([classify(Child), classify(Parent)], path)
+
+    assert [(e.cls, e.kind) for e in query(path, "overridden")] == [
+        ("tests.test_search.Child", "attribute"),
+        ("tests.test_search.Parent", "method"),
+    ]
+
+
+def test_write_index_and_query(tmp_path):
+    path = tmp_path / "index" / "classify.sqlite"
+    child = classify(resolve("tests.dummy_class.DummyClass"))
+    parent = classify(resolve("tests.dummy_class.DummyParent"))
+
+    write_index([child, parent], path)
+    # classes written again are replaced, rather than duplicated
+    write_index([parent], path)
+
+    found = query(path, "one")
+    assert [(e.cls, e.defining_class) for e in found] == [
+        ("tests.dummy_class.DummyClass", "tests.dummy_class.DummyClass"),
+        ("tests.dummy_class.DummyParent", "tests.dummy_class.DummyParent"),
+    ]
+
+    assert [e.name for e in query(path, "my_*prop")] == [
+        "my_cached_prop",
+        "my_dj_cached_prop",
+        "my_prop",
+        "my_prop",
+    ]
+    assert query(path, "missing") == []
+
+
+def test_write_index_with_another_schema(tmp_path):
+    path = tmp_path / "classify.sqlite"
+    connection = sqlite3.connect(path)
+    connection.execute("CREATE TABLE members (old TEXT)")
+    connection.close()
+
+    write_index([classify(resolve("tests.dummy_class.DummyParent"))], path)
+
+    assert [e.cls for e in query(path, "one")] == ["tests.dummy_class.DummyParent"]
@@ -0,0 +1,165 @@
+import threading
+
+import httpx
+import pytest
+
+from classify.server import Page, Pages, Server
+from classify.watch import Watcher
+
+
+@pytest.fixture
+def server():
+    server = Server(("127.0.0.1", 0), Pages())
+    # wait for in-flight requests to finish when the server is closed
+    server.daemon_threads = False
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True
+    )
+    thread.start()
+
+    yield server
+
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def client(server):
+    host, port = server.server_address
+    with httpx.Client(base_url=f"http://{host}:{port}") as client:
+        yield client
+
+
+def test_page_from_content():
+    assert Page.from_content("abc") == Page.from_content("abc")
+    assert Page.from_content("abc").etag != Page.from_content("abcd").etag
+
+
+def test_pages_are_least_recently_used():
+    pages = Pages(size=2)
+
+    first = pages.get("tests.dummy_package.views.BaseView")
+    pages.get("tests.dummy_package.views.DetailView")
+    assert pages.get("tests.dummy_package.views.BaseView") is first
+
+    pages.get("tests.dummy_class.DummyParent")
+
+    assert pages.paths() == [
+        "tests.dummy_class.DummyParent",
+        "tests.dummy_package.views.BaseView",
+    ]
+
+    pages.clear()
+    assert pages.paths() == []
+
+
+def test_server_class_page(client):
+    response = client.get("/tests.dummy_class.DummyClass")
+
+    assert response.status_code == 200  # noqa: PLR2004
+    assert response.headers["content-type"] == "text/html; charset=utf-8"
+    assert "class DummyClass" in response.text
+    assert response.headers["etag"]
+
+
+def test_server_class_page_not_modified(client):
+    etag = client.get("/tests.dummy_class.DummyClass").headers["etag"]
+
+    response = client.get(
+        "/tests.dummy_class.DummyClass", headers={"If-None-Match": etag}
+    )
+
+    assert response.status_code == 304  # noqa: PLR2004
+    assert response.headers["etag"] == etag
+    assert response.content == b""
+
+
+def test_server_head(client):
+    response = client.head("/tests.dummy_class.DummyClass")
+
+    assert response.status_code == 200  # noqa: PLR2004
+    assert int(response.headers["content-length"]) > 0
+    assert response.content == b""
+
+
+def test_server_index(client):
+    client.get("/tests.dummy_class.DummyClass")
+
+    response = client.get("/")
+
+    assert response.status_code == 200  # noqa: PLR2004
+    assert 'href="/tests.dummy_class.DummyClass"' in response.text
+
+
+@pytest.mark.parametrize(
+    ("path", "message"),
+    [
+        ("unknown", "Could not import: unknown"),
+        ("tests.import_error.Foo", "Could not import 'tests.import_error.Foo'"),
+        ("tests.dummy_class", "tests.dummy_class doesn't look like a class"),
+    ],
+    ids=["unknown", "import-error", "not-a-class"],
+)
+def test_server_not_found(client, path, message):
+    response = client.get(f"/{path}")
+
+    assert response.status_code == 404  # noqa: PLR2004
+    assert response.text.startswith(message)
+
+
+def test_server_classification_error(client, monkeypatch):
+    def broken(obj, cache_dir):  # noqa: ARG001
+        msg = "broken attribute"
+        raise RuntimeError(msg)
+
+    monkeypatch.setattr("classify.server.cached_classify", broken)
+
+    response = client.get("/tests.dummy_class.DummyClass")
+
+    assert response.status_code == 500  # noqa: PLR2004
+    assert response.text == (
+        "Could not classify: tests.dummy_class.DummyClass (broken attribute)"
+    )
+
+
+def test_pages_refresh_drops_changed_pages(hierarchy):
+    pages = Pages(watcher=Watcher())
+
+    page = pages.get("hierarchy_views.Child")
+    pages.get("hierarchy_views.Standalone")
+    assert b"live-reload" in page.content
+
+    pages.refresh()
+    assert pages.get("hierarchy_views.Child") is page
+
+    (hierarchy / "hierarchy_base.py").write_text(
+        "class Base:\n    def two(self):\n        pass\n"
+    )
+    pages.refresh()
+
+    assert pages.paths() == ["hierarchy_views.Standalone"]
+    assert b"def two" in pages.get("hierarchy_views.Child").content
+
+
+def test_pages_refresh_after_editing_a_method_module(hierarchy):
+    pages = Pages(watcher=Watcher())
+
+    assert b"helped" in pages.get("hierarchy_views.Standalone").content
+
+    (hierarchy / "hierarchy_helpers.py").write_text(
+        "def helper(self):\n    return 'changed helper'\n"
+    )
+    pages.refresh()
+
+    content = pages.get("hierarchy_views.Standalone").content
+    assert b"changed helper" in content
+
+
+def test_pages_refresh_without_a_watcher():
+    pages = Pages()
+
+    page = pages.get("tests.dummy_class.DummyClass")
+    pages.refresh()
+
+    assert b"live-reload" not in page.content
+    assert pages.paths() == ["tests.dummy_class.DummyClass"]
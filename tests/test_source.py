@@ -0,0 +1,94 @@
+import importlib
+import inspect
+import sys
+
+import pytest
+
+from classify.source import SourceIndex, spans
+
+from .dummy_class import DummyClass, DummyParent
+
+
+def test_getsourcefile_without_code():
+    index = SourceIndex()
+
+    assert index.getsourcefile(DummyClass) == inspect.getsourcefile(DummyClass)
+
+
+@pytest.mark.parametrize(
+    "func",
+    [
+        DummyClass.__init__,
+        DummyClass.four,
+        DummyClass.my_prop.fget,
+        DummyClass.class_method,
+        DummyParent.one,
+    ],
+    ids=["init", "decorated", "property", "classmethod", "parent"],
+)
+def test_getsourcelines_matches_inspect(func):
+    index = SourceIndex()
+
+    assert index.getsourcelines(func) == inspect.getsourcelines(func)
+    assert index.getsourcefile(func) == inspect.getsourcefile(func)
+
+
+def test_getsourcelines_with_trailing_comments(tmp_path, monkeypatch):
+    # written out, as formatters would indent the under-indented comment
+    (tmp_path / "trailing_comments.py").write_text(
+        "def with_trailing_comment():\n"
+        '    """Only exists for its source"""\n'
+        "    # this comment is part of the function\n"
+        "\n"
+        "    # and so is this one, after a blank line\n"
+        "  # but not this one\n"
+        "    # while this one is, it's back at the body's indentation\n"
+    )
+    monkeypatch.syspath_prepend(tmp_path)
+    module = importlib.import_module("trailing_comments")
+    monkeypatch.delitem(sys.modules, "trailing_comments")
+    func = module.with_trailing_comment
+
+    index = SourceIndex()
+
+    assert index.getsourcelines(func) == inspect.getsourcelines(func)
+
+
+def test_getsourcelines_falls_back_to_inspect():
+    index = SourceIndex()
+    func = lambda: None  # noqa: E731
+
+    assert index.getsourcelines(func) == inspect.getsourcelines(func)
+    assert index.getsourcelines(DummyParent) == inspect.getsourcelines(DummyParent)
+    assert index.stats() == {"files": 1, "hits": 0, "misses": 2}
+
+
+def test_getsourcelines_is_indexed_once_per_file():
+    index = SourceIndex()
+
+    index.getsourcelines(DummyClass.one)
+    index.getsourcelines(DummyClass.two)
+    index.getsourcelines(DummyParent.one)
+
+    assert index.stats() == {"files": 1, "hits": 3, "misses": 0}
+
+    index.clear()
+
+    assert index.stats() == {"files": 0, "hits": 0, "misses": 0}
+
+
+def test_spans():
+    lines = [
+        "@decorator\n",
+        "def one():\n",
+        "    pass\n",
+        "\n",
+        "def two(): pass\n",
+        "    # not part of two, it has no indented body\n",
+    ]
+
+    assert spans(lines) == {1: 3, 5: 5}
+
+
+def test_spans_with_invalid_source():
+    assert spans(["def broken(:\n"]) == {}
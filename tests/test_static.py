@@ -0,0 +1,462 @@
+import io
+import json
+import sys
+import textwrap
+
+import pytest
+
+from classify import static
+from classify.classification import classify
+from classify.dataclasses import Expression
+from classify.exceptions import NotAClassError
+from classify.renderers.structured import to_json
+from classify.resolution import resolve
+
+
+MODULES = {
+    "static_base.py": '''
+        class Base:
+            """The base"""
+
+            name = "base"
+
+            def get(self, request, *args, **kwargs):
+                """Handle GET"""
+
+            async def post(self, request, /, data=None, *, strict: bool = False) -> None:
+                pass
+
+
+        class Mixin:
+            def get(self, request, *args, **kwargs):
+                pass
+
+            def __eq__(self, other):
+                return True
+    ''',
+    "static_views.py": '''
+        """Views to classify"""
+
+        import functools
+
+        import static_base
+        from static_base import *
+        from static_base import Base as Base_
+
+        try:
+            from static_base import Mixin
+        except ImportError:
+            Mixin = None
+
+        if True:
+            Alias = Base_
+
+
+        def decorate(f):
+            @functools.wraps(f)
+            def wrapper(*args, **kwargs):
+                return f(*args, **kwargs)
+
+            return wrapper
+
+
+        # a view built on both bases
+        #
+        class View(Mixin, static_base.Base):
+            other = Alias
+            items = ["a", "b"]
+            first, (second, third) = 1, (2, 3)
+
+            class Inner(Mixin):
+                pass
+
+            def get(self, request, *args, **kwargs):
+                return super().get(request)
+
+            head = get
+
+            # comments make undecorated methods' docstrings
+            @decorate
+            def put(self, request):
+                pass
+
+            @property
+            def prop(self):
+                """A property"""
+
+            @property
+            def descriptor(self):
+                pass
+
+            @descriptor.setter
+            def descriptor(self, value):
+                pass
+
+            @descriptor.deleter
+            def descriptor(self):
+                pass
+
+            size = property(get)
+
+            @staticmethod
+            def make(*values, **options):
+                pass
+
+            @classmethod
+            def build(cls, value=-1, *, key):
+                pass
+
+            def __init_subclass__(cls, **kwargs):
+                pass
+
+            def _private(self):
+                pass
+
+
+        class Child(View):
+            def get(self, request, *args, **kwargs):
+                pass
+
+            def prop(self):
+                pass
+
+
+        class Starred(Base):
+            pass
+    ''',
+}
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    static.clear_cache()
+    yield
+    static.clear_cache()
+
+
+@pytest.fixture
+def source(tmp_path, monkeypatch):
+    """Write the given modules, by filename, somewhere importable"""
+    names = []
+
+    def write(modules):
+        for filename, content in modules.items():
+            path = tmp_path / filename
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(textwrap.dedent(content).lstrip())
+            names.append(filename.removesuffix(".py").replace("/", "."))
+
+        return tmp_path
+
+    monkeypatch.syspath_prepend(tmp_path)
+
+    yield write
+
+    for name in names:
+        sys.modules.pop(name.removesuffix(".__init__"), None)
+
+
+def as_json(structure):
+    output = io.StringIO()
+    to_json(structure, output)
+    return json.loads(output.getvalue())
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        "tests.dummy_class.DummyClass",
+        "tests.dummy_class.DummyParent",
+        "tests.dummy_package.views.DetailView",
+        "static_views.View",
+        "static_views.Child",
+        "static_views.Starred",
+    ],
+)
+def test_classify_matches_classification(source, path):
+    source(MODULES)
+
+    # classifying by importing is the oracle
+    expected = as_json(classify(resolve(path)))
+
+    assert as_json(static.classify(static.resolve(path))) == expected
+
+
+def test_classify_doesnt_import(source):
+    source(MODULES)
+
+    static.classify(static.resolve("static_views.Child"))
+
+    assert "static_views" not in sys.modules
+    assert "static_base" not in sys.modules
+
+
+def test_classify_with_values_which_need_running(source):
+    source(
+        {
+            "values.py": """
+                from __future__ import annotations
+
+                class Settings:
+                    count: int = 2
+                    label: str
+                    computed = 80 * 8
+                    unpacked, = values = compute()
+
+                    def get(self, value: int = 1) -> str:
+                        pass
+
+                    writer = property(None, get)
+            """
+        }
+    )
+
+    structure = static.classify(static.resolve("values.Settings"))
+
+    attributes = {name: defs[-1].value for name, defs in structure.attributes.items()}
+    assert attributes == {
+        "__annotations__": {"count": "int", "label": "str"},
+        "computed": Expression("80 * 8"),
+        "count": 2,
+        "values": Expression("compute()"),
+    }
+    assert str(attributes["computed"]) == "80 * 8"
+    assert structure.methods["get"][0].arguments == "(self, value: 'int' = 1) -> 'str'"
+
+    (writer,) = structure.data_descriptors["writer"]
+    assert writer.getter is None
+    assert writer.setter.name == "get"
+
+
+def test_classify_with_annotations(source):
+    source({"annotated.py": "class Point:\n    x: int\n    y: int = 0\n"})
+
+    structure = static.classify(static.resolve("annotated.Point"))
+
+    assert repr(structure.attributes["__annotations__"][0].value) == (
+        "{'x': int, 'y': int}"
+    )
+
+
+def test_classify_with_bases_without_source(source):
+    source(
+        {
+            "externals.py": """
+                import missing
+                from missing import Other
+
+                class Error(ValueError):
+                    def __init__(self):
+                        pass
+
+                class Thing(missing.Base, Other):
+                    def run(self):
+                        pass
+
+                class Built(make_base()):
+                    pass
+            """
+        }
+    )
+
+    error = static.classify(static.resolve("externals.Error"))
+    assert [(a.module, a.name) for a in error.ancestors] == [
+        ("builtins", "BaseException"),
+        ("builtins", "Exception"),
+        ("builtins", "ValueError"),
+    ]
+    assert error.methods["__init__"][0].docstring == (
+        "Initialize self.  See help(type(self)) for accurate signature."
+    )
+
+    thing = static.classify(static.resolve("externals.Thing"))
+    assert thing.methods["run"][0].docstring == ""
+    assert [(p.module, p.name) for p in thing.parents] == [
+        ("missing", "Base"),
+        ("missing", "Other"),
+    ]
+
+    built = static.classify(static.resolve("externals.Built"))
+    assert [(p.module, p.name) for p in built.parents] == [("externals", "make_base()")]
+
+
+def test_classify_with_nested_bases(source):
+    source(
+        {
+            "nested.py": """
+                class Outer:
+                    class Inner:
+                        pass
+
+                    class Nested(Inner):
+                        pass
+
+                class Other(Outer.Inner[int]):
+                    pass
+            """
+        }
+    )
+
+    outer = static.classify(static.resolve("nested.Outer"))
+    assert [c.name for c in outer.classes] == ["Inner", "Nested"]
+    assert [a.name for a in outer.classes[1].ancestors] == ["Inner"]
+
+    nested = static.classify(static.resolve("nested.Outer.Nested"))
+    assert nested.name == "Nested"
+
+    other = static.classify(static.resolve("nested.Other"))
+    assert [a.name for a in other.ancestors] == ["Inner"]
+
+
+def test_classify_with_redefined_name(source):
+    source(
+        {
+            "redefined.py": """
+                from static_base import Base
+
+                class Base(Base):
+                    pass
+            """,
+            **MODULES,
+        }
+    )
+
+    structure = static.classify(static.resolve("redefined.Base"))
+
+    assert [(a.module, a.name) for a in structure.ancestors] == [
+        ("static_base", "Base")
+    ]
+
+
+def test_classify_with_packages(source):
+    source(
+        {
+            "pkg/__init__.py": "from .views import View\n",
+            "pkg/base.py": "class Base:\n    pass\n",
+            "pkg/views.py": """
+                from . import base
+                from .. import static_base
+                import pkg.sub.deep as deep
+
+                class View(base.Base, deep.Deep):
+                    pass
+
+                class Other(static_base.Mixin):
+                    pass
+            """,
+            "pkg/sub/__init__.py": "",
+            "pkg/sub/deep.py": "class Deep:\n    pass\n",
+            **MODULES,
+        }
+    )
+
+    structure = static.classify(static.resolve("pkg.View"))
+
+    assert [f"{a.module}.{a.name}" for a in structure.ancestors] == [
+        "pkg.sub.deep.Deep",
+        "pkg.base.Base",
+    ]
+
+
+def test_classify_with_inconsistent_mro(source):
+    source(
+        {
+            "inconsistent.py": """
+                class A:
+                    pass
+
+                class B(A):
+                    pass
+
+                class C(A, B):
+                    pass
+            """
+        }
+    )
+
+    with pytest.raises(TypeError, match="consistent MRO for C"):
+        static.classify(static.resolve("inconsistent.C"))
+
+
+def test_classify_with_circular_inheritance(source):
+    source(
+        {
+            "circle_a.py": "from circle_b import B\n\nclass A(B):\n    pass\n",
+            "circle_b.py": "from circle_a import A\n\nclass B(A):\n    pass\n",
+        }
+    )
+
+    with pytest.raises(TypeError, match="inherits from itself"):
+        static.classify(static.resolve("circle_a.A"))
+
+
+def test_comments():
+    lines = ["x = 1\n", "#\n", "    # one\n", "# two\n", "#\n", "class A:\n"]
+
+    assert static.comments(lines, 1) is None
+    assert static.comments(lines, 6) == "# two\n"
+    assert static.comments(lines, 2) is None
+    assert static.comments(["#\n", "# one\n", "class A:\n"], 3) == "# one\n"
+
+
+@pytest.mark.parametrize(
+    ("path", "error"),
+    [
+        ("missing_module.Thing", ImportError),
+        ("static_views.Missing", ImportError),
+        ("static_views.decorate", NotAClassError),
+        ("static_views.static_base", NotAClassError),
+        ("circular.Thing", ImportError),
+        ("broken.Thing", ImportError),
+        ("_decimal.Decimal", ImportError),
+        ("externals.Other", ImportError),
+    ],
+)
+def test_resolve_errors(source, path, error):
+    source(
+        {
+            "broken.py": "class Thing(:\n",
+            "circular.py": "from circular_other import Thing\n",
+            "circular_other.py": "from circular import Thing\n",
+            "externals.py": "from missing import Other\n",
+            **MODULES,
+        }
+    )
+
+    with pytest.raises(error):
+        static.resolve(path)
+
+
+def test_find_classes(source):
+    source(
+        {
+            "found/__init__.py": "class Top:\n    pass\n",
+            "found/broken.py": "class Thing(:\n",
+            "found/views.py": "from .other import Imported\n\nclass View:\n    pass\n"
+            "\nclass _Private:\n    pass\n",
+            "found/other.py": "class Imported:\n    pass\n",
+            "found/sub/__init__.py": "",
+            "found/sub/deep.py": "class Deep:\n    pass\n",
+        }
+    )
+
+    assert static.find_classes("found") == [
+        "found.Top",
+        "found.other.Imported",
+        "found.sub.deep.Deep",
+        "found.views.View",
+    ]
+
+
+def test_find_classes_in_module(source):
+    source(MODULES)
+
+    assert static.find_classes("static_base") == [
+        "static_base.Base",
+        "static_base.Mixin",
+    ]
+
+
+def test_find_classes_missing_package():
+    with pytest.raises(ModuleNotFoundError):
+        static.find_classes("missing_package")
@@ -0,0 +1,152 @@
+import functools
+
+import pytest
+
+from classify.classification import classify
+from classify.exceptions import NotAClassError
+from classify.resolution import resolve
+from classify.watch import Watcher, functions, reload_modules
+
+
+CHILD = "hierarchy_views.Child"
+STANDALONE = "hierarchy_views.Standalone"
+
+
+def test_reload_modules_reloads_subclasses(hierarchy):
+    child = resolve(CHILD)
+    base_file = str(hierarchy / "hierarchy_base.py")
+    (hierarchy / "hierarchy_base.py").write_text(
+        "class Base:\n    def two(self):\n        pass\n"
+    )
+
+    reload_modules([child, resolve(STANDALONE)], {base_file})
+
+    reloaded = resolve(CHILD)
+    assert reloaded is not child
+    assert hasattr(reloaded, "two")
+
+
+def test_reload_modules_reloads_method_modules(hierarchy):
+    standalone = resolve(STANDALONE)
+    helpers_file = str(hierarchy / "hierarchy_helpers.py")
+    (hierarchy / "hierarchy_helpers.py").write_text(
+        "def helper(self):\n    return 'helped again'\n"
+    )
+
+    reload_modules([standalone], {helpers_file})
+
+    assert resolve(STANDALONE)().helper() == "helped again"
+
+
+def test_reload_modules_skips_unchanged_files(hierarchy):  # noqa: ARG001
+    child = resolve(CHILD)
+
+    reload_modules([child], {"/some/other/file.py"})
+
+    assert resolve(CHILD) is child
+
+
+def test_watcher_poll_without_changes(hierarchy):  # noqa: ARG001
+    watcher = Watcher([CHILD, STANDALONE])
+
+    assert watcher.poll() == []
+
+
+def test_watcher_poll_after_editing_a_base(hierarchy):
+    watcher = Watcher([CHILD, STANDALONE])
+
+    (hierarchy / "hierarchy_base.py").write_text(
+        "class Base:\n    def two(self):\n        pass\n"
+    )
+
+    assert watcher.poll() == [CHILD]
+    assert hasattr(resolve(CHILD), "two")
+
+    # the new version of the file is now the one being watched
+    assert watcher.poll() == []
+
+
+def test_watcher_poll_after_editing_a_method_module(hierarchy):
+    watcher = Watcher([CHILD, STANDALONE])
+    assert "'helped'" in classify(resolve(STANDALONE)).methods["helper"][0].code
+
+    (hierarchy / "hierarchy_helpers.py").write_text(
+        "# moved down a line\ndef helper(self):\n    return 'helped again'\n"
+    )
+
+    assert watcher.poll() == [STANDALONE]
+    method = classify(resolve(STANDALONE)).methods["helper"][0]
+    assert method.code == "def helper(self):\n    return 'helped again'\n"
+
+
+def test_watcher_poll_with_a_broken_edit(hierarchy):
+    watcher = Watcher([CHILD])
+
+    (hierarchy / "hierarchy_base.py").write_text("class Base(:\n")
+    assert watcher.poll() == []
+
+    (hierarchy / "hierarchy_base.py").write_text(
+        "class Base:\n    def two(self):\n        pass\n"
+    )
+    assert watcher.poll() == [CHILD]
+
+
+def test_watcher_poll_when_a_class_is_replaced(hierarchy):
+    watcher = Watcher([CHILD, STANDALONE])
+
+    (hierarchy / "hierarchy_views.py").write_text(
+        "from hierarchy_base import Base\n\n\n"
+        "class Child(Base):\n    pass\n\n\n"
+        "Standalone = 1\n"
+    )
+    assert watcher.poll() == [CHILD, STANDALONE]
+
+    with pytest.raises(NotAClassError):
+        resolve(STANDALONE)
+
+    # the files are still watched, for the class coming back
+    (hierarchy / "hierarchy_views.py").write_text("class Standalone:\n    pass\n")
+    assert watcher.poll() == [CHILD, STANDALONE]
+    assert resolve(STANDALONE)
+
+
+def test_watcher_add_is_idempotent(hierarchy):  # noqa: ARG001
+    watcher = Watcher([CHILD])
+    watcher.add(CHILD)
+
+    assert watcher.poll() == []
+
+
+def test_functions():
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args):  # pragma: no cover
+            return func(*args)
+
+        return wrapper
+
+    class Example:
+        attribute = 1
+
+        def method(self):  # pragma: no cover
+            pass
+
+        @classmethod
+        def class_method(cls):  # pragma: no cover
+            pass
+
+        @staticmethod
+        def static_method():  # pragma: no cover
+            pass
+
+        @property
+        def prop(self):  # pragma: no cover
+            pass
+
+        @decorator
+        def decorated(self):  # pragma: no cover
+            pass
+
+    names = sorted(func.__name__ for func in functions(Example))
+
+    assert names == ["class_method", "decorated", "method", "prop", "static_method"]